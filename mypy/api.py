@@ -17,6 +17,10 @@ the exit status mypy normally returns to the operating system.
 
 Any pretty formatting is left to the caller.
 
+With the --stats flag, <normal_report> ends with a table of the time and
+memory used by each phase of the build (discovery, parsing, semantic
+analysis, type checking and so on).
+
 The 'run_dmypy' function is similar, but instead mimics invocation of
 dmypy.
 
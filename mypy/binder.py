@@ -33,6 +33,9 @@ class Frame:
     def __init__(self) -> None:
         self.types = {}  # type: Dict[Key, Type]
         self.unreachable = False
+        # Undo log: the type of each key in self.types as of when it was first
+        # assigned in this frame (None if unknown), restored when the frame is popped.
+        self.saved = {}  # type: Dict[Key, Optional[Type]]
 
 
 if MYPY:
@@ -74,6 +77,11 @@ class ConditionalTypeBinder:
         # on top of the stack.
         self.frames = [Frame()]
 
+        # The current type of each key, i.e. its type in the top-most
+        # frame that has the key. Frames record the previous types of the
+        # keys they change, so that lookups don't have to search the stack.
+        self.current = {}  # type: Dict[Key, Type]
+
         # For frames higher in the stack, we record the set of
         # Frames that can escape there, either by falling off
         # the end of the frame or by a loop control construct
@@ -110,16 +118,15 @@ class ConditionalTypeBinder:
         self.options_on_return.append([])
         return f
 
-    def _put(self, key: Key, type: Type, index: int = -1) -> None:
-        self.frames[index].types[key] = type
+    def _put(self, key: Key, type: Type) -> None:
+        frame = self.frames[-1]
+        if key not in frame.types:
+            frame.saved[key] = self.current.get(key)
+        frame.types[key] = type
+        self.current[key] = type
 
-    def _get(self, key: Key, index: int = -1) -> Optional[Type]:
-        if index < 0:
-            index += len(self.frames)
-        for i in range(index, -1, -1):
-            if key in self.frames[i].types:
-                return self.frames[i].types[key]
-        return None
+    def _get(self, key: Key) -> Optional[Type]:
+        return self.current.get(key)
 
     def put(self, expr: Expression, typ: Type) -> None:
         if not isinstance(expr, (IndexExpr, MemberExpr, NameExpr)):
@@ -154,9 +161,13 @@ class ConditionalTypeBinder:
 
     def _cleanse_key(self, key: Key) -> None:
         """Remove all references to a key from the binder."""
+        if key not in self.current:
+            return
+        del self.current[key]
         for frame in self.frames:
             if key in frame.types:
                 del frame.types[key]
+                del frame.saved[key]
 
     def update_from_options(self, frames: List[Frame]) -> bool:
         """Update the frame to reflect that each key will be updated
@@ -168,16 +179,29 @@ class ConditionalTypeBinder:
 
         frames = [f for f in frames if not f.unreachable]
         changed = False
-        keys = set(key for f in frames for key in f.types)
+        # The types in the current frame are the current types, so only the
+        # keys changed in the other frames can change.
+        keys = set(key for f in frames if f is not self.frames[-1] for key in f.types)
 
         for key in keys:
             current_value = self._get(key)
-            resulting_values = [f.types.get(key, current_value) for f in frames]
+            resulting_values = []  # type: List[Optional[Type]]
+            seen = set()  # type: Set[int]
+            for f in frames:
+                value = f.types.get(key, current_value)
+                # The same type object often appears in many frames (for example,
+                # in the frames recorded after each assignment in a try statement).
+                # Joining a type with itself has no effect, so skip duplicates.
+                if id(value) not in seen:
+                    seen.add(id(value))
+                    resulting_values.append(value)
             if any(x is None for x in resulting_values):
                 # We didn't know anything about key before
                 # (current_value must be None), and we still don't
                 # know anything about key in at least one possible frame.
                 continue
+            if len(resulting_values) == 1 and resulting_values[0] is current_value:
+                continue
 
             type = resulting_values[0]
             assert type is not None
@@ -209,6 +233,11 @@ class ConditionalTypeBinder:
 
         result = self.frames.pop()
         options = self.options_on_return.pop()
+        for key, type in result.saved.items():
+            if type is None:
+                del self.current[key]
+            else:
+                self.current[key] = type
 
         if can_skip:
             options.insert(0, self.frames[-1])
@@ -37,17 +37,24 @@ from mypy.semanal_pass3 import SemanticAnalyzerPass3
 from mypy.checker import TypeChecker
 from mypy.indirection import TypeIndirectionVisitor
 from mypy.errors import Errors, CompileError, report_internal_error
+from mypy.fastparse import type_comment_cache
 from mypy.util import DecodeError, decode_python_encoding, is_sub_path
 if MYPY:
     from mypy.report import Reports  # Avoid unconditional slow import
 from mypy import moduleinfo
 from mypy.fixup import fixup_module
+from mypy.lookup import FullnameIndex
+from mypy.scope import SavedScope
 from mypy.modulefinder import BuildSource, compute_search_paths, FindModuleCache, SearchPaths
-from mypy.nodes import Expression
+from mypy.nodes import Expression, Node
 from mypy.options import Options
 from mypy.parse import parse
+from mypy.parallelparse import ParsePool
+from mypy.profiler import SamplingProfiler
 from mypy.stats import dump_type_stats
-from mypy.types import Type
+from mypy.stripbodies import strip_function_bodies
+from mypy.timing import PhaseTimer, format_phase_stats
+from mypy.types import Type, sharing_deserialized_instances
 from mypy.version import __version__
 from mypy.plugin import Plugin, ChainedPlugin, plugin_types
 from mypy.plugins.default import DefaultPlugin
@@ -106,11 +113,14 @@ class BuildSourceSet:
                 self.source_modules.add(source.module)
 
     def is_source(self, file: MypyFile) -> bool:
-        if file.path and file.path in self.source_paths:
+        return self.is_source_module(file._fullname, file.path)
+
+    def is_source_module(self, id: str, path: Optional[str]) -> bool:
+        if path and path in self.source_paths:
             return True
-        elif file._fullname in self.source_modules:
+        elif id in self.source_modules:
             return True
-        elif file.path is None and self.source_text_present:
+        elif path is None and self.source_text_present:
             return True
         else:
             return False
@@ -153,10 +163,13 @@ def build(sources: List[BuildSource],
 
     flush_errors = flush_errors or default_flush_errors
 
+    profile_output = options.profile_output
+    profiler = SamplingProfiler() if profile_output else None
+    if profiler is not None:
+        profiler.start()
     try:
         result = _build(sources, options, alt_lib_path, flush_errors, fscache)
         result.errors = messages
-        return result
     except CompileError as e:
         # CompileErrors raised from an errors object carry all of the
         # messages that have not been reported out by error streaming.
@@ -166,6 +179,17 @@ def build(sources: List[BuildSource],
         flush_errors(e.messages, serious)
         e.messages = messages
         raise
+    finally:
+        if profiler is not None:
+            profiler.stop()
+    if profiler is not None:
+        assert profile_output is not None
+        try:
+            profiler.write(profile_output)
+        except OSError as e:
+            flush_errors(['{}: error: Error writing profile output: {}'.format(
+                profile_output, e.strerror)], True)
+    return result
 
 
 def _build(sources: List[BuildSource],
@@ -186,10 +210,13 @@ def _build(sources: List[BuildSource],
     if options.report_dirs:
         # Import lazily to avoid slowing down startup.
         from mypy.report import Reports  # noqa
-        reports = Reports(data_dir, options.report_dirs)
+        reports = Reports(data_dir, options.report_dirs,
+                          workers=options.report_workers,
+                          validate=options.debug_reports)
 
     source_set = BuildSourceSet(sources)
-    errors = Errors(options.show_error_context, options.show_column_numbers)
+    errors = Errors(options.show_error_context, options.show_column_numbers,
+                    options.error_format)
     plugin, snapshot = load_plugins(options, errors)
 
     # Construct a build manager object to hold state during the build.
@@ -214,15 +241,20 @@ def _build(sources: List[BuildSource],
             TypeState.reset_all_subtype_caches()
         return BuildResult(manager, graph)
     finally:
-        manager.metastore.commit()
+        with manager.phase_timer.phase('cache_write'):
+            manager.metastore.commit()
+        if reports is not None:
+            # Finish the HTML or XML reports even if CompileError was raised.
+            with manager.phase_timer.phase('reports'):
+                reports.finish()
         manager.log("Build finished in %.3f seconds with %d modules, and %d errors" %
                     (time.time() - manager.start_time,
                      len(manager.modules),
                      manager.errors.num_messages()))
         manager.dump_stats()
-        if reports is not None:
-            # Finish the HTML or XML reports even if CompileError was raised.
-            reports.finish()
+        if options.dump_type_stats:
+            for line in format_phase_stats(manager.stats):
+                print(line)
 
 
 def default_data_dir() -> str:
@@ -253,6 +285,10 @@ CacheMeta = NamedTuple('CacheMeta',
                         ('interface_hash', str),  # hash representing the public interface
                         ('version_id', str),  # mypy version for cache invalidation
                         ('ignore_all', bool),  # if errors were ignored
+                        # groups of statistics in <id>.reports.json, used by reports
+                        ('report_stats', List[str]),
+                        # if function bodies were removed (see mypy.stripbodies)
+                        ('interface_only', bool),
                         ])
 # NOTE: dependencies + suppressed == all reachable imports;
 # suppressed contains those reachable imports that were prevented by
@@ -289,6 +325,8 @@ def cache_meta_from_dict(meta: Dict[str, Any],
         meta.get('interface_hash', ''),
         meta.get('version_id', sentinel),
         meta.get('ignore_all', True),
+        meta.get('report_stats', []),
+        meta.get('interface_only', False),
     )
 
 
@@ -502,8 +540,11 @@ class BuildManager(BuildManagerBase):
         self.modules = {}  # type: Dict[str, MypyFile]
         self.missing_modules = set()  # type: Set[str]
         self.plugin = plugin
+        # Find symbols in modules that have been loaded or analyzed by fullname
+        self.fullname_index = FullnameIndex(self.modules)
         self.semantic_analyzer = SemanticAnalyzerPass2(self.modules, self.missing_modules,
-                                                  self.errors, self.plugin)
+                                                  self.errors, self.plugin,
+                                                  self.fullname_index)
         self.semantic_analyzer_pass3 = SemanticAnalyzerPass3(self.modules, self.errors,
                                                              self.semantic_analyzer)
         self.all_types = {}  # type: Dict[Expression, Type]  # Enabled by export_types
@@ -511,11 +552,9 @@ class BuildManager(BuildManagerBase):
         self.stale_modules = set()  # type: Set[str]
         self.rechecked_modules = set()  # type: Set[str]
         self.flush_errors = flush_errors
-        has_reporters = reports is not None and reports.reporters
         self.cache_enabled = (options.incremental
                               and (not options.fine_grained_incremental
-                                   or options.use_fine_grained_cache)
-                              and not has_reporters)
+                                   or options.use_fine_grained_cache))
         self.fscache = fscache
         self.find_module_cache = FindModuleCache(self.search_paths, self.fscache, self.options)
         if options.sqlite_cache:
@@ -535,12 +574,27 @@ class BuildManager(BuildManagerBase):
         self.plugin = plugin
         self.plugins_snapshot = plugins_snapshot
         self.old_plugins_snapshot = read_plugins_snapshot(self)
+        # Parses files ahead of time in worker processes while loading the graph
+        self.parse_pool = None  # type: Optional[ParsePool]
+        # Hits and misses of the global type comment memo already added to stats
+        self.type_comment_cache_counts = (type_comment_cache.hits, type_comment_cache.misses)
+        # Time and memory use of build phases not yet added to stats
+        self.phase_timer = PhaseTimer()
 
     def dump_stats(self) -> None:
+        self.add_type_comment_cache_stats()
+        self.add_stats(**self.phase_timer.stats())
         self.log("Stats:")
         for key, value in self.stats_summary().items():
             self.log("{:24}{}".format(key + ":", value))
 
+    def add_type_comment_cache_stats(self) -> None:
+        """Add the use of the type comment memo since the previous call to stats."""
+        hits, misses = self.type_comment_cache_counts
+        self.add_stats(type_comment_cache_hits=type_comment_cache.hits - hits,
+                       type_comment_cache_misses=type_comment_cache.misses - misses)
+        self.type_comment_cache_counts = (type_comment_cache.hits, type_comment_cache.misses)
+
     def use_fine_grained_cache(self) -> bool:
         return self.cache_enabled and self.options.use_fine_grained_cache
 
@@ -676,7 +730,16 @@ class BuildManager(BuildManagerBase):
         """
         num_errs = self.errors.num_messages()
         t0 = time.time()
-        tree = parse(source, path, id, self.errors, options=self.options)
+        prefetched = self.parse_pool.result(path, source) if self.parse_pool else None
+        if prefetched is not None:
+            tree, error_infos = prefetched
+            self.errors.set_file(path, id)
+            for info in error_infos:
+                info.import_ctx = self.errors.import_context()
+                self.errors.add_error_info(info)
+            self.add_stats(files_parsed_in_workers=1)
+        else:
+            tree = parse(source, path, id, self.errors, options=self.options)
         tree._fullname = id
         self.add_stats(files_parsed=1,
                        modules_parsed=int(not tree.is_stub),
@@ -693,12 +756,35 @@ class BuildManager(BuildManagerBase):
     def report_file(self,
                     file: MypyFile,
                     type_map: Dict[Expression, Type],
-                    options: Options) -> None:
+                    options: Options) -> Optional[Dict[str, Any]]:
+        """Report a type checked file.
+
+        Return the statistics to store in the cache, so that the file can be
+        reported without checking it again (see report_cached_file).
+        """
         if self.reports is not None and self.source_set.is_source(file):
-            self.reports.file(file, type_map, options)
+            with self.phase_timer.phase('reports'):
+                file_stats = self.reports.file(file, type_map, options)
+                if self.cache_enabled:
+                    return file_stats.serialize(self.reports.stats_groups)
+        return None
+
+    def report_cached_file(self, state: 'State') -> None:
+        """Report a file with fresh cache data, using the cached statistics."""
+        if self.reports is not None and state.report_stats is not None:
+            assert state.path is not None
+            with self.phase_timer.phase('reports'):
+                self.reports.cached_file(state.id, state.path, state.report_stats,
+                                         state.options)
 
     def stats_summary(self) -> Mapping[str, object]:
-        return self.stats
+        stats = dict(self.stats)
+        lookups = stats.get('inferred_args_memo_hits', 0) + stats.get(
+            'inferred_args_memo_misses', 0)
+        if lookups:
+            stats['inferred_args_memo_hit_rate'] = round(
+                stats['inferred_args_memo_hits'] / lookups, 3)
+        return stats
 
 
 def write_protocol_deps_cache(proto_deps: Dict[str, Set[str]],
@@ -859,6 +945,13 @@ def get_cache_names(id: str, path: str, manager: BuildManager) -> Tuple[str, str
     return (prefix + '.meta.json', prefix + '.data.json', deps_json)
 
 
+def get_reports_cache_name(meta_json: str) -> str:
+    """Return the file name for the statistics used by reports, given the meta JSON name."""
+    if meta_json.endswith('.meta.json'):
+        meta_json = meta_json[:-len('.meta.json')]
+    return meta_json + '.reports.json'
+
+
 def get_protocol_deps_cache_name() -> Tuple[str, str]:
     """Return file names for fine grained protocol dependencies cache.
 
@@ -946,7 +1039,8 @@ def find_cache_meta(id: str, path: str, manager: BuildManager) -> Optional[Cache
 
 
 def validate_meta(meta: Optional[CacheMeta], id: str, path: Optional[str],
-                  ignore_all: bool, manager: BuildManager) -> Optional[CacheMeta]:
+                  ignore_all: bool, manager: BuildManager,
+                  interface_only: bool = False) -> Optional[CacheMeta]:
     '''Checks whether the cached AST of this module can be used.
 
     Returns:
@@ -967,6 +1061,11 @@ def validate_meta(meta: Optional[CacheMeta], id: str, path: Optional[str],
         manager.log('Metadata abandoned for {}: errors were previously ignored'.format(id))
         return None
 
+    if meta.interface_only and not interface_only:
+        manager.log('Metadata abandoned for {}: function bodies were previously skipped'
+                    .format(id))
+        return None
+
     bazel = manager.options.bazel
     assert path is not None, "Internal error: meta was provided without a path"
     # Check data_json; assume if its mtime matches it's good.
@@ -1050,6 +1149,8 @@ def validate_meta(meta: Optional[CacheMeta], id: str, path: Optional[str],
                 'interface_hash': meta.interface_hash,
                 'version_id': manager.version_id,
                 'ignore_all': meta.ignore_all,
+                'report_stats': meta.report_stats,
+                'interface_only': meta.interface_only,
             }
             if manager.options.debug_cache:
                 meta_str = json.dumps(meta_dict, indent=2, sort_keys=True)
@@ -1066,6 +1167,29 @@ def validate_meta(meta: Optional[CacheMeta], id: str, path: Optional[str],
     return meta
 
 
+def load_report_stats(id: str, path: str, meta: CacheMeta,
+                      manager: BuildManager) -> Optional[Dict[str, Any]]:
+    """Load the statistics used by reports for a module with fresh cache data.
+
+    Returns:
+      None, if the cache doesn't have all statistics needed by the reports,
+      and the module has to be type checked again. Otherwise the serialized
+      statistics (see mypy.report.FileStats).
+    """
+    assert manager.reports is not None
+    missing = manager.reports.stats_groups.difference(meta.report_stats)
+    if missing:
+        manager.log('Metadata abandoned for {}: report statistics are missing ({})'.format(
+            id, ', '.join(sorted(missing))))
+        return None
+    if not manager.reports.stats_groups:
+        return {}
+    meta_json, _, _ = get_cache_names(id, path, manager)
+    return _load_json_file(get_reports_cache_name(meta_json), manager,
+                           log_sucess='Report statistics {} '.format(id),
+                           log_error='Could not load report statistics for {}: '.format(id))
+
+
 def compute_hash(text: str) -> str:
     # We use md5 instead of the builtin hash(...) function because the output of hash(...)
     # can differ between runs due to hash randomization (enabled by default in Python 3.3).
@@ -1080,12 +1204,43 @@ def json_dumps(obj: Any, debug_cache: bool) -> str:
         return json.dumps(obj, sort_keys=True)
 
 
+def interface_only_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Leave the definitions of private module-level variables out of serialized data.
+
+    This makes the cache files of large generated modules faster to load
+    into dependents. Only the names of the variables are kept, and they are
+    deserialized as variables without a type (see MypyFile.deserialize), so
+    that names imported from the module still resolve in dependents.
+    Classes, functions and type aliases are kept even if they are private,
+    since public names may refer to them.
+    """
+    names = {}  # type: Dict[str, Any]
+    private_vars = {}  # type: Dict[str, bool]
+    for name, value in data['names'].items():
+        if name != '.class' and is_private_var(name, value):
+            private_vars[name] = value.get('module_public', True)
+        else:
+            names[name] = value
+    return dict(data, names=names, private_vars=private_vars)
+
+
+def is_private_var(name: str, value: Dict[str, Any]) -> bool:
+    """Is a serialized module-level name a private variable with no other flags?"""
+    if not (name.startswith('_') and not (name.startswith('__') and name.endswith('__'))):
+        return False
+    if value['kind'] != 'Gdef' or set(value) - {'.class', 'kind', 'node', 'module_public'}:
+        return False
+    return value['node']['.class'] == 'Var'
+
+
 def write_cache(id: str, path: str, tree: MypyFile,
                 serialized_fine_grained_deps: Dict[str, List[str]],
                 dependencies: List[str], suppressed: List[str],
                 child_modules: List[str], dep_prios: List[int], dep_lines: List[int],
                 old_interface_hash: str, source_hash: str,
-                ignore_all: bool, manager: BuildManager) -> Tuple[str, Optional[CacheMeta]]:
+                ignore_all: bool, interface_only: bool,
+                report_stats: Optional[Dict[str, Any]],
+                manager: BuildManager) -> Tuple[str, Optional[CacheMeta]]:
     """Write cache files for a module.
 
     Note that this mypy's behavior is still correct when any given
@@ -1104,6 +1259,8 @@ def write_cache(id: str, path: str, tree: MypyFile,
       old_interface_hash: the hash from the previous version of the data cache file
       source_hash: the hash of the source code
       ignore_all: the ignore_all flag for this module
+      interface_only: the interface_only flag for this module
+      report_stats: the serialized statistics used by reports, if any
       manager: the build manager (for pyversion, log/trace)
 
     Returns:
@@ -1127,9 +1284,18 @@ def write_cache(id: str, path: str, tree: MypyFile,
         tree.path = path
 
     # Serialize data and analyze interface
+    options = manager.options.clone_for_module(id)
     data = tree.serialize()
     data_str = json_dumps(data, manager.options.debug_cache)
     interface_hash = compute_hash(data_str)
+    if options.cache_interface_only and not options.cache_fine_grained:
+        # The hash still covers the full data, so that dependents are invalidated
+        # as before. It differs from the hash of the full data file so that the
+        # data file is rewritten if the option is toggled.
+        data = interface_only_data(data)
+        data_str = json_dumps(data, manager.options.debug_cache)
+        interface_hash = compute_hash(interface_hash + ' interface-only')
+        manager.add_stats(interface_only_modules=1)
 
     # Obtain and set up metadata
     try:
@@ -1178,9 +1344,16 @@ def write_cache(id: str, path: str, tree: MypyFile,
             return interface_hash, None
         deps_mtime = manager.getmtime(deps_json)
 
+    report_groups = []  # type: List[str]
+    if report_stats:
+        reports_json = get_reports_cache_name(meta_json)
+        if metastore.write(reports_json, json_dumps(report_stats, manager.options.debug_cache)):
+            report_groups = sorted(report_stats)
+        else:
+            manager.log("Error writing reports JSON file {}".format(reports_json))
+
     mtime = 0 if bazel else int(st.st_mtime)
     size = st.st_size
-    options = manager.options.clone_for_module(id)
     assert source_hash is not None
     meta = {'id': id,
             'path': path,
@@ -1198,6 +1371,8 @@ def write_cache(id: str, path: str, tree: MypyFile,
             'interface_hash': interface_hash,
             'version_id': manager.version_id,
             'ignore_all': ignore_all,
+            'report_stats': report_groups,
+            'interface_only': interface_only,
             }
 
     # Write meta cache file
@@ -1219,7 +1394,8 @@ def delete_cache(id: str, path: str, manager: BuildManager) -> None:
     see #4043 for an example.
     """
     path = manager.normpath(path)
-    cache_paths = get_cache_names(id, path, manager)
+    meta_json, data_json, deps_json = get_cache_names(id, path, manager)
+    cache_paths = [meta_json, data_json, deps_json, get_reports_cache_name(meta_json)]
     manager.log('Deleting {} {} {}'.format(id, path, " ".join(x for x in cache_paths if x)))
 
     for filename in cache_paths:
@@ -1425,11 +1601,20 @@ class State:
     # Whether to ignore all errors
     ignore_all = False
 
+    # Whether to remove function bodies that don't affect the interface
+    interface_only = False
+
     # Whether the module has an error or any of its dependencies have one.
     transitive_error = False
 
     fine_grained_deps = None  # type: Dict[str, Set[str]]
 
+    # Serialized statistics used by reports, if the module is reported
+    report_stats = None  # type: Optional[Dict[str, Any]]
+
+    # Nodes recorded by semantic analysis pass 2 for pass 3, if using a worklist
+    pass3_worklist = None  # type: Optional[List[Tuple[Node, SavedScope]]]
+
     # Type checker used for checking this file.  Use type_checker() for
     # access and to construct this on demand.
     _type_checker = None  # type: Optional[TypeChecker]
@@ -1476,19 +1661,29 @@ class State:
                 raise
             if follow_imports == 'silent':
                 self.ignore_all = True
+                self.interface_only = self.options.follow_imports_interface_only
         self.path = path
         self.xpath = path or '<string>'
         if path and source is None and self.manager.fscache.isdir(path):
             source = ''
         self.source = source
         if path and source is None and self.manager.cache_enabled:
-            self.meta = find_cache_meta(self.id, path, manager)
+            with manager.phase_timer.phase('cache_validation'):
+                self.meta = find_cache_meta(self.id, path, manager)
             # TODO: Get mtime if not cached.
             if self.meta is not None:
                 self.interface_hash = self.meta.interface_hash
                 self.meta_source_hash = self.meta.hash
         self.add_ancestors()
-        self.meta = validate_meta(self.meta, self.id, self.path, self.ignore_all, manager)
+        with manager.phase_timer.phase('cache_validation'):
+            self.meta = validate_meta(self.meta, self.id, self.path, self.ignore_all, manager,
+                                      self.interface_only)
+            if (self.meta and manager.reports is not None and not temporary
+                    and manager.source_set.is_source_module(self.id, self.path)):
+                assert self.path is not None
+                self.report_stats = load_report_stats(self.id, self.path, self.meta, manager)
+                if self.report_stats is None:
+                    self.meta = None
         if self.meta:
             # Make copies, since we may modify these and want to
             # compare them to the originals later.
@@ -1606,19 +1801,22 @@ class State:
     def load_tree(self, temporary: bool = False) -> None:
         assert self.meta is not None, "Internal error: this method must be called only" \
                                       " for cached modules"
-        data = json.loads(self.manager.metastore.read(self.meta.data_json))
-        # TODO: Assert data file wasn't changed.
-        self.tree = MypyFile.deserialize(data)
+        with self.manager.phase_timer.phase('cache_loading'):
+            data = json.loads(self.manager.metastore.read(self.meta.data_json))
+            # TODO: Assert data file wasn't changed.
+            self.tree = MypyFile.deserialize(data)
         if not temporary:
             self.manager.modules[self.id] = self.tree
+            self.manager.fullname_index.add_module(self.tree)
             self.manager.add_stats(fresh_trees=1)
 
     def fix_cross_refs(self) -> None:
         assert self.tree is not None, "Internal error: method must be called on parsed file only"
         # We need to set quick_and_dirty when doing a fine grained
         # cache load because we need to gracefully handle missing modules.
-        fixup_module(self.tree, self.manager.modules,
-                     self.options.use_fine_grained_cache)
+        with self.manager.phase_timer.phase('cache_loading'):
+            fixup_module(self.tree, self.manager.modules,
+                         self.options.use_fine_grained_cache, self.manager.fullname_index)
 
     def patch_dependency_parents(self) -> None:
         """
@@ -1691,7 +1889,7 @@ class State:
         modules = manager.modules
         manager.log("Parsing %s (%s)" % (self.xpath, self.id))
 
-        with self.wrap_context():
+        with self.wrap_context(), manager.phase_timer.phase('parse'):
             source = self.source
             self.source = None  # We won't need it again.
             if self.path and source is None:
@@ -1718,6 +1916,8 @@ class State:
                 self.source_hash = compute_hash(source)
             self.tree = manager.parse_file(self.id, self.xpath, source,
                                            self.ignore_all or self.options.ignore_errors)
+            if self.interface_only:
+                manager.add_stats(function_bodies_skipped=strip_function_bodies(self.tree))
 
         modules[self.id] = self.tree
 
@@ -1726,7 +1926,7 @@ class State:
         # this before processing imports, since this may mark some
         # import statements as unreachable.
         first = SemanticAnalyzerPass1(manager.semantic_analyzer)
-        with self.wrap_context():
+        with self.wrap_context(), manager.phase_timer.phase('semanal_pass1'):
             first.visit_file(self.tree, self.xpath, self.id, self.options)
 
         # Initialize module symbol table, which was populated by the
@@ -1776,9 +1976,10 @@ class State:
         assert self.tree is not None, "Internal error: method must be called on parsed file only"
         patches = []  # type: List[Tuple[int, Callable[[], None]]]
         self.manager.semantic_analyzer.imports.clear()
-        with self.wrap_context():
+        with self.wrap_context(), self.manager.phase_timer.phase('semanal_pass2'):
             self.manager.semantic_analyzer.visit_file(self.tree, self.xpath, self.options, patches)
         self.patches = patches
+        self.pass3_worklist = self.manager.semantic_analyzer.pass3_worklist
         for dep in self.manager.semantic_analyzer.imports:
             self.dependencies.append(dep)
             self.priorities[dep] = PRI_LOW
@@ -1786,28 +1987,43 @@ class State:
     def semantic_analysis_pass_three(self) -> None:
         assert self.tree is not None, "Internal error: method must be called on parsed file only"
         patches = []  # type: List[Tuple[int, Callable[[], None]]]
-        with self.wrap_context():
+        with self.wrap_context(), self.manager.phase_timer.phase('semanal_pass3'):
             self.manager.semantic_analyzer_pass3.visit_file(self.tree, self.xpath,
-                                                            self.options, patches)
+                                                            self.options, patches,
+                                                            self.pass3_worklist)
+            self.pass3_worklist = None
             if self.options.dump_type_stats:
                 dump_type_stats(self.tree, self.xpath)
         self.patches = patches + self.patches
 
     def semantic_analysis_apply_patches(self) -> None:
+        assert self.tree is not None, "Internal error: method must be called on parsed file only"
         apply_semantic_analyzer_patches(self.patches)
+        # The symbol tables are complete now.
+        self.manager.fullname_index.add_module(self.tree)
 
     def type_check_first_pass(self) -> None:
         if self.options.semantic_analysis_only:
             return
-        with self.wrap_context():
+        with self.wrap_context(), self.manager.phase_timer.phase('type_check'):
             self.type_checker().check_first_pass()
 
     def type_checker(self) -> TypeChecker:
         if not self._type_checker:
             assert self.tree is not None, "Internal error: must be called on parsed file only"
             manager = self.manager
+            timer = manager.reports.target_timer if manager.reports is not None else None
+            # Types inferred in function bodies are only needed for errors, reports
+            # and fine-grained dependencies.
+            skip_function_bodies = (self.options.skip_ignored_function_bodies
+                                    and (self.ignore_all or self.options.ignore_errors)
+                                    and manager.reports is None
+                                    and not self.options.export_types
+                                    and not self.options.cache_fine_grained
+                                    and not self.options.fine_grained_incremental)
             self._type_checker = TypeChecker(manager.errors, manager.modules, self.options,
-                                             self.tree, self.xpath, manager.plugin)
+                                             self.tree, self.xpath, manager.plugin, timer,
+                                             manager.fullname_index, skip_function_bodies)
         return self._type_checker
 
     def type_map(self) -> Dict[Expression, Type]:
@@ -1816,7 +2032,7 @@ class State:
     def type_check_second_pass(self) -> bool:
         if self.options.semantic_analysis_only:
             return False
-        with self.wrap_context():
+        with self.wrap_context(), self.manager.phase_timer.phase('type_check'):
             return self.type_checker().check_second_pass()
 
     def finish_passes(self) -> None:
@@ -1824,7 +2040,7 @@ class State:
         manager = self.manager
         if self.options.semantic_analysis_only:
             return
-        with self.wrap_context():
+        with self.wrap_context(), manager.phase_timer.phase('type_check'):
             # Some tests (and tools) want to look at the set of all types.
             options = manager.options
             if options.export_types:
@@ -1837,7 +2053,14 @@ class State:
             if self.options.dump_inference_stats:
                 dump_type_stats(self.tree, self.xpath, inferred=True,
                                 typemap=self.type_map())
-            manager.report_file(self.tree, self.type_map(), self.options)
+            self.report_stats = manager.report_file(self.tree, self.type_map(), self.options)
+
+            expr_checker = self.type_checker().expr_checker
+            manager.add_stats(inferred_args_memo_hits=expr_checker.inferred_args_memo_hits,
+                              inferred_args_memo_misses=expr_checker.inferred_args_memo_misses,
+                              unchecked_function_bodies=self.type_checker().num_skipped_bodies)
+            expr_checker.reset()
+            self.type_checker().num_skipped_bodies = 0
 
     def _patch_indirect_dependencies(self,
                                      module_refs: Set[str],
@@ -1899,12 +2122,13 @@ class State:
         dep_prios = self.dependency_priorities()
         dep_lines = self.dependency_lines()
         assert self.source_hash is not None
-        new_interface_hash, self.meta = write_cache(
-            self.id, self.path, self.tree,
-            {k: list(v) for k, v in self.fine_grained_deps.items()},
-            list(self.dependencies), list(self.suppressed), list(self.child_modules),
-            dep_prios, dep_lines, self.interface_hash, self.source_hash, self.ignore_all,
-            self.manager)
+        with self.manager.phase_timer.phase('cache_write'):
+            new_interface_hash, self.meta = write_cache(
+                self.id, self.path, self.tree,
+                {k: list(v) for k, v in self.fine_grained_deps.items()},
+                list(self.dependencies), list(self.suppressed), list(self.child_modules),
+                dep_prios, dep_lines, self.interface_hash, self.source_hash, self.ignore_all,
+                self.interface_only, self.report_stats, self.manager)
         if new_interface_hash == self.interface_hash:
             self.manager.log("Cached module {} has same interface".format(self.id))
         else:
@@ -2335,7 +2559,24 @@ def load_graph(sources: List[BuildSource], manager: BuildManager,
     As this may need to parse files, this can raise CompileError in case
     there are syntax errors.
     """
+    with manager.phase_timer.phase('discovery'):
+        if manager.options.parse_workers <= 0 or manager.parse_pool is not None:
+            return _load_graph(sources, manager, old_graph, new_modules)
+        try:
+            manager.parse_pool = ParsePool(manager.options.parse_workers)
+        except (ImportError, NotImplementedError, OSError) as err:
+            manager.log("Parsing sequentially, as worker processes are unavailable: %s" % err)
+            return _load_graph(sources, manager, old_graph, new_modules)
+        try:
+            return _load_graph(sources, manager, old_graph, new_modules)
+        finally:
+            manager.parse_pool.shutdown()
+            manager.parse_pool = None
 
+
+def _load_graph(sources: List[BuildSource], manager: BuildManager,
+                old_graph: Optional[Graph] = None,
+                new_modules: Optional[List[State]] = None) -> Graph:
     graph = old_graph if old_graph is not None else {}  # type: Graph
 
     # The deque is used to implement breadth-first traversal.
@@ -2343,6 +2584,10 @@ def load_graph(sources: List[BuildSource], manager: BuildManager,
     # affect the order in which we process files within import cycles.
     new = new_modules if new_modules is not None else []
     entry_points = set()  # type: Set[str]
+    if manager.parse_pool:
+        for bs in sources:
+            if bs.path and bs.text is None:
+                prefetch_parse(bs.module or '__main__', bs.path, manager)
     # Seed the graph with the initial root sources.
     for bs in sources:
         try:
@@ -2359,7 +2604,14 @@ def load_graph(sources: List[BuildSource], manager: BuildManager,
         entry_points.add(bs.module)
     # Collect dependencies.  We go breadth-first.
     # More nodes might get added to new as we go, but that's fine.
+    # When parsing in worker processes, the frontier is the modules imported
+    # by the nodes that were added but haven't been processed yet.
+    frontier_start = 0
     for st in new:
+        if manager.parse_pool:
+            for frontier_st in new[frontier_start:]:
+                prefetch_dependencies(frontier_st, graph, manager)
+            frontier_start = len(new)
         assert st.ancestors is not None
         # Strip out indirect dependencies.  These will be dealt with
         # when they show up as direct dependencies, and there's a
@@ -2417,6 +2669,43 @@ def load_graph(sources: List[BuildSource], manager: BuildManager,
     return graph
 
 
+def prefetch_dependencies(st: State, graph: Graph, manager: BuildManager) -> None:
+    """Start parsing the modules that will be added to the graph for a node."""
+    if manager.options.follow_imports == 'skip':
+        return
+    assert st.ancestors is not None
+    for dep in st.ancestors + st.dependencies:
+        if dep not in graph and st.priorities.get(dep) != PRI_INDIRECT:
+            path = find_module_simple(dep, manager)
+            if path:
+                prefetch_parse(dep, path, manager)
+
+
+def prefetch_parse(id: str, path: str, manager: BuildManager) -> None:
+    """Start parsing a module in a worker process, unless it will likely use the cache.
+
+    If this fails, State.parse_file() will report the problem later.
+    """
+    assert manager.parse_pool is not None
+    if manager.fscache.isdir(path):
+        return
+    if manager.cache_enabled:
+        meta_json, _, _ = get_cache_names(id, path, manager)
+        try:
+            manager.metastore.getmtime(meta_json)
+        except IOError:
+            pass
+        else:
+            return
+    try:
+        source = decode_python_encoding(
+            manager.fscache.read(manager.maybe_swap_for_shadow_path(path)),
+            manager.options.python_version)
+    except (IOError, UnicodeDecodeError, DecodeError):
+        return
+    manager.parse_pool.prefetch(path, id, source, manager.options)
+
+
 def process_graph(graph: Graph, manager: BuildManager) -> None:
     """Process everything in dependency order."""
     sccs = sorted_components(graph)
@@ -2516,6 +2805,9 @@ def process_graph(graph: Graph, manager: BuildManager) -> None:
         if fresh:
             manager.trace("Queuing %s SCC (%s)" % (fresh_msg, scc_str))
             fresh_scc_queue.append(scc)
+            # Fresh modules are reported without loading their trees.
+            for id in scc:
+                manager.report_cached_file(graph[id])
         else:
             if len(fresh_scc_queue) > 0:
                 manager.log("Processing {} queued fresh SCCs".format(len(fresh_scc_queue)))
@@ -2620,8 +2912,9 @@ def process_fresh_modules(graph: Graph, modules: List[str], manager: BuildManage
     This involves loading the tree from JSON and then doing various cleanups.
     """
     t0 = time.time()
-    for id in modules:
-        graph[id].load_tree()
+    with sharing_deserialized_instances():
+        for id in modules:
+            graph[id].load_tree()
     t1 = time.time()
     for id in modules:
         graph[id].fix_cross_refs()
@@ -6,10 +6,10 @@ from contextlib import contextmanager
 
 from typing import (
     Dict, Set, List, cast, Tuple, TypeVar, Union, Optional, NamedTuple, Iterator, Iterable,
-    Sequence
+    Sequence, ContextManager
 )
 
-from mypy.errors import Errors, report_internal_error
+from mypy.errors import Errors, LazyMessage, report_internal_error
 from mypy.nodes import (
     SymbolTable, Statement, MypyFile, Var, Expression, Lvalue, Node,
     OverloadedFuncDef, FuncDef, FuncItem, FuncBase, TypeInfo,
@@ -32,7 +32,7 @@ from mypy.types import (
     Instance, NoneTyp, strip_type, TypeType, TypeOfAny,
     UnionType, TypeVarId, TypeVarType, PartialType, DeletedType, UninhabitedType, TypeVarDef,
     true_only, false_only, function_type, is_named_instance, union_items, TypeQuery, LiteralType,
-    is_optional, remove_optional
+    is_optional, remove_optional, interned_any_type, interned_instance
 )
 from mypy.sametypes import is_same_type
 from mypy.messages import MessageBuilder, make_inferred_type_note
@@ -64,6 +64,9 @@ from mypy.plugin import Plugin, CheckerPluginInterface
 from mypy.sharedparse import BINARY_MAGIC_METHODS
 from mypy.scope import Scope
 from mypy import state
+from mypy.timing import TargetTimer
+from mypy.lookup import FullnameIndex
+from mypy.stripbodies import body_affects_interface
 
 MYPY = False
 if MYPY:
@@ -199,13 +202,21 @@ class TypeChecker(NodeVisitor[None], CheckerPluginInterface):
     plugin = None  # type: Plugin
 
     def __init__(self, errors: Errors, modules: Dict[str, MypyFile], options: Options,
-                 tree: MypyFile, path: str, plugin: Plugin) -> None:
+                 tree: MypyFile, path: str, plugin: Plugin,
+                 timer: Optional[TargetTimer] = None,
+                 fullname_index: Optional[FullnameIndex] = None,
+                 skip_function_bodies: bool = False) -> None:
         """Construct a type checker.
 
-        Use errors to report type check errors.
+        Use errors to report type check errors. If timer is given, record the
+        time spent checking each top-level target in it. If fullname_index is
+        given, use it to find symbols by fully qualified name. If
+        skip_function_bodies is True, all errors in the file are ignored, so
+        don't check function bodies that can't affect anything outside them.
         """
         self.errors = errors
         self.modules = modules
+        self.fullname_index = fullname_index
         self.options = options
         self.tree = tree
         self.path = path
@@ -243,6 +254,10 @@ class TypeChecker(NodeVisitor[None], CheckerPluginInterface):
         # NOTE: we use the context manager to avoid "threading" an additional `is_final_def`
         # argument through various `checker` and `checkmember` functions.
         self._is_final_def = False
+        self.timer = timer
+        self.skip_function_bodies = skip_function_bodies
+        # Number of function bodies not checked because of skip_function_bodies
+        self.num_skipped_bodies = 0
 
     def reset(self) -> None:
         """Cleanup stale state that might be left over from a typechecking run.
@@ -255,6 +270,7 @@ class TypeChecker(NodeVisitor[None], CheckerPluginInterface):
         self.module_refs.clear()
         self.binder = ConditionalTypeBinder()
         self.type_map.clear()
+        self.expr_checker.reset()
 
         assert self.inferred_attribute_types is None
         assert self.partial_types == []
@@ -279,7 +295,8 @@ class TypeChecker(NodeVisitor[None], CheckerPluginInterface):
             with self.enter_partial_types():
                 with self.binder.top_frame_context():
                     for d in self.tree.defs:
-                        self.accept(d)
+                        with self.timed(d):
+                            self.accept(d)
 
             assert not self.current_node_deferred
 
@@ -329,10 +346,32 @@ class TypeChecker(NodeVisitor[None], CheckerPluginInterface):
                 done.add(node)
                 with self.tscope.class_scope(active_typeinfo) if active_typeinfo else nothing():
                     with self.scope.push_class(active_typeinfo) if active_typeinfo else nothing():
-                        self.check_partial(node)
+                        with self.timed(node, active_typeinfo):
+                            self.check_partial(node)
             self.tscope.leave()
             return True
 
+    def timed(self, node: Union[Statement, DeferredNodeType, FineGrainedDeferredNodeType],
+              info: Optional[TypeInfo] = None) -> ContextManager[None]:
+        """Record the time spent checking a node, if timing is enabled.
+
+        The time is attributed to the top-level target that contains the node. If
+        info is given, the node is a method of that class.
+        """
+        if self.timer is None:
+            return nothing()
+        module = self.tree.fullname()
+        if info is not None:
+            # Attribute methods, including those of nested classes, to the top-level class.
+            name = info.fullname()[len(module) + 1:].split('.')[0]
+        elif isinstance(node, (FuncBase, Decorator)):
+            name = node.name()
+        elif isinstance(node, ClassDef):
+            name = node.name
+        else:
+            return self.timer.target(module, module)
+        return self.timer.target(module, module + '.' + name)
+
     def check_partial(self, node: Union[DeferredNodeType, FineGrainedDeferredNodeType]) -> None:
         if isinstance(node, MypyFile):
             self.check_top_level(node)
@@ -759,6 +798,10 @@ class TypeChecker(NodeVisitor[None], CheckerPluginInterface):
 
         If type_override is provided, use it as the function type.
         """
+        if (self.skip_function_bodies and isinstance(defn, FuncDef)
+                and not body_affects_interface(defn)):
+            self.num_skipped_bodies += 1
+            return
         self.dynamic_funcs.append(defn.is_dynamic() and not type_override)
 
         with self.enter_partial_types(is_function=True):
@@ -3446,19 +3489,22 @@ class TypeChecker(NodeVisitor[None], CheckerPluginInterface):
         else:
             if self.should_suppress_optional_error([subtype]):
                 return False
-            extra_info = []  # type: List[str]
-            note_msg = ''
+            message = msg  # type: LazyMessage
+            note_msg = ''  # type: LazyMessage
             if subtype_label is not None or supertype_label is not None:
-                subtype_str, supertype_str = self.msg.format_distinctly(subtype, supertype)
-                if subtype_label is not None:
-                    extra_info.append(subtype_label + ' ' + subtype_str)
-                if supertype_label is not None:
-                    extra_info.append(supertype_label + ' ' + supertype_str)
-                note_msg = make_inferred_type_note(context, subtype,
-                                                   supertype, supertype_str)
-            if extra_info:
-                msg += ' (' + ', '.join(extra_info) + ')'
-            self.fail(msg, context)
+                def format_message() -> str:
+                    subtype_str, supertype_str = self.msg.format_distinctly(subtype, supertype)
+                    extra_info = []  # type: List[str]
+                    if subtype_label is not None:
+                        extra_info.append(subtype_label + ' ' + subtype_str)
+                    if supertype_label is not None:
+                        extra_info.append(supertype_label + ' ' + supertype_str)
+                    return msg + ' (' + ', '.join(extra_info) + ')'
+                message = format_message
+                note_msg = make_inferred_type_note(
+                    context, subtype, supertype,
+                    lambda: self.msg.format_distinctly(subtype, supertype)[1])
+            self.fail(message, context)
             if note_msg:
                 self.note(note_msg, context)
             if (isinstance(supertype, Instance) and supertype.type.is_protocol and
@@ -3499,8 +3545,8 @@ class TypeChecker(NodeVisitor[None], CheckerPluginInterface):
             assert isinstance(node.target, Instance)
             node = node.target.type
         assert isinstance(node, TypeInfo)
-        any_type = AnyType(TypeOfAny.from_omitted_generics)
-        return Instance(node, [any_type] * len(node.defn.type_vars))
+        any_type = interned_any_type(TypeOfAny.from_omitted_generics)
+        return interned_instance(node, [any_type] * len(node.defn.type_vars))
 
     def named_generic_type(self, name: str, args: List[Type]) -> Instance:
         """Return an instance with the given name and type arguments.
@@ -3561,6 +3607,10 @@ class TypeChecker(NodeVisitor[None], CheckerPluginInterface):
         if '.' not in name:
             return self.lookup(name, GDEF)  # FIX kind
         else:
+            if self.fullname_index is not None:
+                sym = self.fullname_index.lookup(name, module_level=True)
+                if sym is not None:
+                    return sym
             parts = name.split('.')
             n = self.modules[parts[0]]
             for i in range(1, len(parts) - 1):
@@ -3707,7 +3757,7 @@ class TypeChecker(NodeVisitor[None], CheckerPluginInterface):
             temp.set_line(context.get_line())
         return temp
 
-    def fail(self, msg: str, context: Context) -> None:
+    def fail(self, msg: LazyMessage, context: Context) -> None:
         """Produce an error message."""
         self.msg.fail(msg, context)
 
@@ -3715,7 +3765,7 @@ class TypeChecker(NodeVisitor[None], CheckerPluginInterface):
         """Produce a warning message."""
         self.msg.warn(msg, context)
 
-    def note(self, msg: str, context: Context, offset: int = 0) -> None:
+    def note(self, msg: LazyMessage, context: Context, offset: int = 0) -> None:
         """Produce a note."""
         self.msg.note(msg, context, offset=offset)
 
@@ -59,17 +59,20 @@ from mypy.typevars import fill_typevars
 from mypy.visitor import ExpressionVisitor
 from mypy.plugin import Plugin, MethodContext, MethodSigContext, FunctionContext
 from mypy.typeanal import make_optional_type
+from mypy import timing
 
 # Type of callback user for checking individual function arguments. See
 # check_args() below for details.
 ArgChecker = Callable[[Type, Type, int, Type, int, int, CallableType, Context, MessageBuilder],
                       None]
 
-# Maximum nesting level for math union in overloads, setting this to large values
-# may cause performance issues. The reason is that although union math algorithm we use
-# nicely captures most corner cases, its worst case complexity is exponential,
+# Maximum number of distinct (overload items, argument types) combinations that union
+# math in overloads may check for a single call. Union math only splits argument positions
+# that discriminate between overload items and memoizes intermediate results, so realistic
+# calls need just a handful of steps, but its worst case complexity is still exponential,
 # see https://github.com/python/mypy/pull/5255#discussion_r196896335 for discussion.
-MAX_UNIONS = 5  # type: Final
+# The limit roughly matches the cost of the older algorithm that split up to five unions.
+MAX_UNION_MATH_STEPS = 64  # type: Final
 
 
 class TooManyUnions(Exception):
@@ -78,6 +81,66 @@ class TooManyUnions(Exception):
     """
 
 
+# Result of union math: a list of (<return type>, <inferred variant type>) or None.
+UnionMathResult = Optional[List[Tuple[Type, Type]]]
+
+# A type, or the id of a type that can't be compared exactly using equality
+# (see type_memo_key()).
+TypeMemoKey = Union[Optional[Type], int]
+# Key of the memo of inferred type arguments for generic calls: (callee type before
+# type variables were freshened, its type variables, type context, argument types,
+# argument kinds, formal to actual mapping). See infer_function_type_arguments().
+InferredArgsKey = Tuple[CallableType, Tuple[TypeVarDef, ...], Optional[Type],
+                        Tuple[TypeMemoKey, ...], Tuple[int, ...], Tuple[Tuple[int, ...], ...]]
+# Memoized inferred type arguments. Argument types are stored with the inferred types
+# to keep any ids in the key valid.
+InferredArgsMemo = Dict[InferredArgsKey, Tuple[List[Optional[Type]], List[Optional[Type]]]]
+
+
+class UnionMathState:
+    """State shared by all steps of union math for a single overloaded call.
+
+    Overload items are referred to by their index in 'targets'. We record, for each
+    argument position, which union items may possibly match which overload items, and
+    the result of every (overload items, argument types) combination already checked.
+    """
+
+    def __init__(self,
+                 targets: List[CallableType],
+                 args: List[Expression],
+                 arg_types: List[Type],
+                 arg_kinds: List[int],
+                 arg_names: Optional[Sequence[Optional[str]]],
+                 callable_name: Optional[str],
+                 object_type: Optional[Type],
+                 context: Context,
+                 arg_messages: Optional[MessageBuilder]) -> None:
+        self.targets = targets
+        self.args = args
+        self.arg_kinds = arg_kinds
+        self.arg_names = arg_names
+        self.callable_name = callable_name
+        self.object_type = object_type
+        self.context = context
+        self.arg_messages = arg_messages
+        # For each target, the formals each actual argument maps to.
+        self.actual_to_formals = []  # type: List[List[List[int]]]
+        for typ in targets:
+            formal_to_actual = map_actuals_to_formals(arg_kinds, arg_names,
+                                                      typ.arg_kinds, typ.arg_names,
+                                                      lambda i: arg_types[i])
+            actual_to_formals = [[] for _ in arg_kinds]  # type: List[List[int]]
+            for formal, actuals in enumerate(formal_to_actual):
+                for actual in actuals:
+                    actual_to_formals[actual].append(formal)
+            self.actual_to_formals.append(actual_to_formals)
+        # Map from (argument position, union item) to targets the item may match.
+        self.candidates = {}  # type: Dict[Tuple[int, Type], Set[int]]
+        # Map from (targets, argument types) to the result of union math.
+        self.results = {}  # type: Dict[Tuple[Tuple[int, ...], Tuple[Type, ...]], UnionMathResult]
+        self.steps = 0
+
+
 def extract_refexpr_names(expr: RefExpr) -> Set[str]:
     """Recursively extracts all module references from a reference expression.
 
@@ -114,6 +177,26 @@ class Finished(Exception):
     """Raised if we can terminate overload argument check early (no match)."""
 
 
+def type_memo_key(typ: Optional[Type]) -> TypeMemoKey:
+    """Return a key that can be used to find results computed for an identical type.
+
+    Type equality ignores details such as the kinds of Any types, erased instances
+    and the order of union items, which can leak into types computed from a type.
+    We only use equality for types where it is exact, and identity otherwise.
+    """
+    if typ is None or has_exact_equality(typ):
+        return typ
+    return id(typ)
+
+
+def has_exact_equality(typ: Type) -> bool:
+    if isinstance(typ, Instance):
+        return (not typ.erased and not typ.invalid
+                and all(has_exact_equality(arg) for arg in typ.args))
+    # Type variables are compared by id only, which isn't unique across functions.
+    return isinstance(typ, (NoneTyp, LiteralType))
+
+
 class ExpressionChecker(ExpressionVisitor[Type]):
     """Expression type checker.
 
@@ -156,6 +239,17 @@ class ExpressionChecker(ExpressionVisitor[Type]):
         self.type_overrides = {}  # type: Dict[Expression, Type]
         self.strfrm_checker = StringFormatterChecker(self, self.chk, self.msg)
 
+        # Type arguments inferred for generic calls in the first inference pass
+        self.inferred_args_memo = {}  # type: InferredArgsMemo
+        self.inferred_args_memo_hits = 0
+        self.inferred_args_memo_misses = 0
+
+    def reset(self) -> None:
+        """Forget everything memoized about the types in the current module."""
+        self.inferred_args_memo.clear()
+        self.inferred_args_memo_hits = 0
+        self.inferred_args_memo_misses = 0
+
     def visit_name_expr(self, e: NameExpr) -> Type:
         """Type check a name expression.
 
@@ -766,11 +860,12 @@ class ExpressionChecker(ExpressionVisitor[Type]):
             lambda i: self.accept(args[i]))
 
         if callee.is_generic():
+            generic_callee = callee
             callee = freshen_function_type_vars(callee)
             callee = self.infer_function_type_arguments_using_context(
                 callee, context)
             callee = self.infer_function_type_arguments(
-                callee, args, arg_kinds, formal_to_actual, context)
+                callee, args, arg_kinds, formal_to_actual, context, generic_callee)
 
         arg_types = self.infer_arg_types_in_context(
             callee, args, arg_kinds, formal_to_actual)
@@ -953,12 +1048,17 @@ class ExpressionChecker(ExpressionVisitor[Type]):
                                       args: List[Expression],
                                       arg_kinds: List[int],
                                       formal_to_actual: List[List[int]],
-                                      context: Context) -> CallableType:
+                                      context: Context,
+                                      generic_callee: Optional[CallableType] = None
+                                      ) -> CallableType:
         """Infer the type arguments for a generic callee type.
 
         Infer based on the types of arguments.
 
         Return a derived callable type that has the arguments applied.
+
+        If generic_callee (the callee type before type variables were freshened
+        and inferred from context) is given, the first inference pass is memoized.
         """
         if self.chk.in_checked_function():
             # Disable type errors during type inference. There may be errors
@@ -982,9 +1082,13 @@ class ExpressionChecker(ExpressionVisitor[Type]):
                 else:
                     pass1_args.append(arg)
 
-            inferred_args = infer_function_type_arguments(
-                callee_type, pass1_args, arg_kinds, formal_to_actual,
-                strict=self.chk.in_checked_function())
+            if generic_callee is not None:
+                inferred_args = self.infer_first_pass_arguments_memoized(
+                    generic_callee, callee_type, pass1_args, arg_kinds, formal_to_actual)
+            else:
+                inferred_args = infer_function_type_arguments(
+                    callee_type, pass1_args, arg_kinds, formal_to_actual,
+                    strict=self.chk.in_checked_function())
 
             if 2 in arg_pass_nums:
                 # Second pass of type inference.
@@ -1014,6 +1118,33 @@ class ExpressionChecker(ExpressionVisitor[Type]):
         return self.apply_inferred_arguments(callee_type, inferred_args,
                                              context)
 
+    def infer_first_pass_arguments_memoized(self, generic_callee: CallableType,
+                                            callee_type: CallableType,
+                                            arg_types: List[Optional[Type]],
+                                            arg_kinds: List[int],
+                                            formal_to_actual: List[List[int]]
+                                            ) -> List[Optional[Type]]:
+        """Infer type arguments for callee_type, reusing an earlier identical inference.
+
+        Inferred types only depend on the callee and the argument types. Freshened
+        type variables are different at every call, so the callee is identified
+        by the original generic callee and the type context used to partially
+        apply it. The type context doesn't need to be compared exactly, since the
+        inferred types are derived from the argument types only.
+        """
+        key = (generic_callee, tuple(generic_callee.variables), self.type_context[-1],
+               tuple(type_memo_key(arg) for arg in arg_types), tuple(arg_kinds),
+               tuple(tuple(actuals) for actuals in formal_to_actual))
+        cached = self.inferred_args_memo.get(key)
+        if cached is not None:
+            self.inferred_args_memo_hits += 1
+            return list(cached[0])
+        self.inferred_args_memo_misses += 1
+        inferred_args = infer_function_type_arguments(
+            callee_type, arg_types, arg_kinds, formal_to_actual)
+        self.inferred_args_memo[key] = (list(inferred_args), arg_types)
+        return inferred_args
+
     def infer_function_type_arguments_pass2(
             self, callee_type: CallableType,
             args: List[Expression],
@@ -1278,6 +1409,8 @@ class ExpressionChecker(ExpressionVisitor[Type]):
                             context: Context,
                             arg_messages: MessageBuilder) -> Tuple[Type, Type]:
         """Checks a call to an overloaded function."""
+        if timing.count_operations:
+            timing.Counters.overload_calls += 1
         arg_types = self.infer_arg_types_in_empty_context(args)
         # Step 1: Filter call targets to remove ones where the argument counts don't match
         plausible_targets = self.plausible_overload_call_targets(arg_types, arg_kinds,
@@ -1292,13 +1425,13 @@ class ExpressionChecker(ExpressionVisitor[Type]):
         unioned_result = None  # type: Optional[Tuple[Type, Type]]
         union_interrupted = False  # did we try all union combinations?
         if any(self.real_union(arg) for arg in arg_types):
-            unioned_errors = arg_messages.clean_copy()
             try:
-                unioned_return = self.union_overload_result(plausible_targets, args,
-                                                            arg_types, arg_kinds, arg_names,
-                                                            callable_name, object_type,
-                                                            context,
-                                                            arg_messages=unioned_errors)
+                with arg_messages.speculate():
+                    unioned_return = self.union_overload_result(plausible_targets, args,
+                                                                arg_types, arg_kinds, arg_names,
+                                                                callable_name, object_type,
+                                                                context,
+                                                                arg_messages=arg_messages)
             except TooManyUnions:
                 union_interrupted = True
             else:
@@ -1447,29 +1580,20 @@ class ExpressionChecker(ExpressionVisitor[Type]):
         args_contain_any = any(map(has_any_type, arg_types))
 
         for typ in plausible_targets:
-            overload_messages = self.msg.clean_copy()
-            prev_messages = self.msg
-            assert self.msg is self.chk.msg
-            self.msg = overload_messages
-            self.chk.msg = overload_messages
-            try:
-                # Passing `overload_messages` as the `arg_messages` parameter doesn't
-                # seem to reliably catch all possible errors.
-                # TODO: Figure out why
+            # Errors reported through the builder in any way (not only as argument
+            # errors) mean that the item doesn't match.
+            with self.msg.speculate() as speculation:
                 ret_type, infer_type = self.check_call(
                     callee=typ,
                     args=args,
                     arg_kinds=arg_kinds,
                     arg_names=arg_names,
                     context=context,
-                    arg_messages=overload_messages,
+                    arg_messages=self.msg,
                     callable_name=callable_name,
                     object_type=object_type)
-            finally:
-                self.chk.msg = prev_messages
-                self.msg = prev_messages
 
-            is_match = not overload_messages.is_errors()
+            is_match = not speculation.has_errors
             if is_match:
                 # Return early if possible; otherwise record info so we can
                 # check for ambiguity due to 'Any' below.
@@ -1528,64 +1652,102 @@ class ExpressionChecker(ExpressionVisitor[Type]):
                               object_type: Optional[Type],
                               context: Context,
                               arg_messages: Optional[MessageBuilder] = None,
-                              level: int = 0
                               ) -> Optional[List[Tuple[Type, Type]]]:
         """Accepts a list of overload signatures and attempts to match calls by destructuring
-        the first union.
+        unions in arguments.
 
         Return a list of (<return type>, <inferred variant type>) if call succeeds for every
-        item of the desctructured union. Returns None if there is no match.
+        item of the desctructured unions. Returns None if there is no match. Raise
+        TooManyUnions if matching needs too many steps.
         """
-        # Step 1: If we are already too deep, then stop immediately. Otherwise mypy might
-        # hang for long time because of a weird overload call. The caller will get
-        # the exception and generate an appropriate note message, if needed.
-        if level >= MAX_UNIONS:
+        state = UnionMathState(plausible_targets, args, arg_types, arg_kinds, arg_names,
+                               callable_name, object_type, context, arg_messages)
+        return self.union_math_step(state, tuple(range(len(plausible_targets))), arg_types)
+
+    def union_math_step(self,
+                        state: UnionMathState,
+                        targets: Tuple[int, ...],
+                        arg_types: List[Type]) -> UnionMathResult:
+        """Match a call against the given subset of overload items (see union_overload_result).
+
+        Only argument positions whose union items select different overload items are split;
+        union items that select the same overload items are kept together, and overload items
+        that cannot match an argument are dropped from further consideration.
+        """
+        key = (targets, tuple(arg_types))
+        if key in state.results:
+            return state.results[key]
+        # Step 1: If we have already done too much work, then stop immediately. Otherwise
+        # mypy might hang for long time because of a weird overload call. The caller will
+        # get the exception and generate an appropriate note message, if needed.
+        state.steps += 1
+        if state.steps > MAX_UNION_MATH_STEPS:
             raise TooManyUnions
+        result = self.union_math_step_uncached(state, targets, arg_types)
+        state.results[key] = result
+        return result
 
-        # Step 2: Find position of the first union in arguments. Return the normal inferred
+    def union_math_step_uncached(self,
+                                 state: UnionMathState,
+                                 targets: Tuple[int, ...],
+                                 arg_types: List[Type]) -> UnionMathResult:
+        plausible_targets = [state.targets[i] for i in targets]
+
+        # Step 2: Find positions of unions in arguments. Return the normal inferred
         # type if no more unions left.
-        for idx, typ in enumerate(arg_types):
-            if self.real_union(typ):
-                break
-        else:
+        union_positions = [idx for idx, typ in enumerate(arg_types) if self.real_union(typ)]
+        if not union_positions:
             # No unions in args, just fall back to normal inference
-            with self.type_overrides_set(args, arg_types):
-                res = self.infer_overload_return_type(plausible_targets, args, arg_types,
-                                                      arg_kinds, arg_names, callable_name,
-                                                      object_type, context, arg_messages)
+            with self.type_overrides_set(state.args, arg_types):
+                res = self.infer_overload_return_type(plausible_targets, state.args, arg_types,
+                                                      state.arg_kinds, state.arg_names,
+                                                      state.callable_name, state.object_type,
+                                                      state.context, state.arg_messages)
             if res is not None:
                 return [res]
             return None
 
         # Step 3: Try a direct match before splitting to avoid unnecessary union splits
         # and save performance.
-        with self.type_overrides_set(args, arg_types):
-            direct = self.infer_overload_return_type(plausible_targets, args, arg_types,
-                                                     arg_kinds, arg_names, callable_name,
-                                                     object_type, context, arg_messages)
+        with self.type_overrides_set(state.args, arg_types):
+            direct = self.infer_overload_return_type(plausible_targets, state.args, arg_types,
+                                                     state.arg_kinds, state.arg_names,
+                                                     state.callable_name, state.object_type,
+                                                     state.context, state.arg_messages)
         if direct is not None and not isinstance(direct[0], (UnionType, AnyType)):
             # We only return non-unions soon, to avoid greedy match.
             return [direct]
 
-        # Step 4: Split the first remaining union type in arguments into items and
-        # try to match each item individually (recursive).
-        first_union = arg_types[idx]
-        assert isinstance(first_union, UnionType)
+        # Step 4: Find the first union that discriminates between overload items and split
+        # it into groups of items that may match the same overload items. If no union
+        # discriminates, split the first union into individual items.
+        idx = union_positions[0]
+        groups = []  # type: List[Tuple[List[Type], Tuple[int, ...]]]
+        for pos in union_positions:
+            pos_groups = self.union_item_groups(state, targets, pos, arg_types[pos])
+            if any(not group_targets for _, group_targets in pos_groups):
+                # Some item can't match any overload item, so the whole call can't match.
+                return None
+            if len(pos_groups) > 1:
+                idx, groups = pos, pos_groups
+                break
+            if not groups:
+                items, group_targets = pos_groups[0]
+                groups = [([item], group_targets) for item in items]
+
+        # Step 5: Try to match each group individually (recursive).
         res_items = []
-        for item in first_union.relevant_items():
+        for items, group_targets in groups:
             new_arg_types = arg_types.copy()
-            new_arg_types[idx] = item
-            sub_result = self.union_overload_result(plausible_targets, args, new_arg_types,
-                                                    arg_kinds, arg_names, callable_name,
-                                                    object_type, context, arg_messages,
-                                                    level + 1)
+            new_arg_types[idx] = items[0] if len(items) == 1 else UnionType.make_union(items)
+            sub_result = self.union_math_step(state, group_targets, new_arg_types)
             if sub_result is not None:
                 res_items.extend(sub_result)
             else:
                 # Some item doesn't match, return soon.
                 return None
 
-        # Step 5: If splitting succeeded, then filter out duplicate items before returning.
+        # Step 6: If splitting succeeded, then filter out duplicate items before returning.
         seen = set()  # type: Set[Tuple[Type, Type]]
         result = []
         for pair in res_items:
@@ -1594,6 +1756,45 @@ class ExpressionChecker(ExpressionVisitor[Type]):
                 result.append(pair)
         return result
 
+    def union_item_groups(self,
+                          state: UnionMathState,
+                          targets: Tuple[int, ...],
+                          idx: int,
+                          union: Type) -> List[Tuple[List[Type], Tuple[int, ...]]]:
+        """Group items of a union argument by the overload items they may match.
+
+        Return a list of (<union items>, <overload items>) pairs in the order of the union
+        items. An overload item is considered if the union item is compatible with the
+        corresponding formal(s) after erasing type variables, which never rejects an overload
+        item that could match after type inference.
+        """
+        assert isinstance(union, UnionType)
+        groups = OrderedDict()  # type: OrderedDict[Tuple[int, ...], List[Type]]
+        for item in union.relevant_items():
+            key = (idx, item)
+            if key not in state.candidates:
+                state.candidates[key] = self.union_item_candidates(state, idx, item)
+            candidates = state.candidates[key]
+            item_targets = tuple(target for target in targets if target in candidates)
+            groups.setdefault(item_targets, []).append(item)
+        return [(items, item_targets) for item_targets, items in groups.items()]
+
+    def union_item_candidates(self, state: UnionMathState, idx: int, item: Type) -> Set[int]:
+        """Return the overload items that may accept the given type at an argument position."""
+        if state.arg_kinds[idx] not in (ARG_POS, ARG_NAMED):
+            # Star arguments may map to several formals with different types; be conservative.
+            return set(range(len(state.targets)))
+        candidates = set()
+        for i, typ in enumerate(state.targets):
+            for formal in state.actual_to_formals[i][idx]:
+                formal_type = erasetype.erase_typevars(typ.arg_types[formal])
+                if (not is_subtype(item, formal_type) and
+                        not self.chk.should_suppress_optional_error([item, formal_type])):
+                    break
+            else:
+                candidates.add(i)
+        return candidates
+
     def real_union(self, typ: Type) -> bool:
         return isinstance(typ, UnionType) and len(typ.relevant_items()) > 1
 
@@ -23,4 +23,5 @@ REPORTER_NAMES = ['linecount',
                   'xslt-html',
                   'xslt-txt',
                   'html',
-                  'txt']  # type: Final
+                  'txt',
+                  'timing']  # type: Final
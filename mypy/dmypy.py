@@ -70,6 +70,8 @@ p.add_argument('-v', '--verbose', action='store_true', help="Print detailed stat
 p.add_argument('-q', '--quiet', action='store_true', help=argparse.SUPPRESS)  # Deprecated
 p.add_argument('--junit-xml', help="Write junit.xml to the given file")
 p.add_argument('--perf-stats-file', help='write telemetry information to the given file')
+p.add_argument('--profile-output', metavar='FILE',
+               help='write stack samples taken while checking to FILE')
 p.add_argument('files', metavar='FILE', nargs='+', help="File (or directory) to check")
 
 run_parser = p = subparsers.add_parser('run', formatter_class=AugmentedHelpFormatter,
@@ -77,6 +79,8 @@ run_parser = p = subparsers.add_parser('run', formatter_class=AugmentedHelpForma
 p.add_argument('-v', '--verbose', action='store_true', help="Print detailed status")
 p.add_argument('--junit-xml', help="Write junit.xml to the given file")
 p.add_argument('--perf-stats-file', help='write telemetry information to the given file')
+p.add_argument('--profile-output', metavar='FILE',
+               help='write stack samples taken while checking to FILE')
 p.add_argument('--timeout', metavar='TIMEOUT', type=int,
                help="Server shutdown timeout (in seconds)")
 p.add_argument('--log-file', metavar='FILE', type=str,
@@ -90,6 +94,8 @@ p.add_argument('-v', '--verbose', action='store_true', help="Print detailed stat
 p.add_argument('-q', '--quiet', action='store_true', help=argparse.SUPPRESS)  # Deprecated
 p.add_argument('--junit-xml', help="Write junit.xml to the given file")
 p.add_argument('--perf-stats-file', help='write telemetry information to the given file')
+p.add_argument('--profile-output', metavar='FILE',
+               help='write stack samples taken while checking to FILE')
 p.add_argument('--update', metavar='FILE', nargs='*',
                help="Files in the run to add or check again (default: all from previous run)..")
 p.add_argument('--remove', metavar='FILE', nargs='*',
@@ -244,12 +250,14 @@ def do_run(args: argparse.Namespace) -> None:
         # Bad or missing status file or dead process; good to start.
         start_server(args, allow_sources=True)
     t0 = time.time()
-    response = request(args.status_file, 'run', version=__version__, args=args.flags)
+    response = request(args.status_file, 'run', version=__version__, args=args.flags,
+                       profile_output=profile_output(args))
     # If the daemon signals that a restart is necessary, do it
     if 'restart' in response:
         print('Restarting: {}'.format(response['restart']))
         restart_server(args, allow_sources=True)
-        response = request(args.status_file, 'run', version=__version__, args=args.flags)
+        response = request(args.status_file, 'run', version=__version__, args=args.flags,
+                           profile_output=profile_output(args))
 
     t1 = time.time()
     response['roundtrip_time'] = t1 - t0
@@ -304,7 +312,8 @@ def do_kill(args: argparse.Namespace) -> None:
 def do_check(args: argparse.Namespace) -> None:
     """Ask the daemon to check a list of files."""
     t0 = time.time()
-    response = request(args.status_file, 'check', files=args.files)
+    response = request(args.status_file, 'check', files=args.files,
+                       profile_output=profile_output(args))
     t1 = time.time()
     response['roundtrip_time'] = t1 - t0
     check_output(response, args.verbose, args.junit_xml, args.perf_stats_file)
@@ -327,14 +336,25 @@ def do_recheck(args: argparse.Namespace) -> None:
     """
     t0 = time.time()
     if args.remove is not None or args.update is not None:
-        response = request(args.status_file, 'recheck', remove=args.remove, update=args.update)
+        response = request(args.status_file, 'recheck', remove=args.remove, update=args.update,
+                           profile_output=profile_output(args))
     else:
-        response = request(args.status_file, 'recheck')
+        response = request(args.status_file, 'recheck', profile_output=profile_output(args))
     t1 = time.time()
     response['roundtrip_time'] = t1 - t0
     check_output(response, args.verbose, args.junit_xml, args.perf_stats_file)
 
 
+def profile_output(args: argparse.Namespace) -> Optional[str]:
+    """Return the absolute path of the --profile-output file, if given.
+
+    The path is made absolute since the daemon may run in another directory.
+    """
+    if args.profile_output is None:
+        return None
+    return os.path.abspath(args.profile_output)
+
+
 def check_output(response: Dict[str, Any], verbose: bool,
                  junit_xml: Optional[str],
                  perf_stats_file: Optional[str]) -> None:
@@ -28,6 +28,7 @@ from mypy.fscache import FileSystemCache
 from mypy.fswatcher import FileSystemWatcher, FileData
 from mypy.modulefinder import BuildSource, compute_search_paths
 from mypy.options import Options
+from mypy.profiler import SamplingProfiler, is_profiling_supported
 from mypy.typestate import reset_global_state
 from mypy.util import redirect_stderr, redirect_stdout
 from mypy.version import __version__
@@ -171,6 +172,8 @@ class Server:
         self.options_snapshot = options.snapshot()
         self.timeout = timeout
         self.fine_grained_manager = None  # type: Optional[FineGrainedBuildManager]
+        # Time and memory use of the build phases of the most recent command
+        self.phase_stats = {}  # type: Dict[str, float]
 
         if os.path.isfile(status_file):
             os.unlink(status_file)
@@ -257,8 +260,20 @@ class Server:
         method = getattr(self.__class__, key, None)
         if method is None:
             return {'error': "Unrecognized command '%s'" % command}
-        else:
+        data = dict(data)
+        profile_output = data.pop('profile_output', None)
+        if not isinstance(profile_output, str):
+            return method(self, **data)
+        # Sample the stack while running this command only.
+        if not is_profiling_supported():
+            return {'error': "Profiling is not supported on this platform"}
+        profiler = SamplingProfiler()
+        profiler.start()
+        try:
             return method(self, **data)
+        finally:
+            profiler.stop()
+            profiler.write(profile_output)
 
     # Command functions (run in the server via RPC).
 
@@ -266,6 +281,7 @@ class Server:
         """Return daemon status."""
         res = {}  # type: Dict[str, object]
         res.update(get_meminfo())
+        res.update(self.phase_stats)
         return res
 
     def cmd_stop(self) -> Dict[str, object]:
@@ -364,6 +380,8 @@ class Server:
             manager = self.fine_grained_manager.manager
             manager.dump_stats()
             res['stats'] = manager.stats
+            self.phase_stats = {key: value for key, value in manager.stats.items()
+                                if key.startswith('phase_')}
             manager.stats = {}
 
     def initialize_fine_grained(self, sources: List[BuildSource]) -> Dict[str, Any]:
@@ -1,9 +1,10 @@
+import json
 import os.path
 import sys
 import traceback
 from collections import OrderedDict, defaultdict
 
-from typing import Tuple, List, TypeVar, Set, Dict, Optional
+from typing import Tuple, List, TypeVar, Set, Dict, Optional, Union, Callable, Sequence, Any
 
 from mypy.scope import Scope
 from mypy.options import Options
@@ -16,6 +17,12 @@ if MYPY:
 T = TypeVar('T')
 allowed_duplicates = ['@overload', 'Got:', 'Expected:']  # type: Final
 
+# An error message, or a function that produces the message. Formatting types
+# for messages can be expensive, and many messages are never shown, since they
+# are reported on lines with "# type: ignore" or while checking speculatively.
+# A function is only called when the message is actually needed.
+LazyMessage = Union[str, Callable[[], str]]
+
 
 class ErrorInfo:
     """Representation of a single error message."""
@@ -45,8 +52,8 @@ class ErrorInfo:
     # Either 'error', 'note', or 'warning'.
     severity = ''
 
-    # The error message.
-    message = ''
+    # The error message, or a function that produces it. Use the message property.
+    _message = ''  # type: LazyMessage
 
     # If True, we should halt build after the file that generated this error.
     blocker = False
@@ -69,7 +76,7 @@ class ErrorInfo:
                  line: int,
                  column: int,
                  severity: str,
-                 message: str,
+                 message: LazyMessage,
                  blocker: bool,
                  only_once: bool,
                  origin: Optional[Tuple[str, int]] = None,
@@ -82,12 +89,20 @@ class ErrorInfo:
         self.line = line
         self.column = column
         self.severity = severity
-        self.message = message
+        self._message = message
         self.blocker = blocker
         self.only_once = only_once
         self.origin = origin or (file, line)
         self.target = target
 
+    @property
+    def message(self) -> str:
+        """The error message (produced when it is first needed)."""
+        message = self._message
+        if not isinstance(message, str):
+            message = self._message = message()
+        return message
+
 
 class Errors:
     """Container for compile errors.
@@ -131,6 +146,9 @@ class Errors:
     # Set to True to show column numbers in error messages.
     show_column_numbers = False  # type: bool
 
+    # Either 'text' or 'json' (one JSON object per line for each error).
+    error_format = 'text'  # type: str
+
     # State for keeping track of the current fine-grained incremental mode target.
     # (See mypy.server.update for more about targets.)
     # Current module id.
@@ -138,9 +156,11 @@ class Errors:
     scope = None  # type: Optional[Scope]
 
     def __init__(self, show_error_context: bool = False,
-                 show_column_numbers: bool = False) -> None:
+                 show_column_numbers: bool = False,
+                 error_format: str = 'text') -> None:
         self.show_error_context = show_error_context
         self.show_column_numbers = show_column_numbers
+        self.error_format = error_format
         self.initialize()
 
     def initialize(self) -> None:
@@ -160,7 +180,7 @@ class Errors:
         self.initialize()
 
     def copy(self) -> 'Errors':
-        new = Errors(self.show_error_context, self.show_column_numbers)
+        new = Errors(self.show_error_context, self.show_column_numbers, self.error_format)
         new.file = self.file
         new.import_ctx = self.import_ctx[:]
         new.type_name = self.type_name[:]
@@ -224,7 +244,7 @@ class Errors:
     def report(self,
                line: int,
                column: Optional[int],
-               message: str,
+               message: LazyMessage,
                blocker: bool = False,
                severity: str = 'error',
                file: Optional[str] = None,
@@ -235,7 +255,7 @@ class Errors:
 
         Args:
             line: line number of error
-            message: message to report
+            message: message to report, or a function that produces it
             blocker: if True, don't continue analysis after this error
             severity: 'error', 'note' or 'warning'
             file: if non-None, override current file as context
@@ -256,7 +276,7 @@ class Errors:
         if file is None:
             file = self.file
         if offset:
-            message = " " * offset + message
+            message = indent_message(message, offset)
         info = ErrorInfo(self.import_context(), file, self.current_module(), type,
                          function, line, column, severity, message,
                          blocker, only_once,
@@ -350,6 +370,8 @@ class Errors:
 
         Use a form suitable for displaying to the user.
         """
+        if self.error_format == 'json':
+            return self.format_messages_json(error_info)
         a = []  # type: List[str]
         errors = self.render_messages(self.sort_messages(error_info))
         errors = self.remove_duplicates(errors)
@@ -369,6 +391,35 @@ class Errors:
             a.append(s)
         return a
 
+    def format_messages_json(self, error_info: List[ErrorInfo]) -> List[str]:
+        """Return a list of JSON objects, one for each error message.
+
+        The context of each error is included in the object instead of
+        being shown as separate notes.
+        """
+        errors = self.sort_messages(error_info)
+        duplicates = self.find_duplicates([(e.file, e.line, e.column, e.severity, e.message)
+                                           for e in errors])
+        a = []  # type: List[str]
+        for e, duplicate in zip(errors, duplicates):
+            if duplicate:
+                continue
+            obj = OrderedDict([
+                ('file', self.simplify_path(e.file)),
+                ('line', e.line if e.line >= 0 else None),
+                ('column', 1 + e.column if e.column >= 0 else None),
+                ('severity', e.severity),
+                ('message', e.message),
+                ('module', e.module),
+                ('target', e.target),
+                ('type', e.type),
+                ('function', e.function_or_member),
+                ('import_context', [[remove_path_prefix(path, self.ignore_prefix), line]
+                                    for path, line in e.import_ctx]),
+            ])  # type: Dict[str, Any]
+            a.append(json.dumps(obj))
+        return a
+
     def file_messages(self, path: str) -> List[str]:
         """Return a string list of new error messages from a given file.
 
@@ -502,7 +553,13 @@ class Errors:
     def remove_duplicates(self, errors: List[Tuple[Optional[str], int, int, str, str]]
                           ) -> List[Tuple[Optional[str], int, int, str, str]]:
         """Remove duplicates from a sorted error list."""
-        res = []  # type: List[Tuple[Optional[str], int, int, str, str]]
+        return [error for error, duplicate in zip(errors, self.find_duplicates(errors))
+                if not duplicate]
+
+    def find_duplicates(self, errors: Sequence[Tuple[Optional[str], int, int, str, str]]
+                        ) -> List[bool]:
+        """Find duplicates in a sorted error list; return a flag for each error."""
+        res = []  # type: List[bool]
         i = 0
         while i < len(errors):
             dup = False
@@ -518,12 +575,18 @@ class Errors:
                     dup = True
                     break
                 j -= 1
-            if not dup:
-                res.append(errors[i])
+            res.append(dup)
             i += 1
         return res
 
 
+def indent_message(message: LazyMessage, offset: int) -> LazyMessage:
+    if isinstance(message, str):
+        return " " * offset + message
+    render = message
+    return lambda: " " * offset + render()
+
+
 class CompileError(Exception):
     """Exception raised when there is a compile error.
 
@@ -1,4 +1,4 @@
-from typing import Dict, Iterable, List, TypeVar, Mapping, cast
+from typing import Dict, List, TypeVar, Mapping, cast
 
 from mypy.types import (
     Type, Instance, CallableType, TypeVisitor, UnboundType, AnyType,
@@ -11,8 +11,12 @@ from mypy.types import (
 def expand_type(typ: Type, env: Mapping[TypeVarId, Type]) -> Type:
     """Substitute any type variable references in a type given by a type
     environment.
-    """
 
+    Components for which the substitution is a no-op are shared with the
+    original type, and the original type is returned if nothing changes.
+    """
+    if is_expand_noop(typ):
+        return typ
     return typ.accept(ExpandTypeVisitor(env))
 
 
@@ -20,7 +24,7 @@ def expand_type_by_instance(typ: Type, instance: Instance) -> Type:
     """Substitute type variables in type using values from an Instance.
     Type variables are considered to be bound by the class declaration."""
 
-    if instance.args == []:
+    if instance.args == [] or is_expand_noop(typ):
         return typ
     else:
         variables = {}  # type: Dict[TypeVarId, Type]
@@ -29,6 +33,42 @@ def expand_type_by_instance(typ: Type, instance: Instance) -> Type:
         return expand_type(typ, variables)
 
 
+def is_expand_noop(typ: Type) -> bool:
+    """Does expand_type() return the original type regardless of the environment?
+
+    This is true if a type has no type variable references, and no components
+    that ExpandTypeVisitor would normalize (unions get simplified, and instances
+    lose their erased and final_value attributes). The answer is cached on the
+    type object, since types are not mutated after semantic analysis. Forward
+    references and other synthetic types are never considered no-ops.
+    """
+    result = typ._expand_noop
+    if result is not None:
+        return result
+    if isinstance(typ, Instance):
+        result = (not typ.erased and not typ.invalid and typ.final_value is None
+                  and all(is_expand_noop(arg) for arg in typ.args))
+    elif isinstance(typ, CallableType):
+        result = (all(is_expand_noop(arg) for arg in typ.arg_types)
+                  and is_expand_noop(typ.ret_type))
+    elif isinstance(typ, Overloaded):
+        result = all(is_expand_noop(item) for item in typ.items())
+    elif isinstance(typ, TupleType):
+        result = all(is_expand_noop(item) for item in typ.items)
+    elif isinstance(typ, TypedDictType):
+        result = all(is_expand_noop(item) for item in typ.items.values())
+    elif isinstance(typ, TypeType):
+        result = is_expand_noop(typ.item)
+    elif isinstance(typ, (UnboundType, AnyType, NoneTyp, UninhabitedType, DeletedType,
+                          LiteralType, PartialType)):
+        result = True
+    else:
+        # Type variables, unions, and types that can't be expanded at all.
+        return False
+    typ._expand_noop = result
+    return result
+
+
 F = TypeVar('F', bound=FunctionLike)
 
 
@@ -81,6 +121,8 @@ class ExpandTypeVisitor(TypeVisitor[Type]):
 
     def visit_instance(self, t: Instance) -> Type:
         args = self.expand_types(t.args)
+        if args is t.args and not t.erased and not t.invalid and t.final_value is None:
+            return t
         return Instance(t.type, args, t.line, t.column)
 
     def visit_type_var(self, t: TypeVarType) -> Type:
@@ -94,22 +136,34 @@ class ExpandTypeVisitor(TypeVisitor[Type]):
             return repl
 
     def visit_callable_type(self, t: CallableType) -> Type:
-        return t.copy_modified(arg_types=self.expand_types(t.arg_types),
-                               ret_type=t.ret_type.accept(self))
+        arg_types = self.expand_types(t.arg_types)
+        ret_type = self.expand(t.ret_type)
+        if arg_types is t.arg_types and ret_type is t.ret_type:
+            return t
+        return t.copy_modified(arg_types=arg_types, ret_type=ret_type)
 
     def visit_overloaded(self, t: Overloaded) -> Type:
         items = []  # type: List[CallableType]
         for item in t.items():
-            new_item = item.accept(self)
+            new_item = self.expand(item)
             assert isinstance(new_item, CallableType)
             items.append(new_item)
+        if all(new is old for new, old in zip(items, t.items())):
+            return t
         return Overloaded(items)
 
     def visit_tuple_type(self, t: TupleType) -> Type:
-        return t.copy_modified(items=self.expand_types(t.items))
+        items = self.expand_types(t.items)
+        if items is t.items:
+            return t
+        return t.copy_modified(items=items)
 
     def visit_typeddict_type(self, t: TypedDictType) -> Type:
-        return t.copy_modified(item_types=self.expand_types(t.items.values()))
+        item_types = list(t.items.values())
+        new_item_types = self.expand_types(item_types)
+        if new_item_types is item_types:
+            return t
+        return t.copy_modified(item_types=new_item_types)
 
     def visit_literal_type(self, t: LiteralType) -> Type:
         # TODO: Verify this implementation is correct
@@ -127,11 +181,26 @@ class ExpandTypeVisitor(TypeVisitor[Type]):
         # TODO: Verify that the new item type is valid (instance or
         # union of instances or Any).  Sadly we can't report errors
         # here yet.
-        item = t.item.accept(self)
+        item = self.expand(t.item)
+        if item is t.item:
+            return t
         return TypeType.make_normalized(item)
 
-    def expand_types(self, types: Iterable[Type]) -> List[Type]:
+    def expand(self, t: Type) -> Type:
+        """Expand a component type, sharing it if expansion would be a no-op."""
+        if is_expand_noop(t):
+            return t
+        return t.accept(self)
+
+    def expand_types(self, types: List[Type]) -> List[Type]:
+        """Expand a list of types.
+
+        Return the original list object if no item was changed.
+        """
         a = []  # type: List[Type]
+        changed = False
         for t in types:
-            a.append(t.accept(self))
-        return a
+            new = self.expand(t)
+            changed = changed or new is not t
+            a.append(new)
+        return a if changed else types
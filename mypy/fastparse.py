@@ -1,4 +1,5 @@
 import sys
+from collections import OrderedDict
 
 from typing import (
     Tuple, Union, TypeVar, Callable, Sequence, Optional, Any, Dict, cast, List, overload
@@ -84,6 +85,9 @@ _dummy_fallback = Instance(MISSING_FALLBACK, [], -1)  # type: Final
 
 TYPE_COMMENT_SYNTAX_ERROR = 'syntax error in type comment'  # type: Final
 
+# Maximum number of entries in each of the memos of parsed type comments
+TYPE_COMMENT_CACHE_SIZE = 10000  # type: Final
+
 
 # Older versions of typing don't allow using overload outside stubs,
 # so provide a dummy.
@@ -140,11 +144,125 @@ def parse(source: Union[str, bytes],
     return tree
 
 
+class TypeCommentCache:
+    """Bounded memo of types parsed from type comments and string annotations.
+
+    The same type comments are often repeated many times within a program, and
+    parsing and converting each of them is relatively expensive. The result of
+    converting a type comment only depends on its text, the conversion flags and
+    the line number, so we remember the types parsed for recent comments and hand
+    out fresh copies moved to the right line. Comments that produce errors aren't
+    memoized, since the errors must be reported again.
+
+    The memo is global, so it is shared by all files in a build and survives
+    between runs in the daemon. Least recently used entries are evicted first.
+    """
+
+    def __init__(self, size: int = TYPE_COMMENT_CACHE_SIZE) -> None:
+        self.size = size
+        # (comment, assume_str_is_unicode) -> (type, line where it was parsed)
+        self.types = OrderedDict()  # type: OrderedDict[Tuple[str, bool], Tuple[Type, int]]
+        # Function type comments -> parsed AST (conversion of these isn't memoized)
+        self.func_types = OrderedDict()  # type: OrderedDict[str, FunctionType]
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, type_comment: str, assume_str_is_unicode: bool,
+               line: int) -> Optional[Type]:
+        key = (type_comment, assume_str_is_unicode)
+        entry = self.types.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.types.move_to_end(key)
+        typ, old_line = entry
+        return copy_converted_type(typ, old_line, line)
+
+    def store(self, type_comment: str, assume_str_is_unicode: bool,
+              line: int, typ: Type) -> Type:
+        """Remember a converted type and return a copy that can be used by the caller.
+
+        The returned copy is needed, since callers may mutate converted types.
+        """
+        # Some parts of converted types always have line -1, so we can't move
+        # these types from line -1 to a different line.
+        if line != -1 and can_copy_converted_type(typ):
+            self.types[type_comment, assume_str_is_unicode] = (typ, line)
+            if len(self.types) > self.size:
+                self.types.popitem(last=False)
+            typ = copy_converted_type(typ, line, line)
+        return typ
+
+    def parse_func_type(self, type_comment: str) -> FunctionType:
+        """Parse a function type comment (the AST is never modified, so it can be shared)."""
+        func_type_ast = self.func_types.get(type_comment)
+        if func_type_ast is None:
+            self.misses += 1
+            parsed = ast3.parse(type_comment, '<func_type>', 'func_type')
+            assert isinstance(parsed, FunctionType)
+            func_type_ast = self.func_types[type_comment] = parsed
+            if len(self.func_types) > self.size:
+                self.func_types.popitem(last=False)
+        else:
+            self.hits += 1
+            self.func_types.move_to_end(type_comment)
+        return func_type_ast
+
+
+type_comment_cache = TypeCommentCache()  # type: Final
+
+
+def can_copy_converted_type(typ: Type) -> bool:
+    if isinstance(typ, UnboundType):
+        return all(can_copy_converted_type(arg) for arg in typ.args)
+    elif isinstance(typ, (TypeList, TupleType)):
+        return all(can_copy_converted_type(item) for item in typ.items)
+    elif isinstance(typ, CallableArgument):
+        return can_copy_converted_type(typ.typ)
+    return isinstance(typ, (AnyType, RawExpressionType, EllipsisType))
+
+
+def copy_converted_type(typ: Type, old_line: int, line: int) -> Type:
+    """Copy a type produced by TypeConverter at old_line, moving it to a new line.
+
+    Only the types accepted by can_copy_converted_type() are supported.
+    """
+    new_line = line if typ.line == old_line else typ.line
+    if isinstance(typ, UnboundType):
+        return UnboundType(typ.name, [copy_converted_type(arg, old_line, line)
+                                      for arg in typ.args],
+                           new_line, typ.column, typ.optional, typ.empty_tuple_index,
+                           typ.original_str_expr, typ.original_str_fallback)
+    elif isinstance(typ, AnyType):
+        return AnyType(typ.type_of_any, typ.source_any, typ.missing_import_name,
+                       new_line, typ.column)
+    elif isinstance(typ, RawExpressionType):
+        return RawExpressionType(typ.literal_value, typ.base_type_name, new_line, typ.column,
+                                 typ.note)
+    elif isinstance(typ, TypeList):
+        return TypeList([copy_converted_type(item, old_line, line) for item in typ.items],
+                        new_line, typ.column)
+    elif isinstance(typ, TupleType):
+        return TupleType([copy_converted_type(item, old_line, line) for item in typ.items],
+                         typ.fallback, new_line, typ.column, typ.implicit)
+    elif isinstance(typ, CallableArgument):
+        # The line of a callable argument is relative to the type comment.
+        return CallableArgument(copy_converted_type(typ.typ, old_line, line), typ.name,
+                                typ.constructor, typ.line, typ.column)
+    else:
+        assert isinstance(typ, EllipsisType)
+        return EllipsisType(new_line, typ.column)
+
+
 def parse_type_comment(type_comment: str,
                        line: int,
                        errors: Optional[Errors],
                        assume_str_is_unicode: bool = True,
                        ) -> Optional[Type]:
+    cached = type_comment_cache.lookup(type_comment, assume_str_is_unicode, line)
+    if cached is not None:
+        return cached
     try:
         typ = ast3.parse(type_comment, '<type_comment>', 'eval')
     except SyntaxError as e:
@@ -155,8 +273,12 @@ def parse_type_comment(type_comment: str,
             raise
     else:
         assert isinstance(typ, ast3_Expression)
-        return TypeConverter(errors, line=line,
-                             assume_str_is_unicode=assume_str_is_unicode).visit(typ.body)
+        converter = TypeConverter(errors, line=line,
+                                  assume_str_is_unicode=assume_str_is_unicode)
+        converted = converter.visit(typ.body)
+        if converter.failed:
+            return converted
+        return type_comment_cache.store(type_comment, assume_str_is_unicode, line, converted)
 
 
 def parse_type_string(expr_string: str, expr_fallback_name: str,
@@ -397,8 +519,7 @@ class ASTConverter:
             return_type = None
         elif n.type_comment is not None:
             try:
-                func_type_ast = ast3.parse(n.type_comment, '<func_type>', 'func_type')
-                assert isinstance(func_type_ast, FunctionType)
+                func_type_ast = type_comment_cache.parse_func_type(n.type_comment)
                 # for ellipsis arg
                 if (len(func_type_ast.argtypes) == 1 and
                         isinstance(func_type_ast.argtypes[0], ast3_Ellipsis)):
@@ -1071,6 +1192,8 @@ class TypeConverter:
         self.line = line
         self.node_stack = []  # type: List[AST]
         self.assume_str_is_unicode = assume_str_is_unicode
+        # Set if an error or a note was generated (even if errors is None)
+        self.failed = False
 
     def invalid_type(self, node: AST, note: Optional[str] = None) -> RawExpressionType:
         """Constructs a type representing some expression that normally forms an invalid type.
@@ -1118,10 +1241,12 @@ class TypeConverter:
         return self.node_stack[-2]
 
     def fail(self, msg: str, line: int, column: int) -> None:
+        self.failed = True
         if self.errors:
             self.errors.report(line, column, msg, blocker=True)
 
     def note(self, msg: str, line: int, column: int) -> None:
+        self.failed = True
         if self.errors:
             self.errors.report(line, column, msg, severity='note')
 
@@ -45,7 +45,9 @@ from mypy.types import (
 )
 from mypy import messages
 from mypy.errors import Errors
-from mypy.fastparse import TypeConverter, parse_type_comment, bytes_to_human_readable_repr
+from mypy.fastparse import (
+    TypeConverter, parse_type_comment, bytes_to_human_readable_repr, type_comment_cache
+)
 from mypy.options import Options
 
 try:
@@ -339,8 +341,7 @@ class ASTConverter:
             return_type = None
         elif type_comment is not None and len(type_comment) > 0:
             try:
-                func_type_ast = ast3.parse(type_comment, '<func_type>', 'func_type')
-                assert isinstance(func_type_ast, FunctionType)
+                func_type_ast = type_comment_cache.parse_func_type(type_comment)
                 # for ellipsis arg
                 if (len(func_type_ast.argtypes) == 1 and
                         isinstance(func_type_ast.argtypes[0], ast3_Ellipsis)):
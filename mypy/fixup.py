@@ -13,15 +13,15 @@ from mypy.types import (
     TypeType, NOT_READY
 )
 from mypy.visitor import NodeVisitor
-from mypy.lookup import lookup_fully_qualified
+from mypy.lookup import FullnameIndex, lookup_fully_qualified
 
 
 # N.B: we do a quick_and_dirty fixup in both quick_and_dirty mode and
 # when fixing up a fine-grained incremental cache load (since there may
 # be cross-refs into deleted modules)
 def fixup_module(tree: MypyFile, modules: Dict[str, MypyFile],
-                 quick_and_dirty: bool) -> None:
-    node_fixer = NodeFixer(modules, quick_and_dirty)
+                 quick_and_dirty: bool, index: Optional[FullnameIndex] = None) -> None:
+    node_fixer = NodeFixer(modules, quick_and_dirty, index)
     node_fixer.visit_symbol_table(tree.names)
 
 
@@ -29,10 +29,12 @@ def fixup_module(tree: MypyFile, modules: Dict[str, MypyFile],
 class NodeFixer(NodeVisitor[None]):
     current_info = None  # type: Optional[TypeInfo]
 
-    def __init__(self, modules: Dict[str, MypyFile], quick_and_dirty: bool) -> None:
+    def __init__(self, modules: Dict[str, MypyFile], quick_and_dirty: bool,
+                 index: Optional[FullnameIndex] = None) -> None:
         self.modules = modules
         self.quick_and_dirty = quick_and_dirty
-        self.type_fixer = TypeFixer(self.modules, quick_and_dirty)
+        self.index = index
+        self.type_fixer = TypeFixer(self.modules, quick_and_dirty, index)
 
     # NOTE: This method isn't (yet) part of the NodeVisitor API.
     def visit_type_info(self, info: TypeInfo) -> None:
@@ -57,7 +59,8 @@ class NodeFixer(NodeVisitor[None]):
             if info.metaclass_type:
                 info.metaclass_type.accept(self.type_fixer)
             if info._mro_refs:
-                info.mro = [lookup_qualified_typeinfo(self.modules, name, self.quick_and_dirty)
+                info.mro = [lookup_qualified_typeinfo(self.modules, name, self.quick_and_dirty,
+                                                      self.index)
                             for name in info._mro_refs]
                 info._mro_refs = None
         finally:
@@ -74,7 +77,7 @@ class NodeFixer(NodeVisitor[None]):
                     value.node = self.modules[cross_ref]
                 else:
                     stnode = lookup_qualified_stnode(self.modules, cross_ref,
-                                                     self.quick_and_dirty)
+                                                     self.quick_and_dirty, self.index)
                     if stnode is not None:
                         value.node = stnode.node
                     elif not self.quick_and_dirty:
@@ -137,17 +140,27 @@ class NodeFixer(NodeVisitor[None]):
 
 
 class TypeFixer(TypeVisitor[None]):
-    def __init__(self, modules: Dict[str, MypyFile], quick_and_dirty: bool) -> None:
+    def __init__(self, modules: Dict[str, MypyFile], quick_and_dirty: bool,
+                 index: Optional[FullnameIndex] = None) -> None:
         self.modules = modules
         self.quick_and_dirty = quick_and_dirty
+        self.index = index
+        # Resolved type_refs of instances
+        self.type_infos = {}  # type: Dict[str, TypeInfo]
 
     def visit_instance(self, inst: Instance) -> None:
-        # TODO: Combine Instances that are exactly the same?
+        # Identical instances are often shared (see Instance.deserialize), so
+        # many instances have been fixed up already.
         type_ref = inst.type_ref
         if type_ref is None:
             return  # We've already been here.
         inst.type_ref = None
-        inst.type = lookup_qualified_typeinfo(self.modules, type_ref, self.quick_and_dirty)
+        info = self.type_infos.get(type_ref)
+        if info is None:
+            info = lookup_qualified_typeinfo(self.modules, type_ref, self.quick_and_dirty,
+                                             self.index)
+            self.type_infos[type_ref] = info
+        inst.type = info
         # TODO: Is this needed or redundant?
         # Also fix up the bases, just in case.
         for base in inst.type.bases:
@@ -236,8 +249,9 @@ class TypeFixer(TypeVisitor[None]):
 
 
 def lookup_qualified_typeinfo(modules: Dict[str, MypyFile], name: str,
-                              quick_and_dirty: bool) -> TypeInfo:
-    node = lookup_qualified(modules, name, quick_and_dirty)
+                              quick_and_dirty: bool,
+                              index: Optional[FullnameIndex] = None) -> TypeInfo:
+    node = lookup_qualified(modules, name, quick_and_dirty, index)
     if isinstance(node, TypeInfo):
         return node
     else:
@@ -250,8 +264,9 @@ def lookup_qualified_typeinfo(modules: Dict[str, MypyFile], name: str,
 
 
 def lookup_qualified(modules: Dict[str, MypyFile], name: str,
-                     quick_and_dirty: bool) -> Optional[SymbolNode]:
-    stnode = lookup_qualified_stnode(modules, name, quick_and_dirty)
+                     quick_and_dirty: bool,
+                     index: Optional[FullnameIndex] = None) -> Optional[SymbolNode]:
+    stnode = lookup_qualified_stnode(modules, name, quick_and_dirty, index)
     if stnode is None:
         return None
     else:
@@ -259,8 +274,10 @@ def lookup_qualified(modules: Dict[str, MypyFile], name: str,
 
 
 def lookup_qualified_stnode(modules: Dict[str, MypyFile], name: str,
-                            quick_and_dirty: bool) -> Optional[SymbolTableNode]:
-    return lookup_fully_qualified(name, modules, raise_on_missing=not quick_and_dirty)
+                            quick_and_dirty: bool,
+                            index: Optional[FullnameIndex] = None) -> Optional[SymbolTableNode]:
+    return lookup_fully_qualified(name, modules, raise_on_missing=not quick_and_dirty,
+                                  index=index)
 
 
 def stale_info(modules: Dict[str, MypyFile]) -> TypeInfo:
@@ -7,6 +7,7 @@ from mypy.types import (
     Type, AnyType, NoneTyp, TypeVisitor, Instance, UnboundType, TypeVarType, CallableType,
     TupleType, TypedDictType, ErasedType, UnionType, FunctionLike, Overloaded, LiteralType,
     PartialType, DeletedType, UninhabitedType, TypeType, true_or_false, TypeOfAny,
+    interned_any_type, interned_instance
 )
 from mypy.maptype import map_instance_to_supertype
 from mypy.subtypes import (
@@ -101,7 +102,7 @@ class TypeJoinVisitor(TypeVisitor[Type]):
         self.s = s
 
     def visit_unbound_type(self, t: UnboundType) -> Type:
-        return AnyType(TypeOfAny.special_form)
+        return interned_any_type(TypeOfAny.special_form)
 
     def visit_union_type(self, t: UnionType) -> Type:
         if is_subtype(self.s, t):
@@ -117,7 +118,7 @@ class TypeJoinVisitor(TypeVisitor[Type]):
             if isinstance(self.s, (NoneTyp, UninhabitedType)):
                 return t
             elif isinstance(self.s, UnboundType):
-                return AnyType(TypeOfAny.special_form)
+                return interned_any_type(TypeOfAny.special_form)
             else:
                 return UnionType.make_simplified_union([self.s, t])
         else:
@@ -297,7 +298,7 @@ class TypeJoinVisitor(TypeVisitor[Type]):
         if isinstance(typ, Instance):
             return object_from_instance(typ)
         elif isinstance(typ, UnboundType):
-            return AnyType(TypeOfAny.special_form)
+            return interned_any_type(TypeOfAny.special_form)
         elif isinstance(typ, TupleType):
             return self.default(typ.fallback)
         elif isinstance(typ, TypedDictType):
@@ -307,7 +308,7 @@ class TypeJoinVisitor(TypeVisitor[Type]):
         elif isinstance(typ, TypeVarType):
             return self.default(typ.upper_bound)
         else:
-            return AnyType(TypeOfAny.special_form)
+            return interned_any_type(TypeOfAny.special_form)
 
 
 def join_instances(t: Instance, s: Instance) -> Type:
@@ -444,7 +445,7 @@ def combine_arg_names(t: CallableType, s: CallableType) -> List[Optional[str]]:
 def object_from_instance(instance: Instance) -> Instance:
     """Construct the type 'builtins.object' from an instance type."""
     # Use the fact that 'object' is always the last class in the mro.
-    res = Instance(instance.type.mro[-1], [])
+    res = interned_instance(instance.type.mro[-1])
     return res
 
 
@@ -4,22 +4,96 @@ functions that will find a semantic node by its name.
 """
 
 from mypy.nodes import MypyFile, SymbolTableNode, TypeInfo
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 # TODO: gradually move existing lookup functions to this module.
 
 
+class FullnameIndex:
+    """Find symbols by fully qualified name without searching for the module.
+
+    The index maps the fully qualified names of module-level symbols and of
+    nested classes to the module or class whose symbol table contains the
+    name. It is updated when a module has been loaded from the cache or
+    analyzed. Each entry is checked when it is used, so an entry for a module
+    that has been removed or replaced, or for a class that is no longer
+    defined, is never used.
+    """
+
+    def __init__(self, modules: Dict[str, MypyFile]) -> None:
+        self.modules = modules
+        # Map fullname to the module or class and the key in its symbol table
+        self.entries = {}  # type: Dict[str, Tuple[Union[MypyFile, TypeInfo], str]]
+        # Names of the entries added for each module
+        self.module_entries = {}  # type: Dict[str, List[str]]
+
+    def add_module(self, tree: MypyFile) -> None:
+        """Add (or replace) the entries for the symbols defined in a module."""
+        self.remove_module(tree._fullname)
+        added = []  # type: List[str]
+        for key, stnode in tree.names.items():
+            fullname = tree._fullname + '.' + key
+            self.entries[fullname] = (tree, key)
+            added.append(fullname)
+            node = stnode.node
+            if isinstance(node, TypeInfo) and node._fullname == fullname:
+                self.add_nested_classes(node, added)
+        self.module_entries[tree._fullname] = added
+
+    def add_nested_classes(self, info: TypeInfo, added: List[str]) -> None:
+        for key, stnode in info.names.items():
+            node = stnode.node
+            fullname = info._fullname + '.' + key
+            if (isinstance(node, TypeInfo) and node._fullname == fullname
+                    and fullname not in self.entries):
+                self.entries[fullname] = (info, key)
+                added.append(fullname)
+                self.add_nested_classes(node, added)
+
+    def remove_module(self, id: str) -> None:
+        for fullname in self.module_entries.pop(id, []):
+            self.entries.pop(fullname, None)
+
+    def lookup(self, fullname: str, module_level: bool = False) -> Optional[SymbolTableNode]:
+        """Find a symbol by its fully qualified name.
+
+        Return None if the name is not in the index or the entry is out of date.
+        If module_level is True, also return None for names nested in classes.
+        """
+        entry = self.entries.get(fullname)
+        if entry is None:
+            return None
+        container, key = entry
+        if module_level and not isinstance(container, MypyFile):
+            return None
+        if isinstance(container, MypyFile):
+            if self.modules.get(container._fullname) is not container:
+                return None
+        else:
+            parent = self.lookup(container._fullname)
+            if parent is None or parent.node is not container:
+                return None
+        return container.names.get(key)
+
+
 def lookup_fully_qualified(name: str, modules: Dict[str, MypyFile],
-                           raise_on_missing: bool = False) -> Optional[SymbolTableNode]:
+                           raise_on_missing: bool = False,
+                           index: Optional[FullnameIndex] = None) -> Optional[SymbolTableNode]:
     """Find a symbol using it fully qualified name.
 
-    The algorithm has two steps: first we try splitting the name on '.' to find
-    the module, then iteratively look for each next chunk after a '.' (e.g. for
-    nested classes).
+    If an index is given, look for the name in the index first.
+
+    Otherwise the algorithm has two steps: first we try splitting the name on '.'
+    to find the module, then iteratively look for each next chunk after a '.'
+    (e.g. for nested classes).
 
     This function should *not* be used to find a module. Those should be looked
     in the modules dictionary.
     """
+    if index is not None:
+        stnode = index.lookup(name)
+        if stnode is not None:
+            return stnode
     head = name
     rest = []
     # 1. Find a module tree in modules dictionary.
@@ -20,6 +20,7 @@ from mypy.find_sources import create_source_list, InvalidSourceList
 from mypy.fscache import FileSystemCache
 from mypy.errors import CompileError
 from mypy.options import Options, BuildType, PER_MODULE_OPTIONS
+from mypy.profiler import is_profiling_supported
 
 from mypy.version import __version__
 
@@ -383,6 +384,10 @@ def process_options(args: List[str],
     imports_group.add_argument(
         '--follow-imports', choices=['normal', 'silent', 'skip', 'error'],
         default='normal', help="How to treat imports (default normal)")
+    add_invertible_flag(
+        '--follow-imports-interface-only', default=False,
+        help="Skip function bodies in modules followed with --follow-imports=silent",
+        group=imports_group)
     imports_group.add_argument(
         '--python-executable', action='store', metavar='EXECUTABLE',
         help="Python executable used for finding PEP 561 compliant installed"
@@ -578,6 +583,17 @@ def process_options(args: List[str],
              "the contents of SHADOW_FILE instead.")
     add_invertible_flag('--fast-exit', default=False, help=argparse.SUPPRESS,
                         group=internals_group)
+    internals_group.add_argument(
+        '--parse-workers', metavar='N', type=int, default=0,
+        help="Parse files in N worker processes while loading the import graph")
+    internals_group.add_argument(
+        '--profile-output', metavar='FILE',
+        help="Sample the call stack during the build and write the samples "
+             "to FILE in collapsed stack format, for use with flame graph tools")
+    add_invertible_flag('--semantic-analysis-worklist', default=False,
+                        help="Only revisit nodes recorded by semantic analysis pass 2 "
+                             "in pass 3, instead of traversing each file again",
+                        group=internals_group)
 
     error_group = parser.add_argument_group(
         title='Error reporting',
@@ -589,6 +605,9 @@ def process_options(args: List[str],
     add_invertible_flag('--show-column-numbers', default=False,
                         help="Show column numbers in error messages",
                         group=error_group)
+    error_group.add_argument(
+        '--error-format', choices=['text', 'json'], default='text',
+        help="Report errors as text or as JSON objects, one per line (default text)")
 
     strict_help = "Strict mode; enables the following flags: {}".format(
         ", ".join(strict_flag_names))
@@ -603,6 +622,9 @@ def process_options(args: List[str],
         report_group.add_argument('--%s-report' % report_type.replace('_', '-'),
                                   metavar='DIR',
                                   dest='special-opts:%s_report' % report_type)
+    report_group.add_argument(
+        '--report-workers', metavar='N', type=int, default=0,
+        help="Convert reports to HTML in N worker processes")
 
     other_group = parser.add_argument_group(
         title='Miscellaneous')
@@ -635,6 +657,8 @@ def process_options(args: List[str],
     # which will make the cache writing process output pretty-printed JSON (which
     # is easier to debug).
     parser.add_argument('--debug-cache', action='store_true', help=argparse.SUPPRESS)
+    # --debug-reports validates the XML of reports against the schema.
+    parser.add_argument('--debug-reports', action='store_true', help=argparse.SUPPRESS)
     # --dump-deps will dump all fine-grained dependencies to stdout
     parser.add_argument('--dump-deps', action='store_true', help=argparse.SUPPRESS)
     # --dump-graph will dump the contents of the graph of SCCs and exit.
@@ -747,6 +771,9 @@ def process_options(args: List[str],
         if len(state.find_occurrences) != 2:
             parser.error("Can only find occurrences of non-nested class members.")
 
+    if options.profile_output and not is_profiling_supported():
+        parser.error("--profile-output is not supported on this platform")
+
     # Set reports.
     for flag, val in vars(special_opts).items():
         if flag.endswith('_report') and val is not None:
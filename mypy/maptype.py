@@ -2,7 +2,9 @@ from typing import Dict, List
 
 from mypy.expandtype import expand_type
 from mypy.nodes import TypeInfo
-from mypy.types import Type, TypeVarId, Instance, AnyType, TypeOfAny
+from mypy.types import (
+    Type, TypeVarId, Instance, AnyType, TypeOfAny, interned_any_type, interned_instance
+)
 
 
 def map_instance_to_supertype(instance: Instance,
@@ -19,7 +21,7 @@ def map_instance_to_supertype(instance: Instance,
 
     if not superclass.type_vars:
         # Fast path: `superclass` has no type variables to map to.
-        return Instance(superclass, [])
+        return interned_instance(superclass)
 
     return map_instance_to_supertypes(instance, superclass)[0]
 
@@ -41,8 +43,8 @@ def map_instance_to_supertypes(instance: Instance,
         return result
     else:
         # Nothing. Presumably due to an error. Construct a dummy using Any.
-        any_type = AnyType(TypeOfAny.from_error)
-        return [Instance(supertype, [any_type] * len(supertype.type_vars))]
+        any_type = interned_any_type(TypeOfAny.from_error)
+        return [interned_instance(supertype, [any_type] * len(supertype.type_vars))]
 
 
 def class_derivation_paths(typ: TypeInfo,
@@ -88,8 +90,8 @@ def map_instance_to_direct_supertypes(instance: Instance,
     else:
         # Relationship with the supertype not specified explicitly. Use dynamic
         # type arguments implicitly.
-        any_type = AnyType(TypeOfAny.unannotated)
-        return [Instance(supertype, [any_type] * len(supertype.type_vars))]
+        any_type = interned_any_type(TypeOfAny.unannotated)
+        return [interned_instance(supertype, [any_type] * len(supertype.type_vars))]
 
 
 def instance_to_type_environment(instance: Instance) -> Dict[TypeVarId, Type]:
@@ -8,6 +8,7 @@ from mypy.types import (
     Type, AnyType, TypeVisitor, UnboundType, NoneTyp, TypeVarType, Instance, CallableType,
     TupleType, TypedDictType, ErasedType, UnionType, PartialType, DeletedType,
     UninhabitedType, TypeType, TypeOfAny, Overloaded, FunctionLike, LiteralType,
+    interned_any_type, interned_none_type
 )
 from mypy.subtypes import (
     is_equivalent, is_subtype, is_protocol_implementation, is_callable_compatible,
@@ -43,7 +44,7 @@ def narrow_declared_type(declared: Type, narrowed: Type) -> Type:
         if state.strict_optional:
             return UninhabitedType()
         else:
-            return NoneTyp()
+            return interned_none_type()
     elif isinstance(narrowed, UnionType):
         return UnionType.make_simplified_union([narrow_declared_type(declared, x)
                                                 for x in narrowed.relevant_items()])
@@ -362,13 +363,13 @@ class TypeMeetVisitor(TypeVisitor[Type]):
     def visit_unbound_type(self, t: UnboundType) -> Type:
         if isinstance(self.s, NoneTyp):
             if state.strict_optional:
-                return AnyType(TypeOfAny.special_form)
+                return interned_any_type(TypeOfAny.special_form)
             else:
                 return self.s
         elif isinstance(self.s, UninhabitedType):
             return self.s
         else:
-            return AnyType(TypeOfAny.special_form)
+            return interned_any_type(TypeOfAny.special_form)
 
     def visit_any(self, t: AnyType) -> Type:
         return self.s
@@ -432,7 +433,7 @@ class TypeMeetVisitor(TypeVisitor[Type]):
                     if state.strict_optional:
                         return UninhabitedType()
                     else:
-                        return NoneTyp()
+                        return interned_none_type()
             else:
                 if is_subtype(t, self.s):
                     return t
@@ -443,7 +444,7 @@ class TypeMeetVisitor(TypeVisitor[Type]):
                     if state.strict_optional:
                         return UninhabitedType()
                     else:
-                        return NoneTyp()
+                        return interned_none_type()
         elif isinstance(self.s, FunctionLike) and t.type.is_protocol:
             call = unpack_callback_protocol(t)
             if call:
@@ -556,12 +557,12 @@ class TypeMeetVisitor(TypeVisitor[Type]):
 
     def default(self, typ: Type) -> Type:
         if isinstance(typ, UnboundType):
-            return AnyType(TypeOfAny.special_form)
+            return interned_any_type(TypeOfAny.special_form)
         else:
             if state.strict_optional:
                 return UninhabitedType()
             else:
-                return NoneTyp()
+                return interned_none_type()
 
 
 def meet_similar_callables(t: CallableType, s: CallableType) -> CallableType:
@@ -25,6 +25,10 @@ def collect_memory_stats() -> Tuple[Dict[str, int],
     find_recursive_objects(objs)
 
     inferred = {}
+    # Instance dicts not in objs. Since Python 3.11, the dict of an instance may only be
+    # created when it's accessed, so it wouldn't be included otherwise.
+    seen = {id(obj) for obj in objs}
+    dicts = []
     for obj in objs:
         if type(obj) is FakeInfo:
             # Processing these would cause a crash.
@@ -33,22 +37,24 @@ def collect_memory_stats() -> Tuple[Dict[str, int],
         if hasattr(obj, '__dict__'):
             # Keep track of which class a particular __dict__ is associated with.
             inferred[id(obj.__dict__)] = '%s (__dict__)' % n
+            if id(obj.__dict__) not in seen:
+                dicts.append(obj.__dict__)
         if isinstance(obj, (Node, Type)):
             if hasattr(obj, '__dict__'):
                 for x in obj.__dict__.values():
-                    if isinstance(x, list):
+                    if type(x) is list:
                         # Keep track of which node a list is associated with.
                         inferred[id(x)] = '%s (list)' % n
             else:
                 for base in type.mro(type(obj)):
                     for k in getattr(base, '__slots__', ()):
                         x = getattr(obj, k, None)
-                        if isinstance(x, list):
+                        if type(x) is list:
                             inferred[id(x)] = '%s (list)' % n
 
     freqs = {}  # type: Dict[str, int]
     memuse = {}  # type: Dict[str, int]
-    for obj in objs:
+    for obj in objs + dicts:
         if id(obj) in inferred:
             name = inferred[id(obj)]
         else:
@@ -11,14 +11,17 @@ checker but we are moving away from this convention.
 """
 
 from collections import OrderedDict
+from contextlib import contextmanager
 import re
 import difflib
 from textwrap import dedent
 
-from typing import cast, List, Dict, Any, Sequence, Iterable, Tuple, Set, Optional, Union
+from typing import (
+    cast, List, Dict, Any, Sequence, Iterable, Iterator, Tuple, Set, Optional, Union, Callable
+)
 
 from mypy.erasetype import erase_type
-from mypy.errors import Errors
+from mypy.errors import Errors, ErrorInfo, LazyMessage
 from mypy.types import (
     Type, CallableType, Instance, TypeVarType, TupleType, TypedDictType, LiteralType,
     UnionType, NoneTyp, AnyType, Overloaded, FunctionLike, DeletedType, TypeType,
@@ -173,6 +176,44 @@ ARG_CONSTRUCTOR_NAMES = {
 }  # type: Final
 
 
+# Arguments of a MessageBuilder.report() call: (message, context, severity, file, origin, offset)
+ReportArgs = Tuple[LazyMessage, Optional[Context], str, Optional[str], Optional[Context], int]
+
+
+class Speculation:
+    """Errors reported while something is checked speculatively.
+
+    See MessageBuilder.speculate(). Only whether anything was reported and the
+    first report are recorded, unless the speculation records all reports so
+    that they can be committed afterwards. Messages that are never committed
+    are never constructed.
+    """
+
+    def __init__(self, builder: 'MessageBuilder', record: bool) -> None:
+        self.builder = builder
+        self.record = record
+        self.has_errors = False
+        self.first = None  # type: Optional[Union[ReportArgs, ErrorInfo]]
+        self.reports = []  # type: List[Union[ReportArgs, ErrorInfo]]
+
+    def add(self, report: Union[ReportArgs, ErrorInfo]) -> None:
+        if not self.has_errors:
+            self.has_errors = True
+            self.first = report
+        if self.record:
+            self.reports.append(report)
+
+    def commit(self) -> None:
+        """Report the recorded errors through the builder."""
+        assert self.record, 'Only recording speculations can be committed'
+        for report in self.reports:
+            if isinstance(report, ErrorInfo):
+                self.builder.add_error_info(report)
+            else:
+                self.builder.report(*report)
+        self.reports = []
+
+
 class MessageBuilder:
     """Helper class for reporting type checker error messages with parameters.
 
@@ -196,18 +237,26 @@ class MessageBuilder:
     # Hack to deduplicate error messages from union types
     disable_type_names = 0
 
+    # Active speculations, innermost last (see speculate())
+    speculations = None  # type: List[Speculation]
+
     def __init__(self, errors: Errors, modules: Dict[str, MypyFile]) -> None:
         self.errors = errors
         self.modules = modules
         self.disable_count = 0
         self.disable_type_names = 0
+        self.speculations = []
 
     #
     # Helpers
     #
 
     def copy(self) -> 'MessageBuilder':
-        new = MessageBuilder(self.errors.copy(), self.modules)
+        if self.speculations:
+            # Errors reported before the speculation started aren't visible in it.
+            new = self.clean_copy()
+        else:
+            new = MessageBuilder(self.errors.copy(), self.modules)
         new.disable_count = self.disable_count
         new.disable_type_names = self.disable_type_names
         return new
@@ -217,12 +266,42 @@ class MessageBuilder:
         errors.error_info_map = OrderedDict()
         return MessageBuilder(errors, self.modules)
 
+    @contextmanager
+    def speculate(self, record: bool = False) -> Iterator[Speculation]:
+        """Check something speculatively, such as an overload item.
+
+        Errors reported through this builder within the block are recorded in
+        the returned Speculation instead of being reported. This is much cheaper
+        than checking with a clean_copy() of the builder, since no error
+        information is created. The errors are discarded unless the
+        speculation is created with record=True and committed.
+
+        Like with a clean copy, errors aren't disabled within the block, but
+        errors disabled within the block with disable_errors() aren't recorded.
+        """
+        speculation = Speculation(self, record)
+        disable_count, disable_type_names = self.disable_count, self.disable_type_names
+        self.disable_count = self.disable_type_names = 0
+        self.speculations.append(speculation)
+        try:
+            yield speculation
+        finally:
+            self.speculations.pop()
+            self.disable_count, self.disable_type_names = disable_count, disable_type_names
+
     def add_errors(self, messages: 'MessageBuilder') -> None:
         """Add errors in messages to this builder."""
-        if self.disable_count <= 0:
-            for errs in messages.errors.error_info_map.values():
-                for info in errs:
-                    self.errors.add_error_info(info)
+        for errs in messages.errors.error_info_map.values():
+            for info in errs:
+                self.add_error_info(info)
+
+    def add_error_info(self, info: ErrorInfo) -> None:
+        if self.disable_count > 0:
+            return
+        if self.speculations:
+            self.speculations[-1].add(info)
+        else:
+            self.errors.add_error_info(info)
 
     def disable_errors(self) -> None:
         self.disable_count += 1
@@ -231,24 +310,30 @@ class MessageBuilder:
         self.disable_count -= 1
 
     def is_errors(self) -> bool:
+        if self.speculations:
+            return self.speculations[-1].has_errors
         return self.errors.is_errors()
 
-    def report(self, msg: str, context: Optional[Context], severity: str,
+    def report(self, msg: LazyMessage, context: Optional[Context], severity: str,
                file: Optional[str] = None, origin: Optional[Context] = None,
                offset: int = 0) -> None:
         """Report an error or note (unless disabled)."""
-        if self.disable_count <= 0:
+        if self.disable_count > 0:
+            return
+        if self.speculations:
+            self.speculations[-1].add((msg, context, severity, file, origin, offset))
+        else:
             self.errors.report(context.get_line() if context else -1,
                                context.get_column() if context else -1,
                                msg, severity=severity, file=file, offset=offset,
                                origin_line=origin.get_line() if origin else None)
 
-    def fail(self, msg: str, context: Optional[Context], file: Optional[str] = None,
+    def fail(self, msg: LazyMessage, context: Optional[Context], file: Optional[str] = None,
              origin: Optional[Context] = None) -> None:
         """Report an error message (unless disabled)."""
         self.report(msg, context, 'error', file=file, origin=origin)
 
-    def note(self, msg: str, context: Context, file: Optional[str] = None,
+    def note(self, msg: LazyMessage, context: Context, file: Optional[str] = None,
              origin: Optional[Context] = None, offset: int = 0) -> None:
         """Report a note (unless disabled)."""
         self.report(msg, context, 'note', file=file, origin=origin,
@@ -261,7 +346,7 @@ class MessageBuilder:
             self.report(msg, context, 'note', file=file, origin=origin,
                         offset=offset)
 
-    def warn(self, msg: str, context: Context, file: Optional[str] = None,
+    def warn(self, msg: LazyMessage, context: Context, file: Optional[str] = None,
              origin: Optional[Context] = None) -> None:
         """Report a warning message (unless disabled)."""
         self.report(msg, context, 'warning', file=file, origin=origin)
@@ -533,33 +618,37 @@ class MessageBuilder:
             elif member == '__aiter__':
                 extra = ' (not async iterable)'
             if not self.disable_type_names:
-                failed = False
-                if isinstance(original_type, Instance) and original_type.type.names:
-                    alternatives = set(original_type.type.names.keys())
-                    matches = [m for m in COMMON_MISTAKES.get(member, []) if m in alternatives]
-                    matches.extend(best_matches(member, alternatives)[:3])
-                    if member == '__aiter__' and matches == ['__iter__']:
-                        matches = []  # Avoid misleading suggestion
-                    if member == '__div__' and matches == ['__truediv__']:
-                        # TODO: Handle differences in division between Python 2 and 3 more cleanly
-                        matches = []
-                    if matches:
-                        self.fail('{} has no attribute "{}"; maybe {}?{}'.format(
-                            self.format(original_type), member, pretty_or(matches), extra),
-                            context)
-                        failed = True
-                if not failed:
-                    self.fail('{} has no attribute "{}"{}'.format(self.format(original_type),
-                                                                  member, extra), context)
+                def format_missing_attribute() -> str:
+                    if isinstance(original_type, Instance) and original_type.type.names:
+                        alternatives = set(original_type.type.names.keys())
+                        matches = [m for m in COMMON_MISTAKES.get(member, [])
+                                   if m in alternatives]
+                        matches.extend(best_matches(member, alternatives)[:3])
+                        if member == '__aiter__' and matches == ['__iter__']:
+                            matches = []  # Avoid misleading suggestion
+                        if member == '__div__' and matches == ['__truediv__']:
+                            # TODO: Handle differences in division between Python 2 and 3
+                            # more cleanly
+                            matches = []
+                        if matches:
+                            return '{} has no attribute "{}"; maybe {}?{}'.format(
+                                self.format(original_type), member, pretty_or(matches), extra)
+                    return '{} has no attribute "{}"{}'.format(self.format(original_type),
+                                                               member, extra)
+                self.fail(format_missing_attribute, context)
             elif isinstance(original_type, UnionType):
-                # The checker passes "object" in lieu of "None" for attribute
-                # checks, so we manually convert it back.
-                typ_format = self.format(typ)
-                if typ_format == '"object"' and \
-                        any(type(item) == NoneTyp for item in original_type.items):
-                    typ_format = '"None"'
-                self.fail('Item {} of {} has no attribute "{}"{}'.format(
-                    typ_format, self.format(original_type), member, extra), context)
+                union_type = original_type
+
+                def format_missing_item_attribute() -> str:
+                    # The checker passes "object" in lieu of "None" for attribute
+                    # checks, so we manually convert it back.
+                    typ_format = self.format(typ)
+                    if typ_format == '"object"' and \
+                            any(type(item) == NoneTyp for item in union_type.items):
+                        typ_format = '"None"'
+                    return 'Item {} of {} has no attribute "{}"{}'.format(
+                        typ_format, self.format(union_type), member, extra)
+                self.fail(format_missing_item_attribute, context)
         return AnyType(TypeOfAny.from_error)
 
     def unsupported_operand_types(self, op: str, left_type: Any,
@@ -568,36 +657,28 @@ class MessageBuilder:
 
         Types can be Type objects or strings.
         """
-        left_str = ''
-        if isinstance(left_type, str):
-            left_str = left_type
-        else:
-            left_str = self.format(left_type)
-
-        right_str = ''
-        if isinstance(right_type, str):
-            right_str = right_type
-        else:
-            right_str = self.format(right_type)
-
         if self.disable_type_names:
-            msg = 'Unsupported operand types for {} (likely involving Union)'.format(op)
+            self.fail('Unsupported operand types for {} (likely involving Union)'.format(op),
+                      context)
         else:
-            msg = 'Unsupported operand types for {} ({} and {})'.format(
-                op, left_str, right_str)
-        self.fail(msg, context)
+            self.fail(lambda: 'Unsupported operand types for {} ({} and {})'.format(
+                op, self.format_operand(left_type), self.format_operand(right_type)), context)
+
+    def format_operand(self, typ: Union[Type, str]) -> str:
+        if isinstance(typ, str):
+            return typ
+        return self.format(typ)
 
     def unsupported_left_operand(self, op: str, typ: Type,
                                  context: Context) -> None:
         if self.disable_type_names:
-            msg = 'Unsupported left operand type for {} (some union)'.format(op)
+            self.fail('Unsupported left operand type for {} (some union)'.format(op), context)
         else:
-            msg = 'Unsupported left operand type for {} ({})'.format(
-                op, self.format(typ))
-        self.fail(msg, context)
+            self.fail(lambda: 'Unsupported left operand type for {} ({})'.format(
+                op, self.format(typ)), context)
 
     def not_callable(self, typ: Type, context: Context) -> Type:
-        self.fail('{} not callable'.format(self.format(typ)), context)
+        self.fail(lambda: '{} not callable'.format(self.format(typ)), context)
         return AnyType(TypeOfAny.from_error)
 
     def untyped_function_call(self, callee: CallableType, context: Context) -> Type:
@@ -619,7 +700,7 @@ class MessageBuilder:
         if callee_name is not None:
             name = callee_name
             if callee.bound_args and callee.bound_args[0] is not None:
-                base = self.format(callee.bound_args[0])
+                base = callee.bound_args[0]  # type: Union[Type, str]
             else:
                 base = extract_type(name)
 
@@ -644,24 +725,49 @@ class MessageBuilder:
                 if n == 1:
                     self.invalid_index_type(arg_type, callee.arg_types[n - 1], base, context)
                 else:
-                    msg = '{} (expression has type {}, target has type {})'
-                    arg_type_str, callee_type_str = self.format_distinctly(arg_type,
-                                                                           callee.arg_types[n - 1])
-                    self.fail(msg.format(INCOMPATIBLE_TYPES_IN_ASSIGNMENT,
-                                         arg_type_str, callee_type_str),
-                              context)
+                    target_type = callee.arg_types[n - 1]
+
+                    def format_setitem() -> str:
+                        arg_type_str, callee_type_str = self.format_distinctly(arg_type,
+                                                                               target_type)
+                        return '{} (expression has type {}, target has type {})'.format(
+                            INCOMPATIBLE_TYPES_IN_ASSIGNMENT, arg_type_str, callee_type_str)
+                    self.fail(format_setitem, context)
                 return
 
             target = 'to {} '.format(name)
 
-        msg = ''
         notes = []  # type: List[str]
+        if callee_name not in ('<list>', '<dict>', '<list-comprehension>',
+                               '<set-comprehension>', '<dictionary-comprehension>',
+                               '<generator>'):
+            expected_type = self.expected_argument_type(m, callee)
+            if isinstance(arg_type, Instance) and isinstance(expected_type, Instance):
+                notes = append_invariance_notes(notes, arg_type, expected_type)
+        self.fail(lambda: self.format_incompatible_argument(n, m, callee, arg_type, arg_kind,
+                                                            target, context),
+                  context)
+        if notes:
+            for note_msg in notes:
+                self.note(note_msg, context)
+
+    def expected_argument_type(self, m: int, callee: CallableType) -> Type:
+        try:
+            return callee.arg_types[m - 1]
+        except IndexError:  # Varargs callees
+            return callee.arg_types[-1]
+
+    def format_incompatible_argument(self, n: int, m: int, callee: CallableType,
+                                     arg_type: Type, arg_kind: int, target: str,
+                                     context: Context) -> str:
+        """Format the message for incompatible_argument()."""
+        callee_name = callable_name(callee)
         if callee_name == '<list>':
             name = callee_name[1:-1]
             n -= 1
             actual_type_str, expected_type_str = self.format_distinctly(arg_type,
                                                                         callee.arg_types[0])
-            msg = '{} item {} has incompatible type {}; expected {}'.format(
+            return '{} item {} has incompatible type {}; expected {}'.format(
                 name.title(), n, actual_type_str, expected_type_str)
         elif callee_name == '<dict>':
             name = callee_name[1:-1]
@@ -684,39 +790,36 @@ class MessageBuilder:
                 value_type_str, expected_value_type_str = self.format_distinctly(
                     value_type, expected_value_type)
 
-            msg = '{} entry {} has incompatible type {}: {}; expected {}: {}'.format(
+            return '{} entry {} has incompatible type {}: {}; expected {}: {}'.format(
                 name.title(), n, key_type_str, value_type_str,
                 expected_key_type_str, expected_value_type_str)
         elif callee_name == '<list-comprehension>':
             actual_type_str, expected_type_str = map(strip_quotes,
                                                      self.format_distinctly(arg_type,
                                                                             callee.arg_types[0]))
-            msg = 'List comprehension has incompatible type List[{}]; expected List[{}]'.format(
+            return 'List comprehension has incompatible type List[{}]; expected List[{}]'.format(
                 actual_type_str, expected_type_str)
         elif callee_name == '<set-comprehension>':
             actual_type_str, expected_type_str = map(strip_quotes,
                                                      self.format_distinctly(arg_type,
                                                                             callee.arg_types[0]))
-            msg = 'Set comprehension has incompatible type Set[{}]; expected Set[{}]'.format(
+            return 'Set comprehension has incompatible type Set[{}]; expected Set[{}]'.format(
                 actual_type_str, expected_type_str)
         elif callee_name == '<dictionary-comprehension>':
             actual_type_str, expected_type_str = self.format_distinctly(arg_type,
                                                                         callee.arg_types[n - 1])
-            msg = ('{} expression in dictionary comprehension has incompatible type {}; '
-                   'expected type {}').format(
+            return ('{} expression in dictionary comprehension has incompatible type {}; '
+                    'expected type {}').format(
                 'Key' if n == 1 else 'Value',
                 actual_type_str,
                 expected_type_str)
         elif callee_name == '<generator>':
             actual_type_str, expected_type_str = self.format_distinctly(arg_type,
                                                                         callee.arg_types[0])
-            msg = 'Generator has incompatible item type {}; expected {}'.format(
+            return 'Generator has incompatible item type {}; expected {}'.format(
                 actual_type_str, expected_type_str)
         else:
-            try:
-                expected_type = callee.arg_types[m - 1]
-            except IndexError:  # Varargs callees
-                expected_type = callee.arg_types[-1]
+            expected_type = self.expected_argument_type(m, callee)
             arg_type_str, expected_type_str = self.format_distinctly(
                 arg_type, expected_type, bare=True)
             if arg_kind == ARG_STAR:
@@ -744,20 +847,15 @@ class MessageBuilder:
                     expected_type,
                     bare=True)
                 arg_label = '"{}"'.format(arg_name)
-            msg = 'Argument {} {}has incompatible type {}; expected {}'.format(
+            return 'Argument {} {}has incompatible type {}; expected {}'.format(
                 arg_label, target, self.quote_type_string(arg_type_str),
                 self.quote_type_string(expected_type_str))
-            if isinstance(arg_type, Instance) and isinstance(expected_type, Instance):
-                notes = append_invariance_notes(notes, arg_type, expected_type)
-        self.fail(msg, context)
-        if notes:
-            for note_msg in notes:
-                self.note(note_msg, context)
 
-    def invalid_index_type(self, index_type: Type, expected_type: Type, base_str: str,
+    def invalid_index_type(self, index_type: Type, expected_type: Type, base: Union[Type, str],
                            context: Context) -> None:
-        self.fail('Invalid index type {} for {}; expected type {}'.format(
-            self.format(index_type), base_str, self.format(expected_type)), context)
+        self.fail(lambda: 'Invalid index type {} for {}; expected type {}'.format(
+            self.format(index_type), self.format_operand(base), self.format(expected_type)),
+            context)
 
     def too_few_arguments(self, callee: CallableType, context: Context,
                           argument_names: Optional[Sequence[Optional[str]]]) -> None:
@@ -862,17 +960,17 @@ class MessageBuilder:
             name_str = ' of {}'.format(name)
         else:
             name_str = ''
-        arg_types_str = ', '.join(self.format(arg) for arg in arg_types)
         num_args = len(arg_types)
         if num_args == 0:
             self.fail('All overload variants{} require at least one argument'.format(name_str),
                       context)
         elif num_args == 1:
-            self.fail('No overload variant{} matches argument type {}'
-                      .format(name_str, arg_types_str), context)
+            self.fail(lambda: 'No overload variant{} matches argument type {}'
+                      .format(name_str, self.format(arg_types[0])), context)
         else:
-            self.fail('No overload variant{} matches argument types {}'
-                      .format(name_str, arg_types_str), context)
+            self.fail(lambda: 'No overload variant{} matches argument types {}'
+                      .format(name_str, ', '.join(self.format(arg) for arg in arg_types)),
+                      context)
 
         self.pretty_overload_matches(plausible_targets, overload, context, offset=2, max_items=2)
 
@@ -1726,7 +1824,7 @@ def append_invariance_notes(notes: List[str], arg_type: Instance,
 
 
 def make_inferred_type_note(context: Context, subtype: Type,
-                            supertype: Type, supertype_str: str) -> str:
+                            supertype: Type, format_supertype: Callable[[], str]) -> LazyMessage:
     """Explain that the user may have forgotten to type a variable.
 
     The user does not expect an error if the inferred container type is the same as the return
@@ -1748,8 +1846,8 @@ def make_inferred_type_note(context: Context, subtype: Type,
             if not is_subtype(subtype_arg, supertype_arg):
                 return ''
         var_name = context.expr.name
-        return 'Perhaps you need a type annotation for "{}"? Suggestion: {}'.format(
-            var_name, supertype_str)
+        return lambda: 'Perhaps you need a type annotation for "{}"? Suggestion: {}'.format(
+            var_name, format_supertype())
     return ''
 
 
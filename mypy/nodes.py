@@ -279,36 +279,44 @@ class MypyFile(SymbolNode):
         tree.path = data['path']
         tree.is_partial_stub_package = data['is_partial_stub_package']
         tree.is_cache_skeleton = True
+        # Private variables left out of interface-only cache files (see mypy.build)
+        for name, module_public in data.get('private_vars', {}).items():
+            var = Var(name)
+            var._fullname = tree._fullname + '.' + name
+            tree.names[name] = SymbolTableNode(GDEF, var, module_public=module_public)
         return tree
 
 
 class ImportBase(Statement):
     """Base class for all import statements."""
 
-    is_unreachable = False  # Set by semanal.SemanticAnalyzerPass1 if inside `if False` etc.
-    is_top_level = False  # Ditto if outside any class or def
-    is_mypy_only = False  # Ditto if inside `if TYPE_CHECKING` or `if MYPY`
-
-    # If an import replaces existing definitions, we construct dummy assignment
-    # statements that assign the imported names to the names in the current scope,
-    # for type checking purposes. Example:
-    #
-    #     x = 1
-    #     from m import x   <-- add assignment representing "x = m.x"
-    assignments = None  # type: List[AssignmentStmt]
+    __slots__ = ('is_unreachable', 'is_top_level', 'is_mypy_only', 'assignments')
 
     def __init__(self) -> None:
         super().__init__()
-        self.assignments = []
+        # If an import replaces existing definitions, we construct dummy assignment
+        # statements that assign the imported names to the names in the current scope,
+        # for type checking purposes. Example:
+        #
+        #     x = 1
+        #     from m import x   <-- add assignment representing "x = m.x"
+        self.assignments = []  # type: List[AssignmentStmt]
+        # Set by semanal.SemanticAnalyzerPass1 if inside `if False` etc.
+        self.is_unreachable = False
+        # Ditto if outside any class or def
+        self.is_top_level = False
+        # Ditto if inside `if TYPE_CHECKING` or `if MYPY`
+        self.is_mypy_only = False
 
 
 class Import(ImportBase):
     """import m [as n]"""
 
-    ids = None  # type: List[Tuple[str, Optional[str]]]     # (module id, as id)
+    __slots__ = ('ids',)
 
     def __init__(self, ids: List[Tuple[str, Optional[str]]]) -> None:
         super().__init__()
+        # (module id, as id)
         self.ids = ids
 
     def accept(self, visitor: StatementVisitor[T]) -> T:
@@ -318,13 +326,12 @@ class Import(ImportBase):
 class ImportFrom(ImportBase):
     """from m import x [as y], ..."""
 
-    id = None  # type: str
-    relative = None  # type: int
-    names = None  # type: List[Tuple[str, Optional[str]]]  # Tuples (name, as name)
+    __slots__ = ('id', 'relative', 'names')
 
     def __init__(self, id: str, relative: int, names: List[Tuple[str, Optional[str]]]) -> None:
         super().__init__()
         self.id = id
+        # Tuples (name, as name)
         self.names = names
         self.relative = relative
 
@@ -334,15 +341,14 @@ class ImportFrom(ImportBase):
 
 class ImportAll(ImportBase):
     """from m import *"""
-    id = None  # type: str
-    relative = None  # type: int
-    imported_names = None  # type: List[str]
+
+    __slots__ = ('id', 'relative', 'imported_names')
 
     def __init__(self, id: str, relative: int) -> None:
         super().__init__()
         self.id = id
         self.relative = relative
-        self.imported_names = []
+        self.imported_names = []  # type: List[str]
 
     def accept(self, visitor: StatementVisitor[T]) -> T:
         return visitor.visit_import_all(self)
@@ -360,6 +366,8 @@ class ImportedName(SymbolNode):
     can't be visited.
     """
 
+    __slots__ = ('target_fullname',)
+
     def __init__(self, target_fullname: str) -> None:
         super().__init__()
         self.target_fullname = target_fullname
@@ -437,15 +445,13 @@ class OverloadedFuncDef(FuncBase, SymbolNode, Statement):
     Overloaded variants must be consecutive in the source file.
     """
 
-    items = None  # type: List[OverloadPart]
-    unanalyzed_items = None  # type: List[OverloadPart]
-    impl = None  # type: Optional[OverloadPart]
+    __slots__ = ('items', 'unanalyzed_items', 'impl')
 
     def __init__(self, items: List['OverloadPart']) -> None:
         super().__init__()
         self.items = items
         self.unanalyzed_items = items.copy()
-        self.impl = None
+        self.impl = None  # type: Optional[OverloadPart]
         if len(items) > 0:
             self.set_line(items[0].line)
         self.is_final = False
@@ -658,17 +664,17 @@ class Decorator(SymbolNode, Statement):
     A single Decorator object can include any number of function decorators.
     """
 
-    func = None  # type: FuncDef                # Decorated function
-    decorators = None  # type: List[Expression] # Decorators (may be empty)
-    # TODO: This is mostly used for the type; consider replacing with a 'type' attribute
-    var = None  # type: Var                     # Represents the decorated function obj
-    is_overload = False
+    __slots__ = ('func', 'decorators', 'var', 'is_overload')
 
     def __init__(self, func: FuncDef, decorators: List[Expression],
                  var: 'Var') -> None:
         super().__init__()
+        # Decorated function
         self.func = func
+        # Decorators (may be empty)
         self.decorators = decorators
+        # TODO: This is mostly used for the type; consider replacing with a 'type' attribute
+        # Represents the decorated function obj
         self.var = var
         self.is_overload = False
 
@@ -814,20 +820,9 @@ class Var(SymbolNode):
 class ClassDef(Statement):
     """Class definition"""
 
-    name = None  # type: str       # Name of the class without module prefix
-    fullname = None  # type: Bogus[str]   # Fully qualified name of the class
-    defs = None  # type: Block
-    type_vars = None  # type: List[mypy.types.TypeVarDef]
-    # Base class expressions (not semantically analyzed -- can be arbitrary expressions)
-    base_type_exprs = None  # type: List[Expression]
-    # Special base classes like Generic[...] get moved here during semantic analysis
-    removed_base_type_exprs = None  # type: List[Expression]
-    info = None  # type: TypeInfo  # Related TypeInfo
-    metaclass = None  # type: Optional[Expression]
-    decorators = None  # type: List[Expression]
-    keywords = None  # type: OrderedDict[str, Expression]
-    analyzed = None  # type: Optional[Expression]
-    has_incompatible_baseclass = False
+    __slots__ = ('name', 'fullname', 'defs', 'type_vars', 'base_type_exprs',
+                 'removed_base_type_exprs', 'info', 'metaclass', 'decorators', 'keywords',
+                 'analyzed', 'has_incompatible_baseclass')
 
     def __init__(self,
                  name: str,
@@ -837,15 +832,23 @@ class ClassDef(Statement):
                  metaclass: Optional[Expression] = None,
                  keywords: Optional[List[Tuple[str, Expression]]] = None) -> None:
         super().__init__()
+        # Name of the class without module prefix
         self.name = name
         self.defs = defs
         self.type_vars = type_vars or []
+        # Base class expressions (not semantically analyzed -- can be arbitrary expressions)
         self.base_type_exprs = base_type_exprs or []
-        self.removed_base_type_exprs = []
+        # Special base classes like Generic[...] get moved here during semantic analysis
+        self.removed_base_type_exprs = []  # type: List[Expression]
+        # Related TypeInfo
         self.info = CLASSDEF_NO_INFO
         self.metaclass = metaclass
-        self.decorators = []
+        self.decorators = []  # type: List[Expression]
         self.keywords = OrderedDict(keywords or [])
+        # Fully qualified name of the class
+        self.fullname = cast(Bogus[str], None)
+        self.analyzed = None  # type: Optional[Expression]
+        self.has_incompatible_baseclass = False
 
     def accept(self, visitor: StatementVisitor[T]) -> T:
         return visitor.visit_class_def(self)
@@ -876,7 +879,7 @@ class ClassDef(Statement):
 class GlobalDecl(Statement):
     """Declaration global x, y, ..."""
 
-    names = None  # type: List[str]
+    __slots__ = ('names',)
 
     def __init__(self, names: List[str]) -> None:
         super().__init__()
@@ -889,7 +892,7 @@ class GlobalDecl(Statement):
 class NonlocalDecl(Statement):
     """Declaration nonlocal x, y, ..."""
 
-    names = None  # type: List[str]
+    __slots__ = ('names',)
 
     def __init__(self, names: List[str]) -> None:
         super().__init__()
@@ -921,7 +924,8 @@ class Block(Statement):
 
 class ExpressionStmt(Statement):
     """An expression as a statement, such as print(s)."""
-    expr = None  # type: Expression
+
+    __slots__ = ('expr',)
 
     def __init__(self, expr: Expression) -> None:
         super().__init__()
@@ -940,32 +944,29 @@ class AssignmentStmt(Statement):
     An lvalue can be NameExpr, TupleExpr, ListExpr, MemberExpr, IndexExpr.
     """
 
-    lvalues = None  # type: List[Lvalue]
-    rvalue = None  # type: Expression
-    # Declared type in a comment, may be None.
-    type = None  # type: Optional[mypy.types.Type]
-    # Original, not semantically analyzed type in annotation (used for reprocessing)
-    unanalyzed_type = None  # type: Optional[mypy.types.Type]
-    # This indicates usage of PEP 526 type annotation syntax in assignment.
-    new_syntax = False  # type: bool
-    # Does this assignment define a type alias?
-    is_alias_def = False
-    # Is this a final definition?
-    # Final attributes can't be re-assigned once set, and can't be overridden
-    # in a subclass. This flag is not set if an attempted declaration was found to
-    # be invalid during semantic analysis. It is still set to `True` if
-    # a final declaration overrides another final declaration (this is checked
-    # during type checking when MROs are known).
-    is_final_def = False
+    __slots__ = ('lvalues', 'rvalue', 'type', 'unanalyzed_type', 'new_syntax', 'is_alias_def',
+                 'is_final_def')
 
     def __init__(self, lvalues: List[Lvalue], rvalue: Expression,
                  type: 'Optional[mypy.types.Type]' = None, new_syntax: bool = False) -> None:
         super().__init__()
         self.lvalues = lvalues
         self.rvalue = rvalue
+        # Declared type in a comment, may be None.
         self.type = type
+        # Original, not semantically analyzed type in annotation (used for reprocessing)
         self.unanalyzed_type = type
+        # This indicates usage of PEP 526 type annotation syntax in assignment.
         self.new_syntax = new_syntax
+        # Does this assignment define a type alias?
+        self.is_alias_def = False
+        # Is this a final definition?
+        # Final attributes can't be re-assigned once set, and can't be overridden
+        # in a subclass. This flag is not set if an attempted declaration was found to
+        # be invalid during semantic analysis. It is still set to `True` if
+        # a final declaration overrides another final declaration (this is checked
+        # during type checking when MROs are known).
+        self.is_final_def = False
 
     def accept(self, visitor: StatementVisitor[T]) -> T:
         return visitor.visit_assignment_stmt(self)
@@ -974,9 +975,7 @@ class AssignmentStmt(Statement):
 class OperatorAssignmentStmt(Statement):
     """Operator assignment statement such as x += 1"""
 
-    op = ''
-    lvalue = None  # type: Lvalue
-    rvalue = None  # type: Expression
+    __slots__ = ('op', 'lvalue', 'rvalue')
 
     def __init__(self, op: str, lvalue: Lvalue, rvalue: Expression) -> None:
         super().__init__()
@@ -989,9 +988,7 @@ class OperatorAssignmentStmt(Statement):
 
 
 class WhileStmt(Statement):
-    expr = None  # type: Expression
-    body = None  # type: Block
-    else_body = None  # type: Optional[Block]
+    __slots__ = ('expr', 'body', 'else_body')
 
     def __init__(self, expr: Expression, body: Block, else_body: Optional[Block]) -> None:
         super().__init__()
@@ -1004,21 +1001,8 @@ class WhileStmt(Statement):
 
 
 class ForStmt(Statement):
-    # Index variables
-    index = None  # type: Lvalue
-    # Type given by type comments for index, can be None
-    index_type = None  # type: Optional[mypy.types.Type]
-    # Original, not semantically analyzed type in annotation (used for reprocessing)
-    unanalyzed_index_type = None  # type: Optional[mypy.types.Type]
-    # Inferred iterable item type
-    inferred_item_type = None  # type: Optional[mypy.types.Type]
-    # Inferred iterator type
-    inferred_iterator_type = None  # type: Optional[mypy.types.Type]
-    # Expression to iterate
-    expr = None  # type: Expression
-    body = None  # type: Block
-    else_body = None  # type: Optional[Block]
-    is_async = False  # True if `async for ...` (PEP 492, Python 3.5)
+    __slots__ = ('index', 'index_type', 'unanalyzed_index_type', 'inferred_item_type',
+                 'inferred_iterator_type', 'expr', 'body', 'else_body', 'is_async')
 
     def __init__(self,
                  index: Lvalue,
@@ -1027,19 +1011,29 @@ class ForStmt(Statement):
                  else_body: Optional[Block],
                  index_type: 'Optional[mypy.types.Type]' = None) -> None:
         super().__init__()
+        # Index variables
         self.index = index
+        # Type given by type comments for index, can be None
         self.index_type = index_type
+        # Original, not semantically analyzed type in annotation (used for reprocessing)
         self.unanalyzed_index_type = index_type
+        # Expression to iterate
         self.expr = expr
         self.body = body
         self.else_body = else_body
+        # Inferred iterable item type
+        self.inferred_item_type = None  # type: Optional[mypy.types.Type]
+        # Inferred iterator type
+        self.inferred_iterator_type = None  # type: Optional[mypy.types.Type]
+        # True if `async for ...` (PEP 492, Python 3.5)
+        self.is_async = False
 
     def accept(self, visitor: StatementVisitor[T]) -> T:
         return visitor.visit_for_stmt(self)
 
 
 class ReturnStmt(Statement):
-    expr = None  # type: Optional[Expression]
+    __slots__ = ('expr',)
 
     def __init__(self, expr: Optional[Expression]) -> None:
         super().__init__()
@@ -1050,8 +1044,7 @@ class ReturnStmt(Statement):
 
 
 class AssertStmt(Statement):
-    expr = None  # type: Expression
-    msg = None  # type: Optional[Expression]
+    __slots__ = ('expr', 'msg')
 
     def __init__(self, expr: Expression, msg: Optional[Expression] = None) -> None:
         super().__init__()
@@ -1063,7 +1056,7 @@ class AssertStmt(Statement):
 
 
 class DelStmt(Statement):
-    expr = None  # type: Lvalue
+    __slots__ = ('expr',)
 
     def __init__(self, expr: Lvalue) -> None:
         super().__init__()
@@ -1074,24 +1067,28 @@ class DelStmt(Statement):
 
 
 class BreakStmt(Statement):
+    __slots__ = ()
+
     def accept(self, visitor: StatementVisitor[T]) -> T:
         return visitor.visit_break_stmt(self)
 
 
 class ContinueStmt(Statement):
+    __slots__ = ()
+
     def accept(self, visitor: StatementVisitor[T]) -> T:
         return visitor.visit_continue_stmt(self)
 
 
 class PassStmt(Statement):
+    __slots__ = ()
+
     def accept(self, visitor: StatementVisitor[T]) -> T:
         return visitor.visit_pass_stmt(self)
 
 
 class IfStmt(Statement):
-    expr = None  # type: List[Expression]
-    body = None  # type: List[Block]
-    else_body = None  # type: Optional[Block]
+    __slots__ = ('expr', 'body', 'else_body')
 
     def __init__(self, expr: List[Expression], body: List[Block],
                  else_body: Optional[Block]) -> None:
@@ -1105,12 +1102,11 @@ class IfStmt(Statement):
 
 
 class RaiseStmt(Statement):
-    # Plain 'raise' is a valid statement.
-    expr = None  # type: Optional[Expression]
-    from_expr = None  # type: Optional[Expression]
+    __slots__ = ('expr', 'from_expr')
 
     def __init__(self, expr: Optional[Expression], from_expr: Optional[Expression]) -> None:
         super().__init__()
+        # Plain 'raise' is a valid statement.
         self.expr = expr
         self.from_expr = from_expr
 
@@ -1119,22 +1115,21 @@ class RaiseStmt(Statement):
 
 
 class TryStmt(Statement):
-    body = None  # type: Block                # Try body
-    # Plain 'except:' also possible
-    types = None  # type: List[Optional[Expression]]    # Except type expressions
-    vars = None  # type: List[Optional[NameExpr]]     # Except variable names
-    handlers = None  # type: List[Block]      # Except bodies
-    else_body = None  # type: Optional[Block]
-    finally_body = None  # type: Optional[Block]
+    __slots__ = ('body', 'types', 'vars', 'handlers', 'else_body', 'finally_body')
 
     def __init__(self, body: Block, vars: List['Optional[NameExpr]'],
                  types: List[Optional[Expression]],
                  handlers: List[Block], else_body: Optional[Block],
                  finally_body: Optional[Block]) -> None:
         super().__init__()
+        # Try body
         self.body = body
+        # Except variable names
         self.vars = vars
+        # Plain 'except:' also possible
+        # Except type expressions
         self.types = types
+        # Except bodies
         self.handlers = handlers
         self.else_body = else_body
         self.finally_body = finally_body
@@ -1144,20 +1139,18 @@ class TryStmt(Statement):
 
 
 class WithStmt(Statement):
-    expr = None  # type: List[Expression]
-    target = None  # type: List[Optional[Lvalue]]
-    # Type given by type comments for target, can be None
-    target_type = None  # type: Optional[mypy.types.Type]
-    body = None  # type: Block
-    is_async = False  # True if `async with ...` (PEP 492, Python 3.5)
+    __slots__ = ('expr', 'target', 'target_type', 'body', 'is_async')
 
     def __init__(self, expr: List[Expression], target: List[Optional[Lvalue]],
                  body: Block, target_type: 'Optional[mypy.types.Type]' = None) -> None:
         super().__init__()
         self.expr = expr
         self.target = target
+        # Type given by type comments for target, can be None
         self.target_type = target_type
         self.body = body
+        # True if `async with ...` (PEP 492, Python 3.5)
+        self.is_async = False
 
     def accept(self, visitor: StatementVisitor[T]) -> T:
         return visitor.visit_with_stmt(self)
@@ -1166,10 +1159,7 @@ class WithStmt(Statement):
 class PrintStmt(Statement):
     """Python 2 print statement"""
 
-    args = None  # type: List[Expression]
-    newline = False
-    # The file-like target object (given using >>).
-    target = None  # type: Optional[Expression]
+    __slots__ = ('args', 'newline', 'target')
 
     def __init__(self,
                  args: List[Expression],
@@ -1178,6 +1168,7 @@ class PrintStmt(Statement):
         super().__init__()
         self.args = args
         self.newline = newline
+        # The file-like target object (given using >>).
         self.target = target
 
     def accept(self, visitor: StatementVisitor[T]) -> T:
@@ -1187,9 +1178,7 @@ class PrintStmt(Statement):
 class ExecStmt(Statement):
     """Python 2 exec statement"""
 
-    expr = None  # type: Expression
-    globals = None  # type: Optional[Expression]
-    locals = None  # type: Optional[Expression]
+    __slots__ = ('expr', 'globals', 'locals')
 
     def __init__(self, expr: Expression,
                  globals: Optional[Expression],
@@ -1209,7 +1198,7 @@ class ExecStmt(Statement):
 class IntExpr(Expression):
     """Integer literal"""
 
-    value = 0
+    __slots__ = ('value',)
 
     def __init__(self, value: int) -> None:
         super().__init__()
@@ -1233,25 +1222,23 @@ class IntExpr(Expression):
 class StrExpr(Expression):
     """String literal"""
 
-    value = ''
-
-    # Keeps track of whether this string originated from Python 2 source code vs
-    # Python 3 source code. We need to keep track of this information so we can
-    # correctly handle types that have "nested strings". For example, consider this
-    # type alias, where we have a forward reference to a literal type:
-    #
-    #     Alias = List["Literal['foo']"]
-    #
-    # When parsing this, we need to know whether the outer string and alias came from
-    # Python 2 code vs Python 3 code so we can determine whether the inner `Literal['foo']`
-    # is meant to be `Literal[u'foo']` or `Literal[b'foo']`.
-    #
-    # This field keeps track of that information.
-    from_python_3 = True
+    __slots__ = ('value', 'from_python_3')
 
     def __init__(self, value: str, from_python_3: bool = False) -> None:
         super().__init__()
         self.value = value
+        # Keeps track of whether this string originated from Python 2 source code vs
+        # Python 3 source code. We need to keep track of this information so we can
+        # correctly handle types that have "nested strings". For example, consider this
+        # type alias, where we have a forward reference to a literal type:
+        #
+        #     Alias = List["Literal['foo']"]
+        #
+        # When parsing this, we need to know whether the outer string and alias came from
+        # Python 2 code vs Python 3 code so we can determine whether the inner `Literal['foo']`
+        # is meant to be `Literal[u'foo']` or `Literal[b'foo']`.
+        #
+        # This field keeps track of that information.
         self.from_python_3 = from_python_3
 
     def accept(self, visitor: ExpressionVisitor[T]) -> T:
@@ -1261,19 +1248,19 @@ class StrExpr(Expression):
 class BytesExpr(Expression):
     """Bytes literal"""
 
-    # Note: we deliberately do NOT use bytes here because it ends up
-    # unnecessarily complicating a lot of the result logic. For example,
-    # we'd have to worry about converting the bytes into a format we can
-    # easily serialize/deserialize to and from JSON, would have to worry
-    # about turning the bytes into a human-readable representation in
-    # error messages...
-    #
-    # It's more convenient to just store the human-readable representation
-    # from the very start.
-    value = ''
+    __slots__ = ('value',)
 
     def __init__(self, value: str) -> None:
         super().__init__()
+        # Note: we deliberately do NOT use bytes here because it ends up
+        # unnecessarily complicating a lot of the result logic. For example,
+        # we'd have to worry about converting the bytes into a format we can
+        # easily serialize/deserialize to and from JSON, would have to worry
+        # about turning the bytes into a human-readable representation in
+        # error messages...
+        #
+        # It's more convenient to just store the human-readable representation
+        # from the very start.
         self.value = value
 
     def accept(self, visitor: ExpressionVisitor[T]) -> T:
@@ -1283,7 +1270,7 @@ class BytesExpr(Expression):
 class UnicodeExpr(Expression):
     """Unicode literal (Python 2.x)"""
 
-    value = ''
+    __slots__ = ('value',)
 
     def __init__(self, value: str) -> None:
         super().__init__()
@@ -1296,7 +1283,7 @@ class UnicodeExpr(Expression):
 class FloatExpr(Expression):
     """Float literal"""
 
-    value = 0.0
+    __slots__ = ('value',)
 
     def __init__(self, value: float) -> None:
         super().__init__()
@@ -1309,6 +1296,8 @@ class FloatExpr(Expression):
 class ComplexExpr(Expression):
     """Complex literal"""
 
+    __slots__ = ('value',)
+
     def __init__(self, value: complex) -> None:
         super().__init__()
         self.value = value
@@ -1320,6 +1309,8 @@ class ComplexExpr(Expression):
 class EllipsisExpr(Expression):
     """Ellipsis (...)"""
 
+    __slots__ = ()
+
     def accept(self, visitor: ExpressionVisitor[T]) -> T:
         return visitor.visit_ellipsis(self)
 
@@ -1327,7 +1318,7 @@ class EllipsisExpr(Expression):
 class StarExpr(Expression):
     """Star expression"""
 
-    expr = None  # type: Expression
+    __slots__ = ('expr', 'valid')
 
     def __init__(self, expr: Expression) -> None:
         super().__init__()
@@ -1449,7 +1440,7 @@ class CallExpr(Expression):
 
 
 class YieldFromExpr(Expression):
-    expr = None  # type: Expression
+    __slots__ = ('expr',)
 
     def __init__(self, expr: Expression) -> None:
         super().__init__()
@@ -1460,7 +1451,7 @@ class YieldFromExpr(Expression):
 
 
 class YieldExpr(Expression):
-    expr = None  # type: Optional[Expression]
+    __slots__ = ('expr',)
 
     def __init__(self, expr: Optional[Expression]) -> None:
         super().__init__()
@@ -1476,19 +1467,17 @@ class IndexExpr(Expression):
     Also wraps type application such as List[int] as a special form.
     """
 
-    base = None  # type: Expression
-    index = None  # type: Expression
-    # Inferred __getitem__ method type
-    method_type = None  # type: Optional[mypy.types.Type]
-    # If not None, this is actually semantically a type application
-    # Class[type, ...] or a type alias initializer.
-    analyzed = None  # type: Union[TypeApplication, TypeAliasExpr, None]
+    __slots__ = ('base', 'index', 'method_type', 'analyzed')
 
     def __init__(self, base: Expression, index: Expression) -> None:
         super().__init__()
         self.base = base
         self.index = index
-        self.analyzed = None
+        # If not None, this is actually semantically a type application
+        # Class[type, ...] or a type alias initializer.
+        self.analyzed = None  # type: Union[TypeApplication, TypeAliasExpr, None]
+        # Inferred __getitem__ method type
+        self.method_type = None  # type: Optional[mypy.types.Type]
 
     def accept(self, visitor: ExpressionVisitor[T]) -> T:
         return visitor.visit_index_expr(self)
@@ -1497,15 +1486,14 @@ class IndexExpr(Expression):
 class UnaryExpr(Expression):
     """Unary operation"""
 
-    op = ''
-    expr = None  # type: Expression
-    # Inferred operator method type
-    method_type = None  # type: Optional[mypy.types.Type]
+    __slots__ = ('op', 'expr', 'method_type')
 
     def __init__(self, op: str, expr: Expression) -> None:
         super().__init__()
         self.op = op
         self.expr = expr
+        # Inferred operator method type
+        self.method_type = None  # type: Optional[mypy.types.Type]
 
     def accept(self, visitor: ExpressionVisitor[T]) -> T:
         return visitor.visit_unary_expr(self)
@@ -1609,21 +1597,19 @@ class OpExpr(Expression):
     """Binary operation (other than . or [] or comparison operators,
     which have specific nodes)."""
 
-    op = ''
-    left = None  # type: Expression
-    right = None  # type: Expression
-    # Inferred type for the operator method type (when relevant).
-    method_type = None  # type: Optional[mypy.types.Type]
-    # Is the right side going to be evaluated every time?
-    right_always = False
-    # Is the right side unreachable?
-    right_unreachable = False
+    __slots__ = ('op', 'left', 'right', 'method_type', 'right_always', 'right_unreachable')
 
     def __init__(self, op: str, left: Expression, right: Expression) -> None:
         super().__init__()
         self.op = op
         self.left = left
         self.right = right
+        # Inferred type for the operator method type (when relevant).
+        self.method_type = None  # type: Optional[mypy.types.Type]
+        # Is the right side going to be evaluated every time?
+        self.right_always = False
+        # Is the right side unreachable?
+        self.right_unreachable = False
 
     def accept(self, visitor: ExpressionVisitor[T]) -> T:
         return visitor.visit_op_expr(self)
@@ -1632,16 +1618,14 @@ class OpExpr(Expression):
 class ComparisonExpr(Expression):
     """Comparison expression (e.g. a < b > c < d)."""
 
-    operators = None  # type: List[str]
-    operands = None  # type: List[Expression]
-    # Inferred type for the operator methods (when relevant; None for 'is').
-    method_types = None  # type: List[Optional[mypy.types.Type]]
+    __slots__ = ('operators', 'operands', 'method_types')
 
     def __init__(self, operators: List[str], operands: List[Expression]) -> None:
         super().__init__()
         self.operators = operators
         self.operands = operands
-        self.method_types = []
+        # Inferred type for the operator methods (when relevant; None for 'is').
+        self.method_types = []  # type: List[Optional[mypy.types.Type]]
 
     def accept(self, visitor: ExpressionVisitor[T]) -> T:
         return visitor.visit_comparison_expr(self)
@@ -1653,9 +1637,7 @@ class SliceExpr(Expression):
     This is only valid as index in index expressions.
     """
 
-    begin_index = None  # type: Optional[Expression]
-    end_index = None  # type: Optional[Expression]
-    stride = None  # type: Optional[Expression]
+    __slots__ = ('begin_index', 'end_index', 'stride')
 
     def __init__(self, begin_index: Optional[Expression],
                  end_index: Optional[Expression],
@@ -1672,8 +1654,7 @@ class SliceExpr(Expression):
 class CastExpr(Expression):
     """Cast expression cast(type, expr)."""
 
-    expr = None  # type: Expression
-    type = None  # type: mypy.types.Type
+    __slots__ = ('expr', 'type')
 
     def __init__(self, expr: Expression, typ: 'mypy.types.Type') -> None:
         super().__init__()
@@ -1687,9 +1668,7 @@ class CastExpr(Expression):
 class RevealExpr(Expression):
     """Reveal type expression reveal_type(expr) or reveal_locals() expression."""
 
-    expr = None  # type: Optional[Expression]
-    kind = 0  # type: int
-    local_nodes = None  # type: Optional[List[Var]]
+    __slots__ = ('expr', 'kind', 'local_nodes')
 
     def __init__(
             self, kind: int,
@@ -1707,14 +1686,15 @@ class RevealExpr(Expression):
 class SuperExpr(Expression):
     """Expression super().name"""
 
-    name = ''
-    info = None  # type: Optional[TypeInfo]  # Type that contains this super expression
-    call = None  # type: CallExpr  # The expression super(...)
+    __slots__ = ('name', 'info', 'call')
 
     def __init__(self, name: str, call: CallExpr) -> None:
         super().__init__()
         self.name = name
+        # The expression super(...)
         self.call = call
+        # Type that contains this super expression
+        self.info = None  # type: Optional[TypeInfo]
 
     def accept(self, visitor: ExpressionVisitor[T]) -> T:
         return visitor.visit_super_expr(self)
@@ -1723,6 +1703,8 @@ class SuperExpr(Expression):
 class LambdaExpr(FuncItem, Expression):
     """Lambda expression"""
 
+    __slots__ = ()
+
     def name(self) -> str:
         return '<lambda>'
 
@@ -1743,7 +1725,7 @@ class LambdaExpr(FuncItem, Expression):
 class ListExpr(Expression):
     """List literal expression [...]."""
 
-    items = None  # type: List[Expression]
+    __slots__ = ('items',)
 
     def __init__(self, items: List[Expression]) -> None:
         super().__init__()
@@ -1756,7 +1738,7 @@ class ListExpr(Expression):
 class DictExpr(Expression):
     """Dictionary literal expression {key: value, ...}."""
 
-    items = None  # type: List[Tuple[Optional[Expression], Expression]]
+    __slots__ = ('items',)
 
     def __init__(self, items: List[Tuple[Optional[Expression], Expression]]) -> None:
         super().__init__()
@@ -1771,7 +1753,7 @@ class TupleExpr(Expression):
 
     Also lvalue sequences (..., ...) and [..., ...]"""
 
-    items = None  # type: List[Expression]
+    __slots__ = ('items',)
 
     def __init__(self, items: List[Expression]) -> None:
         super().__init__()
@@ -1784,7 +1766,7 @@ class TupleExpr(Expression):
 class SetExpr(Expression):
     """Set literal expression {value, ...}."""
 
-    items = None  # type: List[Expression]
+    __slots__ = ('items',)
 
     def __init__(self, items: List[Expression]) -> None:
         super().__init__()
@@ -1797,11 +1779,7 @@ class SetExpr(Expression):
 class GeneratorExpr(Expression):
     """Generator expression ... for ... in ... [ for ...  in ... ] [ if ... ]."""
 
-    left_expr = None  # type: Expression
-    sequences = None  # type: List[Expression]
-    condlists = None  # type: List[List[Expression]]
-    is_async = None  # type: List[bool]
-    indices = None  # type: List[Lvalue]
+    __slots__ = ('left_expr', 'sequences', 'condlists', 'is_async', 'indices')
 
     def __init__(self, left_expr: Expression, indices: List[Lvalue],
                  sequences: List[Expression], condlists: List[List[Expression]],
@@ -1820,7 +1798,7 @@ class GeneratorExpr(Expression):
 class ListComprehension(Expression):
     """List comprehension (e.g. [x + 1 for x in a])"""
 
-    generator = None  # type: GeneratorExpr
+    __slots__ = ('generator',)
 
     def __init__(self, generator: GeneratorExpr) -> None:
         super().__init__()
@@ -1833,7 +1811,7 @@ class ListComprehension(Expression):
 class SetComprehension(Expression):
     """Set comprehension (e.g. {x + 1 for x in a})"""
 
-    generator = None  # type: GeneratorExpr
+    __slots__ = ('generator',)
 
     def __init__(self, generator: GeneratorExpr) -> None:
         super().__init__()
@@ -1846,12 +1824,7 @@ class SetComprehension(Expression):
 class DictionaryComprehension(Expression):
     """Dictionary comprehension (e.g. {k: v for k, v in a}"""
 
-    key = None  # type: Expression
-    value = None  # type: Expression
-    sequences = None  # type: List[Expression]
-    condlists = None  # type: List[List[Expression]]
-    is_async = None  # type: List[bool]
-    indices = None  # type: List[Lvalue]
+    __slots__ = ('key', 'value', 'sequences', 'condlists', 'is_async', 'indices')
 
     def __init__(self, key: Expression, value: Expression, indices: List[Lvalue],
                  sequences: List[Expression], condlists: List[List[Expression]],
@@ -1871,9 +1844,7 @@ class DictionaryComprehension(Expression):
 class ConditionalExpr(Expression):
     """Conditional expression (e.g. x if y else z)"""
 
-    cond = None  # type: Expression
-    if_expr = None  # type: Expression
-    else_expr = None  # type: Expression
+    __slots__ = ('cond', 'if_expr', 'else_expr')
 
     def __init__(self, cond: Expression, if_expr: Expression, else_expr: Expression) -> None:
         super().__init__()
@@ -1888,7 +1859,7 @@ class ConditionalExpr(Expression):
 class BackquoteExpr(Expression):
     """Python 2 expression `...`."""
 
-    expr = None  # type: Expression
+    __slots__ = ('expr',)
 
     def __init__(self, expr: Expression) -> None:
         super().__init__()
@@ -1901,8 +1872,7 @@ class BackquoteExpr(Expression):
 class TypeApplication(Expression):
     """Type application expr[type, ...]"""
 
-    expr = None  # type: Expression
-    types = None  # type: List[mypy.types.Type]
+    __slots__ = ('expr', 'types')
 
     def __init__(self, expr: Expression, types: List['mypy.types.Type']) -> None:
         super().__init__()
@@ -1930,19 +1900,7 @@ CONTRAVARIANT = 2  # type: Final[int]
 class TypeVarExpr(SymbolNode, Expression):
     """Type variable expression TypeVar(...)."""
 
-    _name = ''
-    _fullname = ''
-    # Value restriction: only types in the list are valid as values. If the
-    # list is empty, there is no restriction.
-    values = None  # type: List[mypy.types.Type]
-    # Upper bound: only subtypes of upper_bound are valid as values. By default
-    # this is 'object', meaning no restriction.
-    upper_bound = None  # type: mypy.types.Type
-    # Variance of the type variable. Invariant is the default.
-    # TypeVar(..., covariant=True) defines a covariant type variable.
-    # TypeVar(..., contravariant=True) defines a contravariant type
-    # variable.
-    variance = INVARIANT
+    __slots__ = ('_name', '_fullname', 'values', 'upper_bound', 'variance')
 
     def __init__(self, name: str, fullname: str,
                  values: List['mypy.types.Type'],
@@ -1951,8 +1909,16 @@ class TypeVarExpr(SymbolNode, Expression):
         super().__init__()
         self._name = name
         self._fullname = fullname
+        # Value restriction: only types in the list are valid as values. If the
+        # list is empty, there is no restriction.
         self.values = values
+        # Upper bound: only subtypes of upper_bound are valid as values. By default
+        # this is 'object', meaning no restriction.
         self.upper_bound = upper_bound
+        # Variance of the type variable. Invariant is the default.
+        # TypeVar(..., covariant=True) defines a covariant type variable.
+        # TypeVar(..., contravariant=True) defines a contravariant type
+        # variable.
         self.variance = variance
 
     def name(self) -> str:
@@ -1986,21 +1952,19 @@ class TypeVarExpr(SymbolNode, Expression):
 class TypeAliasExpr(Expression):
     """Type alias expression (rvalue)."""
 
-    # The target type.
-    type = None  # type: mypy.types.Type
-    # Names of unbound type variables used to define the alias
-    tvars = None  # type: List[str]
-    # Whether this alias was defined in bare form. Used to distinguish
-    # between
-    #     A = List
-    # and
-    #     A = List[Any]
-    no_args = False  # type: bool
+    __slots__ = ('type', 'tvars', 'no_args')
 
     def __init__(self, type: 'mypy.types.Type', tvars: List[str], no_args: bool) -> None:
         super().__init__()
+        # The target type.
         self.type = type
+        # Names of unbound type variables used to define the alias
         self.tvars = tvars
+        # Whether this alias was defined in bare form. Used to distinguish
+        # between
+        #     A = List
+        # and
+        #     A = List[Any]
         self.no_args = no_args
 
     def accept(self, visitor: ExpressionVisitor[T]) -> T:
@@ -2010,14 +1974,14 @@ class TypeAliasExpr(Expression):
 class NamedTupleExpr(Expression):
     """Named tuple expression namedtuple(...) or NamedTuple(...)."""
 
-    # The class representation of this named tuple (its tuple_type attribute contains
-    # the tuple item types)
-    info = None  # type: TypeInfo
-    is_typed = False  # whether this class was created with typing.NamedTuple
+    __slots__ = ('info', 'is_typed')
 
     def __init__(self, info: 'TypeInfo', is_typed: bool = False) -> None:
         super().__init__()
+        # The class representation of this named tuple (its tuple_type attribute contains
+        # the tuple item types)
         self.info = info
+        # Whether this class was created with typing.NamedTuple
         self.is_typed = is_typed
 
     def accept(self, visitor: ExpressionVisitor[T]) -> T:
@@ -2027,11 +1991,11 @@ class NamedTupleExpr(Expression):
 class TypedDictExpr(Expression):
     """Typed dict expression TypedDict(...)."""
 
-    # The class representation of this typed dict
-    info = None  # type: TypeInfo
+    __slots__ = ('info',)
 
     def __init__(self, info: 'TypeInfo') -> None:
         super().__init__()
+        # The class representation of this typed dict
         self.info = info
 
     def accept(self, visitor: ExpressionVisitor[T]) -> T:
@@ -2041,16 +2005,14 @@ class TypedDictExpr(Expression):
 class EnumCallExpr(Expression):
     """Named tuple expression Enum('name', 'val1 val2 ...')."""
 
-    # The class representation of this enumerated type
-    info = None  # type: TypeInfo
-    # The item names (for debugging)
-    items = None  # type: List[str]
-    values = None  # type: List[Optional[Expression]]
+    __slots__ = ('info', 'items', 'values')
 
     def __init__(self, info: 'TypeInfo', items: List[str],
                  values: List[Optional[Expression]]) -> None:
         super().__init__()
+        # The class representation of this enumerated type
         self.info = info
+        # The item names (for debugging)
         self.items = items
         self.values = values
 
@@ -2061,7 +2023,7 @@ class EnumCallExpr(Expression):
 class PromoteExpr(Expression):
     """Ducktype class decorator expression _promote(...)."""
 
-    type = None  # type: mypy.types.Type
+    __slots__ = ('type',)
 
     def __init__(self, type: 'mypy.types.Type') -> None:
         super().__init__()
@@ -2073,17 +2035,17 @@ class PromoteExpr(Expression):
 
 class NewTypeExpr(Expression):
     """NewType expression NewType(...)."""
-    name = None  # type: str
-    # The base type (the second argument to NewType)
-    old_type = None  # type: Optional[mypy.types.Type]
-    # The synthesized class representing the new type (inherits old_type)
-    info = None  # type: Optional[TypeInfo]
+
+    __slots__ = ('name', 'old_type', 'info')
 
     def __init__(self, name: str, old_type: 'Optional[mypy.types.Type]', line: int) -> None:
         super().__init__()
         self.name = name
+        # The base type (the second argument to NewType)
         self.old_type = old_type
         self.line = line
+        # The synthesized class representing the new type (inherits old_type)
+        self.info = None  # type: Optional[TypeInfo]
 
     def accept(self, visitor: ExpressionVisitor[T]) -> T:
         return visitor.visit_newtype_expr(self)
@@ -2092,7 +2054,7 @@ class NewTypeExpr(Expression):
 class AwaitExpr(Expression):
     """Await expression (await ...)."""
 
-    expr = None  # type: Expression
+    __slots__ = ('expr',)
 
     def __init__(self, expr: Expression) -> None:
         super().__init__()
@@ -2113,14 +2075,14 @@ class TempNode(Expression):
     some fixed type.
     """
 
-    type = None  # type: mypy.types.Type
-    # Is this TempNode used to indicate absence of a right hand side in an annotated assignment?
-    # (e.g. for 'x: int' the rvalue is TempNode(AnyType(TypeOfAny.special_form), no_rhs=True))
-    no_rhs = False  # type: bool
+    __slots__ = ('type', 'no_rhs')
 
     def __init__(self, typ: 'mypy.types.Type', no_rhs: bool = False) -> None:
         super().__init__()
         self.type = typ
+        # Is this TempNode used to indicate absence of a right hand side in an annotated
+        # assignment? (e.g. for 'x: int' the rvalue is
+        # TempNode(AnyType(TypeOfAny.special_form), no_rhs=True))
         self.no_rhs = no_rhs
 
     def __repr__(self) -> str:
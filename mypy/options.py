@@ -23,6 +23,7 @@ PER_MODULE_OPTIONS = {
     "allow_untyped_globals",
     "always_false",
     "always_true",
+    "cache_interface_only",
     "check_untyped_defs",
     "debug_cache",
     "disallow_any_decorated",
@@ -37,12 +38,14 @@ PER_MODULE_OPTIONS = {
     "disallow_untyped_defs",
     "follow_imports",
     "follow_imports_for_stubs",
+    "follow_imports_interface_only",
     "ignore_errors",
     "ignore_missing_imports",
     "local_partial_types",
     "mypyc",
     "no_implicit_optional",
     "show_none_errors",
+    "skip_ignored_function_bodies",
     "strict_optional",
     "strict_optional_whitelist",
     "warn_no_return",
@@ -80,6 +83,9 @@ class Options:
         # Whether to respect the follow_imports setting even for stub files.
         # Intended to be used for disabling specific stubs.
         self.follow_imports_for_stubs = False
+        # Only analyze the interface of modules followed with follow_imports=silent,
+        # removing function bodies that don't affect it
+        self.follow_imports_interface_only = False
         # PEP 420 namespace packages
         self.namespace_packages = False
 
@@ -130,11 +136,17 @@ class Options:
         # Files in which to ignore all non-fatal errors
         self.ignore_errors = False
 
+        # Don't type check function bodies that can't affect other modules in
+        # files in which all errors are ignored
+        self.skip_ignored_function_bodies = False
+
         # Apply strict None checking
         self.strict_optional = True
 
         # Show "note: In function "foo":" messages.
         self.show_error_context = False
+        # Format of error messages: 'text' or 'json'
+        self.error_format = 'text'
 
         # Files in which to allow strict-Optional related errors
         # TODO: Kill this in favor of show_none_errors
@@ -164,6 +176,9 @@ class Options:
         # Write junit.xml to given file
         self.junit_xml = None  # type: Optional[str]
 
+        # Write stack samples taken during the build to given file
+        self.profile_output = None  # type: Optional[str]
+
         # Caching and incremental checking options
         self.incremental = True
         self.cache_dir = defaults.CACHE_DIR
@@ -175,6 +190,9 @@ class Options:
         self.cache_fine_grained = False
         # Read cache files in fine-grained incremental mode (cache must include dependencies)
         self.use_fine_grained_cache = False
+        # Only write the names other modules can import to the cache. Set per-module
+        # in the config file.
+        self.cache_interface_only = False
 
         # Tune certain behaviors when being used as a front-end to mypyc. Set per-module
         # in modules being compiled. Not in the config file or command line.
@@ -221,6 +239,17 @@ class Options:
         self.cache_map = {}  # type: Dict[str, Tuple[str, str]]
         # Don't properly free objects on exit, just kill the current process.
         self.fast_exit = False
+        # Number of worker processes used to parse files while loading the
+        # import graph (0 means parse in the main process)
+        self.parse_workers = 0
+        # Only process the nodes recorded by semantic analysis pass 2 in pass 3,
+        # instead of traversing each file again
+        self.semantic_analysis_worklist = False
+        # Number of worker processes used to convert XML reports to HTML
+        # (0 means convert in the main process)
+        self.report_workers = 0
+        # Validate XML reports against the schema
+        self.debug_reports = False
 
     def snapshot(self) -> object:
         """Produce a comparable snapshot of this Option"""
@@ -0,0 +1,135 @@
+"""Parse source files in worker processes ahead of graph loading.
+
+load_graph() discovers modules breadth-first and parses each new module
+as soon as it is found, which makes parsing a sequential bottleneck of
+cold runs. A ParsePool is given the frontier of modules that are about to
+be discovered and parses them in worker processes. When the build manager
+later parses one of these files, it picks up the tree parsed by a worker
+instead of parsing the file itself.
+
+Only the parse itself happens in the workers. Reading files, the first
+pass of semantic analysis and computing dependencies still happen in the
+main process in discovery order, so the resulting graph and the order of
+errors are the same as with sequential parsing. Parse errors reported by
+a worker are replayed in the main process when the tree is used.
+
+Trees are sent back pickled. The placeholder FakeInfo objects refer to
+module-level singletons that are compared by identity, so they are
+pickled by reference.
+"""
+
+import io
+import pickle
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from mypy.errors import Errors, ErrorInfo
+from mypy.nodes import FakeInfo, MypyFile
+from mypy.options import Options
+from mypy.parse import parse
+
+MYPY = False
+if MYPY:
+    from typing_extensions import Final
+
+# Module-level FakeInfo singletons that can appear in a freshly parsed tree,
+# as (module, attribute) pairs.
+FAKE_INFOS = [
+    ('mypy.nodes', 'VAR_NO_INFO'),
+    ('mypy.nodes', 'CLASSDEF_NO_INFO'),
+    ('mypy.nodes', 'FUNC_NO_INFO'),
+    ('mypy.fastparse', 'MISSING_FALLBACK'),
+    ('mypy.fastparse2', 'MISSING_FALLBACK'),
+]  # type: Final
+
+# A parse tree with the errors reported while parsing it
+ParseResult = Tuple[MypyFile, List[ErrorInfo]]
+
+
+def load_fake_info(module: str, name: str) -> FakeInfo:
+    __import__(module)
+    return getattr(sys.modules[module], name)
+
+
+def reduce_fake_info(info: FakeInfo) -> Tuple[Callable[..., FakeInfo], Tuple[str, str]]:
+    for module, name in FAKE_INFOS:
+        if module in sys.modules and getattr(sys.modules[module], name) is info:
+            return load_fake_info, (module, name)
+    raise pickle.PicklingError('Unknown FakeInfo object')
+
+
+def dumps_parse_result(result: ParseResult) -> bytes:
+    buf = io.BytesIO()
+    pickler = pickle.Pickler(buf, pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = {FakeInfo: reduce_fake_info}  # type: ignore
+    pickler.dump(result)
+    return buf.getvalue()
+
+
+def loads_parse_result(data: bytes) -> ParseResult:
+    return pickle.loads(data)
+
+
+def parse_source(source: str, path: str, id: str, options: Options) -> Optional[bytes]:
+    """Parse a file in a worker process and return the pickled ParseResult.
+
+    Return None if the tree can't be sent back, so that the main process
+    parses the file itself.
+    """
+    errors = Errors()
+    tree = parse(source, path, id, errors, options=options)
+    try:
+        return dumps_parse_result((tree, errors.error_info_map.get(path, [])))
+    except (RecursionError, pickle.PicklingError):
+        # Very deeply nested trees exceed the recursion limit of the pickler.
+        return None
+
+
+class ParsePool:
+    """Parse files in worker processes.
+
+    Files are submitted with prefetch() and their results are later claimed
+    with result(). Each result is used at most once.
+    """
+
+    def __init__(self, workers: int) -> None:
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        # Pending parses by path, with the source that was submitted
+        self.pending = {}  # type: Dict[str, Tuple[str, Future[Optional[bytes]]]]
+        # Paths that were submitted at some point; these are never submitted again
+        self.submitted = set()  # type: Set[str]
+
+    def prefetch(self, path: str, id: str, source: str, options: Options) -> None:
+        if path in self.submitted:
+            return
+        self.submitted.add(path)
+        future = self.executor.submit(parse_source, source, path, id, options)
+        self.pending[path] = (source, future)
+
+    def result(self, path: str, source: str) -> Optional[ParseResult]:
+        """Return the parse result for a file, if it was parsed by a worker.
+
+        The result is only used if the worker parsed the same source.
+        """
+        if path not in self.pending:
+            return None
+        submitted_source, future = self.pending.pop(path)
+        if submitted_source != source:
+            future.cancel()
+            return None
+        try:
+            data = future.result()
+        except Exception:
+            # A worker may have died; fall back to parsing in this process.
+            return None
+        if data is None:
+            return None
+        return loads_parse_result(data)
+
+    def shutdown(self) -> None:
+        for _, future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
+        self.executor.shutdown()
@@ -0,0 +1,119 @@
+"""Sample the Python call stack while mypy is running.
+
+A SamplingProfiler interrupts the process periodically with a profiling
+timer signal and records the call stack at that point. Each sample is
+tagged with the build phase and the module being processed, taken from the
+innermost State method on the stack.
+
+The samples are written in the collapsed stack format used by flame graph
+tools: one line per distinct stack, with the frames from the outermost to
+the innermost separated by semicolons, followed by the number of samples.
+"""
+
+import os
+import signal
+import threading
+from collections import Counter
+
+from typing import Any, Dict, Optional, Set
+from types import CodeType, FrameType
+
+MYPY = False
+if MYPY:
+    from typing_extensions import Final
+    from mypy.build import BuildManager
+
+# Seconds of CPU time between samples
+SAMPLE_INTERVAL = 0.001  # type: Final
+
+# Frames in files below this directory are shown with a relative path
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # type: Final
+
+
+def is_profiling_supported() -> bool:
+    return hasattr(signal, 'setitimer') and hasattr(signal, 'SIGPROF')
+
+
+class SamplingProfiler:
+    """Sample the call stack at regular intervals of CPU time.
+
+    The profiler must be started and stopped in the main thread.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL) -> None:
+        self.interval = interval
+        # Number of samples of each collapsed stack
+        self.samples = Counter()  # type: Dict[str, int]
+        # Code objects of State methods, used to find the current module
+        self.state_codes = set()  # type: Set[CodeType]
+        self.state_type = object  # type: type
+        # Frame labels by code object
+        self.labels = {}  # type: Dict[CodeType, str]
+        # Build manager of the most recently sampled State, used to find the phase
+        self.manager = None  # type: Optional[BuildManager]
+        self.old_handler = None  # type: Any
+        self.sampling = False
+
+    def start(self) -> None:
+        if not is_profiling_supported():
+            raise RuntimeError('Profiling is not supported on this platform')
+        if threading.current_thread() is not threading.main_thread():
+            raise RuntimeError('Profiling can only be started in the main thread')
+        from mypy.build import State  # Lazy import to avoid an import cycle
+        self.state_type = State
+        self.state_codes = {value.__code__ for value in State.__dict__.values()
+                            if hasattr(value, '__code__')}
+        self.old_handler = signal.signal(signal.SIGPROF, self.handle_signal)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self) -> None:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self.old_handler)
+
+    def handle_signal(self, signum: int, frame: Optional[FrameType]) -> None:
+        if self.sampling:
+            return
+        self.sampling = True
+        try:
+            self.sample(frame)
+        finally:
+            self.sampling = False
+
+    def sample(self, frame: Optional[FrameType]) -> None:
+        labels = []
+        state = None
+        while frame is not None:
+            code = frame.f_code
+            if state is None and code in self.state_codes:
+                state = frame.f_locals.get('self')
+                if not isinstance(state, self.state_type):
+                    state = None
+            labels.append(self.label(code))
+            frame = frame.f_back
+        module = phase = '?'
+        if state is not None:
+            module = getattr(state, 'id', module)
+            self.manager = getattr(state, 'manager', self.manager)
+        if self.manager is not None and self.manager.phase_timer.stack:
+            phase = self.manager.phase_timer.stack[-1]
+        labels.append('module ' + module)
+        labels.append('phase ' + phase)
+        self.samples[';'.join(reversed(labels))] += 1
+
+    def label(self, code: CodeType) -> str:
+        label = self.labels.get(code)
+        if label is None:
+            path = code.co_filename
+            if path.startswith(BASE_DIR + os.sep):
+                path = path[len(BASE_DIR) + 1:]
+            label = '{} ({}:{})'.format(code.co_name, path, code.co_firstlineno)
+            # Semicolons separate frames, so they can't appear in a frame.
+            label = label.replace(';', ':')
+            self.labels[code] = label
+        return label
+
+    def write(self, path: str) -> None:
+        """Write the samples in collapsed stack format."""
+        with open(path, 'w') as f:
+            for stack, count in sorted(self.samples.items()):
+                f.write('{} {}\n'.format(stack, count))
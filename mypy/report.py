@@ -2,24 +2,29 @@
 
 from abc import ABCMeta, abstractmethod
 import collections
+import io
 import json
 import os
+import re
 import shutil
 import tokenize
 import typing
 from operator import attrgetter
 from urllib.request import pathname2url
-from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, cast
 
 import time
 
 import sys
 
 import itertools
+from concurrent.futures import Future, ProcessPoolExecutor
+from xml.sax.saxutils import escape
 
-from mypy.nodes import MypyFile, Expression, FuncDef
-from mypy import stats
+from mypy.nodes import MypyFile, Expression, FuncDef, JsonDict
+from mypy import stats, timing
 from mypy.options import Options
+from mypy.timing import TargetTimer, TIMING_FIELDS
 from mypy.traverser import TraverserVisitor
 from mypy.types import Type, TypeOfAny
 from mypy.version import __version__
@@ -48,16 +53,34 @@ type_of_any_name_map = collections.OrderedDict([
     (TypeOfAny.implementation_artifact, "Implementation Artifact"),
 ])  # type: Final[collections.OrderedDict[int, str]]
 
+# Characters escaped in XML attribute values, in addition to &, < and >
+XML_ATTRIBUTE_ENTITIES = {'"': '&quot;', '\n': '&#10;', '\r': '&#13;', '\t': '&#9;'}  # type: Final
+XML_ATTRIBUTE_SPECIAL_CHARS = re.compile('[&<>"\n\r\t]')  # type: Final
+
+# Groups of file statistics that can be cached (see FileStats)
+FUNCTIONS = 'functions'  # type: Final
+COVERAGE = 'coverage'  # type: Final
+PRECISION = 'precision'  # type: Final
+
 ReporterClasses = Dict[str, Tuple[Callable[['Reports', str], 'AbstractReporter'], bool]]
 
 reporter_classes = {}  # type: Final[ReporterClasses]
 
 
 class Reports:
-    def __init__(self, data_dir: str, report_dirs: Dict[str, str]) -> None:
+    def __init__(self, data_dir: str, report_dirs: Dict[str, str],
+                 workers: int = 0, validate: bool = False) -> None:
         self.data_dir = data_dir
+        # Number of worker processes used to convert XML to HTML
+        self.workers = workers
+        # Validate generated XML against the schema (slow, for debugging)
+        self.validate = validate
         self.reporters = []  # type: List[AbstractReporter]
         self.named_reporters = {}  # type: Dict[str, AbstractReporter]
+        # Set by reporters that need type checking to be timed
+        self.target_timer = None  # type: Optional[TargetTimer]
+        # Groups of file statistics used by the reporters (see FileStats)
+        self.stats_groups = set()  # type: Set[str]
 
         for report_type, report_dir in sorted(report_dirs.items()):
             self.add_report(report_type, report_dir)
@@ -77,31 +100,242 @@ class Reports:
         reporter = reporter_cls(self, report_dir)
         self.reporters.append(reporter)
         self.named_reporters[report_type] = reporter
+        self.stats_groups.update(reporter.stats_groups)
         return reporter
 
-    def file(self, tree: MypyFile, type_map: Dict[Expression, Type], options: Options) -> None:
+    def file(self, tree: MypyFile, type_map: Dict[Expression, Type],
+             options: Options) -> 'FileStats':
+        file_stats = FileStats(tree.fullname(), tree.path, tree, type_map)
+        self.add_file(file_stats, options)
+        return file_stats
+
+    def cached_file(self, module: str, path: str, data: JsonDict, options: Options) -> None:
+        """Report a file using statistics from a previous run (see FileStats.serialize)."""
+        self.add_file(FileStats.deserialize(module, path, data), options)
+
+    def add_file(self, file_stats: 'FileStats', options: Options) -> None:
         for reporter in self.reporters:
-            reporter.on_file(tree, type_map, options)
+            reporter.on_file(file_stats, options)
 
     def finish(self) -> None:
         for reporter in self.reporters:
             reporter.on_finish()
 
 
+class FileStats:
+    """Statistics about a file that are shared by all reporters.
+
+    Each value is computed when a reporter first needs it, so the source
+    is read and the tree is analyzed at most once per file.
+
+    The values derived from the tree fall into groups (FUNCTIONS, COVERAGE
+    and PRECISION). The groups can be serialized into the cache, which lets
+    a module with fresh cache data be reported without its tree. The source
+    is still read from the file, since it is unchanged if the cache is fresh.
+    """
+
+    def __init__(self, module: str, path: str,
+                 tree: Optional[MypyFile] = None,
+                 type_map: Optional[Dict[Expression, Type]] = None) -> None:
+        self.module = module
+        self.path = path
+        self.tree = tree
+        self.type_map = type_map or {}
+        self._data = None  # type: Optional[bytes]
+        self._source = None  # type: Optional[List[str]]
+        self._func_counts = None  # type: Optional[List[int]]
+        self._covered_lines = None  # type: Optional[List[int]]
+        self._precision = None  # type: Optional[PrecisionStats]
+
+    @property
+    def data(self) -> bytes:
+        if self._data is None:
+            with open(self.path, 'rb') as f:
+                self._data = f.read()
+        return self._data
+
+    @property
+    def physical_lines(self) -> int:
+        """Number of lines, assuming an encoding that is a superset of ASCII."""
+        data = self.data
+        lines = data.count(b'\n')
+        if data and not data.endswith(b'\n'):
+            lines += 1
+        return lines
+
+    @property
+    def source(self) -> List[str]:
+        """Lines of the file, decoded like tokenize.open does."""
+        if self._source is None:
+            encoding, _ = tokenize.detect_encoding(io.BytesIO(self.data).readline)
+            self._source = io.TextIOWrapper(io.BytesIO(self.data), encoding).readlines()
+        return self._source
+
+    @property
+    def func_counts(self) -> List[int]:
+        """Numbers of unannotated and annotated functions."""
+        if self._func_counts is None:
+            func_counter = FuncCounterVisitor()
+            self.accept(func_counter)
+            self._func_counts = func_counter.counts
+        return self._func_counts
+
+    @property
+    def covered_lines(self) -> List[int]:
+        """Line numbers that belong to typed functions."""
+        if self._covered_lines is None:
+            coverage_visitor = LineCoverageVisitor(self.source)
+            self.accept(coverage_visitor)
+            self._covered_lines = [line_number + 1
+                                   for line_number, (_, typed)
+                                   in enumerate(coverage_visitor.lines_covered)
+                                   if typed]
+        return self._covered_lines
+
+    @property
+    def precision(self) -> 'PrecisionStats':
+        """Precision of the inferred types of all expressions."""
+        if self._precision is None:
+            visitor = stats.StatisticsVisitor(inferred=True,
+                                              filename=self.module,
+                                              typemap=self.type_map,
+                                              all_nodes=True)
+            self.accept(visitor)
+            self._precision = PrecisionStats.from_visitor(visitor)
+        return self._precision
+
+    def accept(self, visitor: TraverserVisitor) -> None:
+        assert self.tree is not None, 'Statistics for {} were not cached'.format(self.module)
+        self.tree.accept(visitor)
+
+    def serialize(self, groups: Iterable[str]) -> JsonDict:
+        """Serialize the given groups of statistics, computing them if needed."""
+        data = {}  # type: JsonDict
+        for group in groups:
+            if group == FUNCTIONS:
+                data[group] = self.func_counts
+            elif group == COVERAGE:
+                data[group] = self.covered_lines
+            elif group == PRECISION:
+                data[group] = self.precision.serialize()
+            else:
+                assert False, 'Unknown statistics group: {}'.format(group)
+        return data
+
+    @classmethod
+    def deserialize(cls, module: str, path: str, data: JsonDict) -> 'FileStats':
+        file_stats = cls(module, path)
+        file_stats._func_counts = data.get(FUNCTIONS)
+        file_stats._covered_lines = data.get(COVERAGE)
+        if PRECISION in data:
+            file_stats._precision = PrecisionStats.deserialize(data[PRECISION])
+        return file_stats
+
+
+class PrecisionStats:
+    """The precision of the inferred types in a file, summarized by line.
+
+    This is what reporters need from a StatisticsVisitor, in a form that
+    can be cached.
+    """
+
+    def __init__(self,
+                 line_map: Dict[int, int],
+                 any_line_counts: Dict[int, List[Tuple[int, int]]],
+                 typed_num_exprs: int,
+                 typed_num_any_exprs: int,
+                 typed_num_unanalyzed_lines: int,
+                 typed_type_of_any_counter: 'typing.Counter[int]') -> None:
+        # Precision of each line (see stats.precision_names)
+        self.line_map = line_map
+        # Occurrences of each kind of Any on a line, in order of first occurrence
+        self.any_line_counts = any_line_counts
+        # The remaining values don't include untyped functions
+        self.typed_num_exprs = typed_num_exprs
+        self.typed_num_any_exprs = typed_num_any_exprs
+        self.typed_num_unanalyzed_lines = typed_num_unanalyzed_lines
+        self.typed_type_of_any_counter = typed_type_of_any_counter
+
+    @classmethod
+    def from_visitor(cls, visitor: stats.StatisticsVisitor) -> 'PrecisionStats':
+        any_line_counts = {}  # type: Dict[int, List[Tuple[int, int]]]
+        for line, types in visitor.any_line_map.items():
+            counter = collections.Counter(typ.type_of_any for typ in types)
+            any_line_counts[line] = list(counter.items())
+        return cls(visitor.line_map,
+                   any_line_counts,
+                   visitor.typed_num_exprs,
+                   visitor.typed_num_any_exprs,
+                   list(visitor.typed_line_map.values()).count(stats.TYPE_UNANALYZED),
+                   visitor.typed_type_of_any_counter)
+
+    def serialize(self) -> JsonDict:
+        # JSON object keys are strings, so integer keyed maps are stored as pairs.
+        return {'line_map': list(self.line_map.items()),
+                'any_line_counts': list(self.any_line_counts.items()),
+                'typed_num_exprs': self.typed_num_exprs,
+                'typed_num_any_exprs': self.typed_num_any_exprs,
+                'typed_num_unanalyzed_lines': self.typed_num_unanalyzed_lines,
+                'typed_type_of_any_counter': list(self.typed_type_of_any_counter.items()),
+                }
+
+    @classmethod
+    def deserialize(cls, data: JsonDict) -> 'PrecisionStats':
+        return cls({line: status for line, status in data['line_map']},
+                   {line: [(any_type, count) for any_type, count in counts]
+                    for line, counts in data['any_line_counts']},
+                   data['typed_num_exprs'],
+                   data['typed_num_any_exprs'],
+                   data['typed_num_unanalyzed_lines'],
+                   collections.Counter(dict(data['typed_type_of_any_counter'])))
+
+
 class AbstractReporter(metaclass=ABCMeta):
+    # Groups of file statistics used by on_file() (see FileStats)
+    stats_groups = []  # type: List[str]
+
     def __init__(self, reports: Reports, output_dir: str) -> None:
         self.output_dir = output_dir
         if output_dir != '<memory>':
             stats.ensure_dir_exists(output_dir)
 
     @abstractmethod
-    def on_file(self, tree: MypyFile, type_map: Dict[Expression, Type], options: Options) -> None:
+    def on_file(self, file_stats: FileStats, options: Options) -> None:
         pass
 
     @abstractmethod
     def on_finish(self) -> None:
         pass
 
+    def _write_out_report(self,
+                          filename: str,
+                          header: List[str],
+                          rows: List[List[str]],
+                          footer: List[str],
+                          ) -> None:
+        row_len = len(header)
+        assert all(len(row) == row_len for row in rows + [header, footer])
+        min_column_distance = 3  # minimum distance between numbers in two columns
+        widths = [-1] * row_len
+        for row in rows + [header, footer]:
+            for i, value in enumerate(row):
+                widths[i] = max(widths[i], len(value))
+        for i, w in enumerate(widths):
+            # Do not add min_column_distance to the first column.
+            if i > 0:
+                widths[i] = w + min_column_distance
+        with open(os.path.join(self.output_dir, filename), 'w') as f:
+            header_str = ("{:>{}}" * len(widths)).format(*itertools.chain(*zip(header, widths)))
+            separator = '-' * len(header_str)
+            f.write(header_str + '\n')
+            f.write(separator + '\n')
+            for row_values in rows:
+                r = ("{:>{}}" * len(widths)).format(*itertools.chain(*zip(row_values, widths)))
+                f.writelines(r + '\n')
+            f.write(separator + '\n')
+            footer_str = ("{:>{}}" * len(widths)).format(*itertools.chain(*zip(footer, widths)))
+            f.writelines(footer_str + '\n')
+
 
 def register_reporter(report_name: str,
                       reporter: Callable[[Reports, str], AbstractReporter],
@@ -123,22 +357,15 @@ class FuncCounterVisitor(TraverserVisitor):
 
 
 class LineCountReporter(AbstractReporter):
+    stats_groups = [FUNCTIONS]
+
     def __init__(self, reports: Reports, output_dir: str) -> None:
         super().__init__(reports, output_dir)
         self.counts = {}  # type: Dict[str, Tuple[int, int, int, int]]
 
-    def on_file(self,
-                tree: MypyFile,
-                type_map: Dict[Expression, Type],
-                options: Options) -> None:
-        # Count physical lines.  This assumes the file's encoding is a
-        # superset of ASCII (or at least uses \n in its line endings).
-        with open(tree.path, 'rb') as f:
-            physical_lines = len(f.readlines())
-
-        func_counter = FuncCounterVisitor()
-        tree.accept(func_counter)
-        unannotated_funcs, annotated_funcs = func_counter.counts
+    def on_file(self, file_stats: FileStats, options: Options) -> None:
+        physical_lines = file_stats.physical_lines
+        unannotated_funcs, annotated_funcs = file_stats.func_counts
         total_funcs = annotated_funcs + unannotated_funcs
 
         # Don't count lines or functions as annotated if they have their errors ignored.
@@ -148,8 +375,8 @@ class LineCountReporter(AbstractReporter):
         imputed_annotated_lines = (physical_lines * annotated_funcs // total_funcs
                                    if total_funcs else physical_lines)
 
-        self.counts[tree._fullname] = (imputed_annotated_lines, physical_lines,
-                                       annotated_funcs, total_funcs)
+        self.counts[file_stats.module] = (imputed_annotated_lines, physical_lines,
+                                          annotated_funcs, total_funcs)
 
     def on_finish(self) -> None:
         counts = sorted(((c, p) for p, c in self.counts.items()),
@@ -167,60 +394,28 @@ register_reporter('linecount', LineCountReporter)
 
 
 class AnyExpressionsReporter(AbstractReporter):
+    stats_groups = [PRECISION]
+
     def __init__(self, reports: Reports, output_dir: str) -> None:
         super().__init__(reports, output_dir)
         self.counts = {}  # type: Dict[str, Tuple[int, int]]
         self.any_types_counter = {}  # type: Dict[str, typing.Counter[int]]
 
-    def on_file(self,
-                tree: MypyFile,
-                type_map: Dict[Expression, Type],
-                options: Options) -> None:
-        visitor = stats.StatisticsVisitor(inferred=True, filename=tree.fullname(),
-                                          typemap=type_map, all_nodes=True,
-                                          visit_untyped_defs=False)
-        tree.accept(visitor)
-        self.any_types_counter[tree.fullname()] = visitor.type_of_any_counter
-        num_unanalyzed_lines = list(visitor.line_map.values()).count(stats.TYPE_UNANALYZED)
+    def on_file(self, file_stats: FileStats, options: Options) -> None:
+        # Untyped functions are not included.
+        precision = file_stats.precision
+        self.any_types_counter[file_stats.module] = precision.typed_type_of_any_counter
+        num_unanalyzed_lines = precision.typed_num_unanalyzed_lines
         # count each line of dead code as one expression of type "Any"
-        num_any = visitor.num_any_exprs + num_unanalyzed_lines
-        num_total = visitor.num_imprecise_exprs + visitor.num_precise_exprs + num_any
+        num_any = precision.typed_num_any_exprs + num_unanalyzed_lines
+        num_total = precision.typed_num_exprs + num_unanalyzed_lines
         if num_total > 0:
-            self.counts[tree.fullname()] = (num_any, num_total)
+            self.counts[file_stats.module] = (num_any, num_total)
 
     def on_finish(self) -> None:
         self._report_any_exprs()
         self._report_types_of_anys()
 
-    def _write_out_report(self,
-                          filename: str,
-                          header: List[str],
-                          rows: List[List[str]],
-                          footer: List[str],
-                          ) -> None:
-        row_len = len(header)
-        assert all(len(row) == row_len for row in rows + [header, footer])
-        min_column_distance = 3  # minimum distance between numbers in two columns
-        widths = [-1] * row_len
-        for row in rows + [header, footer]:
-            for i, value in enumerate(row):
-                widths[i] = max(widths[i], len(value))
-        for i, w in enumerate(widths):
-            # Do not add min_column_distance to the first column.
-            if i > 0:
-                widths[i] = w + min_column_distance
-        with open(os.path.join(self.output_dir, filename), 'w') as f:
-            header_str = ("{:>{}}" * len(widths)).format(*itertools.chain(*zip(header, widths)))
-            separator = '-' * len(header_str)
-            f.write(header_str + '\n')
-            f.write(separator + '\n')
-            for row_values in rows:
-                r = ("{:>{}}" * len(widths)).format(*itertools.chain(*zip(row_values, widths)))
-                f.writelines(r + '\n')
-            f.write(separator + '\n')
-            footer_str = ("{:>{}}" * len(widths)).format(*itertools.chain(*zip(footer, widths)))
-            f.writelines(footer_str + '\n')
-
     def _report_any_exprs(self) -> None:
         total_any = sum(num_any for num_any, _ in self.counts.values())
         total_expr = sum(total for _, total in self.counts.values())
@@ -257,6 +452,50 @@ class AnyExpressionsReporter(AbstractReporter):
 register_reporter('any-exprs', AnyExpressionsReporter)
 
 
+class TimingReporter(AbstractReporter):
+    """Report the time spent type checking each top-level target.
+
+    The number of subtype checks, overloaded calls and constraint solves in
+    each target is included, which helps to explain why checking it is slow.
+    Targets are sorted by time, slowest first.
+    """
+
+    def __init__(self, reports: Reports, output_dir: str) -> None:
+        super().__init__(reports, output_dir)
+        self.timer = reports.target_timer = TargetTimer()
+        timing.count_operations = True
+        self.modules = set()  # type: Set[str]
+
+    def on_file(self, file_stats: FileStats, options: Options) -> None:
+        self.modules.add(file_stats.module)
+
+    def on_finish(self) -> None:
+        targets = sorted(((values, target)
+                          for (module, target), values in self.timer.targets.items()
+                          if module in self.modules),
+                         key=lambda item: (-item[0][0], item[1]))
+        totals = [sum(values[i] for values, _ in targets) for i in range(len(TIMING_FIELDS))]
+
+        def format_row(name: str, values: List[float]) -> List[str]:
+            return [name, '{:.1f}'.format(values[0] * 1000)] + [str(int(v)) for v in values[1:]]
+
+        self._write_out_report('timing.txt',
+                               ['Target', 'Time (ms)', 'Subtype checks', 'Overload calls',
+                                'Constraint solves'],
+                               [format_row(target, values) for values, target in targets],
+                               format_row('Total', totals))
+        rows = []  # type: List[Dict[str, Any]]
+        for values, target in targets:
+            row = collections.OrderedDict([('target', target)])  # type: Dict[str, Any]
+            row.update(zip(TIMING_FIELDS, values))
+            rows.append(row)
+        with open(os.path.join(self.output_dir, 'timing.json'), 'w') as f:
+            json.dump(rows, f, indent=1)
+
+
+register_reporter('timing', TimingReporter)
+
+
 class LineCoverageVisitor(TraverserVisitor):
     def __init__(self, source: List[str]) -> None:
         self.source = source
@@ -357,26 +596,14 @@ class LineCoverageReporter(AbstractReporter):
     source file's absolute pathname the list of line numbers that
     belong to typed functions in that file.
     """
+    stats_groups = [COVERAGE]
+
     def __init__(self, reports: Reports, output_dir: str) -> None:
         super().__init__(reports, output_dir)
         self.lines_covered = {}  # type: Dict[str, List[int]]
 
-    def on_file(self,
-                tree: MypyFile,
-                type_map: Dict[Expression, Type],
-                options: Options) -> None:
-        with open(tree.path) as f:
-            tree_source = f.readlines()
-
-        coverage_visitor = LineCoverageVisitor(tree_source)
-        tree.accept(coverage_visitor)
-
-        covered_lines = []
-        for line_number, (_, typed) in enumerate(coverage_visitor.lines_covered):
-            if typed:
-                covered_lines.append(line_number + 1)
-
-        self.lines_covered[os.path.abspath(tree.path)] = covered_lines
+    def on_file(self, file_stats: FileStats, options: Options) -> None:
+        self.lines_covered[os.path.abspath(file_stats.path)] = file_stats.covered_lines
 
     def on_finish(self) -> None:
         with open(os.path.join(self.output_dir, 'coverage.json'), 'w') as f:
@@ -399,34 +626,59 @@ class FileInfo:
         return {name: str(val) for name, val in zip(stats.precision_names, self.counts)}
 
 
+def quote_xml_attribute(value: str) -> str:
+    if XML_ATTRIBUTE_SPECIAL_CHARS.search(value):
+        value = escape(value, XML_ATTRIBUTE_ENTITIES)
+    return '"' + value + '"'
+
+
+def format_xml_element(name: str, attrs: List[Tuple[str, str]], children: List[str]) -> str:
+    """Serialize an XML element, given its already serialized children."""
+    start = '<' + name + ''.join(' ' + key + '=' + quote_xml_attribute(value)
+                                 for key, value in attrs)
+    if not children:
+        return start + '/>'
+    return start + '>' + ''.join(children) + '</' + name + '>'
+
+
+def format_xml_document(xslt_path: str, root: str) -> bytes:
+    """Serialize an XML document that is transformed with the given stylesheet."""
+    pi = '<?xml-stylesheet type="text/xsl" href="%s"?>' % pathname2url(xslt_path)
+    return (pi + root).encode('utf-8')
+
+
 class MemoryXmlReporter(AbstractReporter):
     """Internal reporter that generates XML in memory.
 
     This is used by all other XML-based reporters to avoid duplication.
+    The XML is serialized as it is generated, without building an element
+    tree, since most reporters just write it out or hand it to a worker.
     """
 
+    stats_groups = [PRECISION]
+
     def __init__(self, reports: Reports, output_dir: str) -> None:
         super().__init__(reports, output_dir)
 
         self.xslt_html_path = os.path.join(reports.data_dir, 'xml', 'mypy-html.xslt')
         self.xslt_txt_path = os.path.join(reports.data_dir, 'xml', 'mypy-txt.xslt')
         self.css_html_path = os.path.join(reports.data_dir, 'xml', 'mypy-html.css')
-        xsd_path = os.path.join(reports.data_dir, 'xml', 'mypy.xsd')
-        self.schema = etree.XMLSchema(etree.parse(xsd_path))
-        self.last_xml = None  # type: Optional[Any]
+        self.schema = None  # type: Optional[Any]
+        if reports.validate:
+            xsd_path = os.path.join(reports.data_dir, 'xml', 'mypy.xsd')
+            self.schema = etree.XMLSchema(etree.parse(xsd_path))
+        self.last_xml = None  # type: Optional[bytes]
         self.files = []  # type: List[FileInfo]
 
     # XML doesn't like control characters, but they are sometimes
     # legal in source code (e.g. comments, string literals).
     # Tabs (#x09) are allowed in XML content.
     control_fixer = str.maketrans(''.join(chr(i) for i in range(32) if i != 9), '?' * 31)
+    control_chars = re.compile('[\x00-\x08\x0a-\x1f]')
 
-    def on_file(self,
-                tree: MypyFile,
-                type_map: Dict[Expression, Type],
-                options: Options) -> None:
+    def on_file(self, file_stats: FileStats, options: Options) -> None:
         self.last_xml = None
-        path = os.path.relpath(tree.path)
+        path = os.path.relpath(file_stats.path)
         if stats.is_special_module(path):
             return
         if path.startswith('..'):
@@ -434,41 +686,40 @@ class MemoryXmlReporter(AbstractReporter):
         if 'stubs' in path.split('/'):
             return
 
-        visitor = stats.StatisticsVisitor(inferred=True, filename=tree.fullname(),
-                                          typemap=type_map, all_nodes=True)
-        tree.accept(visitor)
-
-        root = etree.Element('mypy-report-file', name=path, module=tree._fullname)
-        doc = etree.ElementTree(root)
-        file_info = FileInfo(path, tree._fullname)
-
-        with tokenize.open(path) as input_file:
-            for lineno, line_text in enumerate(input_file, 1):
-                status = visitor.line_map.get(lineno, stats.TYPE_EMPTY)
-                file_info.counts[status] += 1
-                etree.SubElement(root, 'line',
-                                 number=str(lineno),
-                                 precision=stats.precision_names[status],
-                                 content=line_text.rstrip('\n').translate(self.control_fixer),
-                                 any_info=self._get_any_info_for_line(visitor, lineno))
+        precision = file_stats.precision
+        file_info = FileInfo(path, file_stats.module)
+
+        lines = []
+        for lineno, line_text in enumerate(file_stats.source, 1):
+            status = precision.line_map.get(lineno, stats.TYPE_EMPTY)
+            file_info.counts[status] += 1
+            content = line_text.rstrip('\n')
+            if self.control_chars.search(content):
+                content = content.translate(self.control_fixer)
+            # This is format_xml_element() for a line, inlined since it's hot.
+            lines.append('<line number="%d" precision="%s" content=%s any_info=%s/>' % (
+                lineno,
+                stats.precision_names[status],
+                quote_xml_attribute(content),
+                quote_xml_attribute(self._get_any_info_for_line(precision, lineno))))
+        root = format_xml_element('mypy-report-file',
+                                  [('name', path), ('module', file_stats.module)],
+                                  lines)
         # Assumes a layout similar to what XmlReporter uses.
         xslt_path = os.path.relpath('mypy-html.xslt', path)
-        transform_pi = etree.ProcessingInstruction('xml-stylesheet',
-                'type="text/xsl" href="%s"' % pathname2url(xslt_path))
-        root.addprevious(transform_pi)
-        self.schema.assertValid(doc)
-
-        self.last_xml = doc
+        self.last_xml = format_xml_document(xslt_path, root)
+        self.validate(self.last_xml)
         self.files.append(file_info)
 
+    def validate(self, xml: bytes) -> None:
+        if self.schema is not None:
+            self.schema.assertValid(etree.fromstring(xml))
+
     @staticmethod
-    def _get_any_info_for_line(visitor: stats.StatisticsVisitor, lineno: int) -> str:
-        if lineno in visitor.any_line_map:
+    def _get_any_info_for_line(precision: PrecisionStats, lineno: int) -> str:
+        if lineno in precision.any_line_counts:
             result = "Any Types on this line: "
-            counter = collections.Counter()  # type: typing.Counter[int]
-            for typ in visitor.any_line_map[lineno]:
-                counter[typ.type_of_any] += 1
-            for any_type, occurrences in counter.items():
+            for any_type, occurrences in precision.any_line_counts[lineno]:
                 result += "\n{} (x{})".format(type_of_any_name_map[any_type], occurrences)
             return result
         else:
@@ -479,22 +730,17 @@ class MemoryXmlReporter(AbstractReporter):
         # index_path = os.path.join(self.output_dir, 'index.xml')
         output_files = sorted(self.files, key=lambda x: x.module)
 
-        root = etree.Element('mypy-report-index', name='index')
-        doc = etree.ElementTree(root)
-
+        files = []
         for file_info in output_files:
-            etree.SubElement(root, 'file',
-                             file_info.attrib(),
-                             total=str(file_info.total()),
-                             name=file_info.name,
-                             module=file_info.module)
+            files.append(format_xml_element('file', [
+                ('total', str(file_info.total())),
+                ('name', file_info.name),
+                ('module', file_info.module),
+            ] + list(file_info.attrib().items()), []))
+        root = format_xml_element('mypy-report-index', [('name', 'index')], files)
         xslt_path = os.path.relpath('mypy-html.xslt', '.')
-        transform_pi = etree.ProcessingInstruction('xml-stylesheet',
-                'type="text/xsl" href="%s"' % pathname2url(xslt_path))
-        root.addprevious(transform_pi)
-        self.schema.assertValid(doc)
-
-        self.last_xml = doc
+        self.last_xml = format_xml_document(xslt_path, root)
+        self.validate(self.last_xml)
 
 
 register_reporter('memory-xml', MemoryXmlReporter, needs_lxml=True)
@@ -540,6 +786,8 @@ class CoberturaXmlReporter(AbstractReporter):
     """Reporter for generating Cobertura compliant XML.
     """
 
+    stats_groups = [PRECISION]
+
     def __init__(self, reports: Reports, output_dir: str) -> None:
         super().__init__(reports, output_dir)
 
@@ -549,17 +797,12 @@ class CoberturaXmlReporter(AbstractReporter):
         self.doc = etree.ElementTree(self.root)
         self.root_package = CoberturaPackage('.')
 
-    def on_file(self,
-                tree: MypyFile,
-                type_map: Dict[Expression, Type],
-                options: Options) -> None:
-        path = os.path.relpath(tree.path)
-        visitor = stats.StatisticsVisitor(inferred=True, filename=tree.fullname(),
-                                          typemap=type_map, all_nodes=True)
-        tree.accept(visitor)
+    def on_file(self, file_stats: FileStats, options: Options) -> None:
+        path = os.path.relpath(file_stats.path)
+        precision = file_stats.precision
 
         class_name = os.path.basename(path)
-        file_info = FileInfo(path, tree._fullname)
+        file_info = FileInfo(path, file_stats.module)
         class_element = etree.Element('class',
                                       filename=path,
                                       complexity='1.0',
@@ -567,47 +810,46 @@ class CoberturaXmlReporter(AbstractReporter):
         etree.SubElement(class_element, 'methods')
         lines_element = etree.SubElement(class_element, 'lines')
 
-        with tokenize.open(path) as input_file:
-            class_lines_covered = 0
-            class_total_lines = 0
-            for lineno, _ in enumerate(input_file, 1):
-                status = visitor.line_map.get(lineno, stats.TYPE_EMPTY)
-                hits = 0
-                branch = False
-                if status == stats.TYPE_EMPTY:
-                    continue
-                class_total_lines += 1
-                if status != stats.TYPE_ANY:
-                    class_lines_covered += 1
-                    hits = 1
-                if status == stats.TYPE_IMPRECISE:
-                    branch = True
-                file_info.counts[status] += 1
-                line_element = etree.SubElement(lines_element, 'line',
-                                                number=str(lineno),
-                                                precision=stats.precision_names[status],
-                                                hits=str(hits),
-                                                branch=str(branch).lower())
-                if branch:
-                    line_element.attrib['condition-coverage'] = '50% (1/2)'
-            class_element.attrib['branch-rate'] = '0'
-            class_element.attrib['line-rate'] = get_line_rate(class_lines_covered,
-                                                              class_total_lines)
-            # parent_module is set to whichever module contains this file.  For most files, we want
-            # to simply strip the last element off of the module.  But for __init__.py files,
-            # the module == the parent module.
-            parent_module = file_info.module.rsplit('.', 1)[0]
-            if file_info.name.endswith('__init__.py'):
-                parent_module = file_info.module
-
-            if parent_module not in self.root_package.packages:
-                self.root_package.packages[parent_module] = CoberturaPackage(parent_module)
-            current_package = self.root_package.packages[parent_module]
-            packages_to_update = [self.root_package, current_package]
-            for package in packages_to_update:
-                package.total_lines += class_total_lines
-                package.covered_lines += class_lines_covered
-            current_package.classes[class_name] = class_element
+        class_lines_covered = 0
+        class_total_lines = 0
+        for lineno in range(1, len(file_stats.source) + 1):
+            status = precision.line_map.get(lineno, stats.TYPE_EMPTY)
+            hits = 0
+            branch = False
+            if status == stats.TYPE_EMPTY:
+                continue
+            class_total_lines += 1
+            if status != stats.TYPE_ANY:
+                class_lines_covered += 1
+                hits = 1
+            if status == stats.TYPE_IMPRECISE:
+                branch = True
+            file_info.counts[status] += 1
+            line_element = etree.SubElement(lines_element, 'line',
+                                            number=str(lineno),
+                                            precision=stats.precision_names[status],
+                                            hits=str(hits),
+                                            branch=str(branch).lower())
+            if branch:
+                line_element.attrib['condition-coverage'] = '50% (1/2)'
+        class_element.attrib['branch-rate'] = '0'
+        class_element.attrib['line-rate'] = get_line_rate(class_lines_covered,
+                                                          class_total_lines)
+        # parent_module is set to whichever module contains this file.  For most files, we want
+        # to simply strip the last element off of the module.  But for __init__.py files,
+        # the module == the parent module.
+        parent_module = file_info.module.rsplit('.', 1)[0]
+        if file_info.name.endswith('__init__.py'):
+            parent_module = file_info.module
+
+        if parent_module not in self.root_package.packages:
+            self.root_package.packages[parent_module] = CoberturaPackage(parent_module)
+        current_package = self.root_package.packages[parent_module]
+        packages_to_update = [self.root_package, current_package]
+        for package in packages_to_update:
+            package.total_lines += class_total_lines
+            package.covered_lines += class_lines_covered
+        current_package.classes[class_name] = class_element
 
     def on_finish(self) -> None:
         self.root.attrib['line-rate'] = get_line_rate(self.root_package.covered_lines,
@@ -646,19 +888,17 @@ class XmlReporter(AbstractXmlReporter):
     that makes it fail from file:// URLs but work on http:// URLs.
     """
 
-    def on_file(self,
-                tree: MypyFile,
-                type_map: Dict[Expression, Type],
-                options: Options) -> None:
+    def on_file(self, file_stats: FileStats, options: Options) -> None:
         last_xml = self.memory_xml.last_xml
         if last_xml is None:
             return
-        path = os.path.relpath(tree.path)
+        path = os.path.relpath(file_stats.path)
         if path.startswith('..'):
             return
         out_path = os.path.join(self.output_dir, 'xml', path + '.xml')
         stats.ensure_dir_exists(os.path.dirname(out_path))
-        last_xml.write(out_path, encoding='utf-8')
+        with open(out_path, 'wb') as out_file:
+            out_file.write(last_xml)
 
     def on_finish(self) -> None:
         last_xml = self.memory_xml.last_xml
@@ -666,7 +906,8 @@ class XmlReporter(AbstractXmlReporter):
         out_path = os.path.join(self.output_dir, 'index.xml')
         out_xslt = os.path.join(self.output_dir, 'mypy-html.xslt')
         out_css = os.path.join(self.output_dir, 'mypy-html.css')
-        last_xml.write(out_path, encoding='utf-8')
+        with open(out_path, 'wb') as out_file:
+            out_file.write(last_xml)
         shutil.copyfile(self.memory_xml.xslt_html_path, out_xslt)
         shutil.copyfile(self.memory_xml.css_html_path, out_css)
         print('Generated XML report:', os.path.abspath(out_path))
@@ -686,38 +927,64 @@ class XsltHtmlReporter(AbstractXmlReporter):
         super().__init__(reports, output_dir)
 
         self.xslt_html = etree.XSLT(etree.parse(self.memory_xml.xslt_html_path))
-        self.param_html = etree.XSLT.strparam('html')
+        self.workers = reports.workers
+        # Started when the first file is converted, if there are workers
+        self.executor = None  # type: Optional[ProcessPoolExecutor]
+        self.pending = []  # type: List[Future[None]]
 
-    def on_file(self,
-                tree: MypyFile,
-                type_map: Dict[Expression, Type],
-                options: Options) -> None:
+    def on_file(self, file_stats: FileStats, options: Options) -> None:
         last_xml = self.memory_xml.last_xml
         if last_xml is None:
             return
-        path = os.path.relpath(tree.path)
+        path = os.path.relpath(file_stats.path)
         if path.startswith('..'):
             return
         out_path = os.path.join(self.output_dir, 'html', path + '.html')
         stats.ensure_dir_exists(os.path.dirname(out_path))
-        transformed_html = bytes(self.xslt_html(last_xml, ext=self.param_html))
-        with open(out_path, 'wb') as out_file:
-            out_file.write(transformed_html)
+        if self.workers > 0:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.workers)
+            self.pending.append(self.executor.submit(
+                transform_html, self.memory_xml.xslt_html_path, last_xml, out_path))
+        else:
+            write_html(self.xslt_html, last_xml, out_path)
 
     def on_finish(self) -> None:
+        if self.executor is not None:
+            try:
+                for future in self.pending:
+                    future.result()
+            finally:
+                self.executor.shutdown()
+                self.executor = None
+                self.pending = []
         last_xml = self.memory_xml.last_xml
         assert last_xml is not None
         out_path = os.path.join(self.output_dir, 'index.html')
         out_css = os.path.join(self.output_dir, 'mypy-html.css')
-        transformed_html = bytes(self.xslt_html(last_xml, ext=self.param_html))
-        with open(out_path, 'wb') as out_file:
-            out_file.write(transformed_html)
+        write_html(self.xslt_html, last_xml, out_path)
         shutil.copyfile(self.memory_xml.css_html_path, out_css)
         print('Generated HTML report (via XSLT):', os.path.abspath(out_path))
 
 
 register_reporter('xslt-html', XsltHtmlReporter, needs_lxml=True)
 
+# Compiled HTML stylesheets by path, in worker processes
+_html_transforms = {}  # type: Dict[str, Any]
+
+
+def write_html(transform: Any, xml: bytes, out_path: str) -> None:
+    transformed_html = bytes(transform(etree.fromstring(xml), ext=etree.XSLT.strparam('html')))
+    with open(out_path, 'wb') as out_file:
+        out_file.write(transformed_html)
+
+
+def transform_html(xslt_path: str, xml: bytes, out_path: str) -> None:
+    """Convert the XML report of a file to HTML in a worker process."""
+    if xslt_path not in _html_transforms:
+        _html_transforms[xslt_path] = etree.XSLT(etree.parse(xslt_path))
+    write_html(_html_transforms[xslt_path], xml, out_path)
+
 
 class XsltTxtReporter(AbstractXmlReporter):
     """Public reporter that exports TXT via XSLT.
@@ -730,17 +997,14 @@ class XsltTxtReporter(AbstractXmlReporter):
 
         self.xslt_txt = etree.XSLT(etree.parse(self.memory_xml.xslt_txt_path))
 
-    def on_file(self,
-                tree: MypyFile,
-                type_map: Dict[Expression, Type],
-                options: Options) -> None:
+    def on_file(self, file_stats: FileStats, options: Options) -> None:
         pass
 
     def on_finish(self) -> None:
         last_xml = self.memory_xml.last_xml
         assert last_xml is not None
         out_path = os.path.join(self.output_dir, 'index.txt')
-        transformed_txt = bytes(self.xslt_txt(last_xml))
+        transformed_txt = bytes(self.xslt_txt(etree.fromstring(last_xml)))
         with open(out_path, 'wb') as out_file:
             out_file.write(transformed_txt)
         print('Generated TXT report (via XSLT):', os.path.abspath(out_path))
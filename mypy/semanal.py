@@ -84,7 +84,8 @@ from mypy.plugin import (
 )
 from mypy.util import get_prefix, correct_relative_import
 from mypy.semanal_shared import SemanticAnalyzerInterface, set_callable_name
-from mypy.scope import Scope
+from mypy.scope import Scope, SavedScope
+from mypy.lookup import FullnameIndex
 from mypy.semanal_namedtuple import NamedTupleAnalyzer, NAMEDTUPLE_PROHIBITED_NAMES
 from mypy.semanal_typeddict import TypedDictAnalyzer
 from mypy.semanal_enum import EnumCallAnalyzer
@@ -221,11 +222,13 @@ class SemanticAnalyzerPass2(NodeVisitor[None],
                  modules: Dict[str, MypyFile],
                  missing_modules: Set[str],
                  errors: Errors,
-                 plugin: Plugin) -> None:
+                 plugin: Plugin,
+                 fullname_index: Optional[FullnameIndex] = None) -> None:
         """Construct semantic analyzer.
 
         Use lib_path to search for modules, and report analysis errors
-        using the Errors instance.
+        using the Errors instance. If fullname_index is given, use it to find
+        symbols in other modules by fully qualified name.
         """
         self.locals = [None]
         self.imports = set()
@@ -237,6 +240,7 @@ class SemanticAnalyzerPass2(NodeVisitor[None],
         self.loop_depth = 0
         self.errors = errors
         self.modules = modules
+        self.fullname_index = fullname_index
         self.msg = MessageBuilder(errors, modules)
         self.missing_modules = missing_modules
         self.postpone_nested_functions_stack = [FUNCTION_BOTH_PHASES]
@@ -247,6 +251,9 @@ class SemanticAnalyzerPass2(NodeVisitor[None],
         # for processing module top levels in fine-grained incremental mode.
         self.recurse_into_functions = True
         self.scope = Scope()
+        # Nodes that need to be processed in semantic analysis pass 3, with the scopes
+        # in which they were found (None if pass 3 should traverse the whole file)
+        self.pass3_worklist = None  # type: Optional[List[Tuple[Node, SavedScope]]]
 
     # mypyc doesn't properly handle implementing an abstractproperty
     # with a regular attribute so we make it a property
@@ -273,6 +280,7 @@ class SemanticAnalyzerPass2(NodeVisitor[None],
         """
         self.recurse_into_functions = True
         self.options = options
+        self.pass3_worklist = [] if options.semantic_analysis_worklist else None
         self.errors.set_file(fnam, file_node.fullname(), scope=self.scope)
         self.cur_mod_node = file_node
         self.cur_mod_id = file_node.fullname()
@@ -322,6 +330,7 @@ class SemanticAnalyzerPass2(NodeVisitor[None],
                         patches: List[Tuple[int, Callable[[], None]]]) -> None:
         """Refresh a stale target in fine-grained incremental mode."""
         self.patches = patches
+        self.pass3_worklist = None
         if isinstance(node, MypyFile):
             self.refresh_top_level(node)
         else:
@@ -369,6 +378,8 @@ class SemanticAnalyzerPass2(NodeVisitor[None],
         if not self.recurse_into_functions:
             return
         with self.scope.function_scope(defn):
+            if self.postpone_nested_functions_stack[-1] != FUNCTION_SECOND_PHASE:
+                self.defer_to_pass3(defn)
             self._visit_func_def(defn)
 
     def _visit_func_def(self, defn: FuncDef) -> None:
@@ -517,12 +528,19 @@ class SemanticAnalyzerPass2(NodeVisitor[None],
     def visit_overloaded_func_def(self, defn: OverloadedFuncDef) -> None:
         if not self.recurse_into_functions:
             return
+        # Pass 3 only visits the items that remain after this pass (for example,
+        # a redefinition isn't an item), so it traverses the entire definition
+        # instead of processing the nodes recorded within it.
+        self.defer_to_pass3(defn)
+        worklist = self.pass3_worklist
+        self.pass3_worklist = None
         # NB: Since _visit_overloaded_func_def will call accept on the
         # underlying FuncDefs, the function might get entered twice.
         # This is fine, though, because only the outermost function is
         # used to compute targets.
         with self.scope.function_scope(defn):
             self._visit_overloaded_func_def(defn)
+        self.pass3_worklist = worklist
 
     def _visit_overloaded_func_def(self, defn: OverloadedFuncDef) -> None:
         # OverloadedFuncDef refers to any legitimate situation where you have
@@ -794,10 +812,13 @@ class SemanticAnalyzerPass2(NodeVisitor[None],
 
     def visit_class_def(self, defn: ClassDef) -> None:
         with self.scope.class_scope(defn.info):
+            self.defer_to_pass3(defn)
             with self.analyze_class_body(defn) as should_continue:
                 if should_continue:
                     # Analyze class body.
                     defn.defs.accept(self)
+            # Pass 3 analyzes the class symbol table after the class body.
+            self.defer_to_pass3(defn.info)
 
     @contextmanager
     def analyze_class_body(self, defn: ClassDef) -> Iterator[bool]:
@@ -851,7 +872,11 @@ class SemanticAnalyzerPass2(NodeVisitor[None],
                 yield True
                 self.calculate_abstract_status(defn.info)
                 self.setup_type_promotion(defn)
+                num_defs = len(defn.defs.body)
                 self.apply_class_plugin_hooks(defn)
+                if len(defn.defs.body) > num_defs:
+                    # Plugins may add definitions, which pass 3 still needs to visit.
+                    self.defer_to_pass3(Block(defn.defs.body[num_defs:]))
                 self.leave_class()
 
     def apply_class_plugin_hooks(self, defn: ClassDef) -> None:
@@ -1740,6 +1765,11 @@ class SemanticAnalyzerPass2(NodeVisitor[None],
         self.cur_mod_node.alias_deps[target].update(aliases_used)
 
     def visit_assignment_stmt(self, s: AssignmentStmt) -> None:
+        # Pass 3 has nothing to do for most assignments without an annotation: the
+        # declared type of an existing variable is analyzed where it is declared.
+        if (s.type is not None or isinstance(s.rvalue, (IndexExpr, CallExpr))
+                or self.is_class_scope()):
+            self.defer_to_pass3(s)
         self.unwrap_final(s)
 
         def final_cb(keep_final: bool) -> None:
@@ -2647,6 +2677,8 @@ class SemanticAnalyzerPass2(NodeVisitor[None],
                                 dec)
         if not no_type_check and self.recurse_into_functions:
             dec.func.accept(self)
+        # Pass 3 infers the decorated type only after processing the function.
+        self.defer_to_pass3(dec)
         if dec.decorators and dec.var.is_property:
             self.fail('Decorated property not supported', dec)
 
@@ -2692,6 +2724,7 @@ class SemanticAnalyzerPass2(NodeVisitor[None],
         self.visit_block_maybe(s.else_body)
 
     def visit_for_stmt(self, s: ForStmt) -> None:
+        self.defer_to_pass3(s)
         s.expr.accept(self)
 
         # Bind index variables and check if they define new names.
@@ -2742,6 +2775,7 @@ class SemanticAnalyzerPass2(NodeVisitor[None],
             s.finally_body.accept(visitor)
 
     def visit_with_stmt(self, s: WithStmt) -> None:
+        self.defer_to_pass3(s)
         types = []  # type: List[Type]
 
         if s.target_type:
@@ -3187,6 +3221,7 @@ class SemanticAnalyzerPass2(NodeVisitor[None],
                 types.append(typearg)
             expr.analyzed = TypeApplication(expr.base, types)
             expr.analyzed.line = expr.line
+            self.defer_to_pass3(expr.analyzed)
             # Types list, dict, set are not subscriptable, prohibit this if
             # subscripted either via type alias...
             if isinstance(expr.base, RefExpr) and isinstance(expr.base.node, TypeAlias):
@@ -3223,6 +3258,7 @@ class SemanticAnalyzerPass2(NodeVisitor[None],
             expr.stride.accept(self)
 
     def visit_cast_expr(self, expr: CastExpr) -> None:
+        self.defer_to_pass3(expr)
         expr.expr.accept(self)
         expr.type = self.anal_type(expr.type)
 
@@ -3522,6 +3558,10 @@ class SemanticAnalyzerPass2(NodeVisitor[None],
         Assume that the name is defined. This happens in the global namespace -- the local
         module namespace is ignored.
         """
+        if self.fullname_index is not None:
+            sym = self.fullname_index.lookup(name, module_level=True)
+            if sym is not None:
+                return sym
         parts = name.split('.')
         n = self.modules[parts[0]]
         for i in range(1, len(parts) - 1):
@@ -3543,6 +3583,10 @@ class SemanticAnalyzerPass2(NodeVisitor[None],
         # TODO: support nested classes (but consider performance impact,
         #       we might keep the module level only lookup for thing like 'builtins.int').
         assert '.' in fullname
+        if self.fullname_index is not None:
+            sym = self.fullname_index.lookup(fullname, module_level=True)
+            if sym is not None:
+                return sym
         module, name = fullname.rsplit('.', maxsplit=1)
         if module not in self.modules:
             return None
@@ -3709,6 +3753,15 @@ class SemanticAnalyzerPass2(NodeVisitor[None],
         except Exception as err:
             report_internal_error(err, self.errors.file, node.line, self.errors, self.options)
 
+    def defer_to_pass3(self, node: Node) -> None:
+        """Record a node that semantic analysis pass 3 needs to process.
+
+        This is only done if the file is processed using a pass 3 worklist
+        (see Options.semantic_analysis_worklist).
+        """
+        if self.pass3_worklist is not None:
+            self.pass3_worklist.append((node, self.scope.save()))
+
     def analyze_type_expr(self, expr: Expression) -> None:
         # There are certain expressions that mypy does not need to semantically analyze,
         # since they analyzed solely as type. (For example, indexes in type alias definitions
@@ -10,6 +10,7 @@ belongs to a module involved in an import loop.
 """
 
 from collections import OrderedDict
+from itertools import groupby
 from typing import Dict, List, Callable, Optional, Union, cast, Tuple
 
 from mypy import messages, state
@@ -33,7 +34,7 @@ from mypy.semanal_shared import PRIORITY_FORWARD_REF, PRIORITY_TYPEVAR_VALUES
 from mypy.semanal import SemanticAnalyzerPass2
 from mypy.subtypes import is_subtype
 from mypy.sametypes import is_same_type
-from mypy.scope import Scope
+from mypy.scope import Scope, SavedScope
 from mypy.semanal_shared import SemanticAnalyzerCoreInterface
 
 
@@ -55,7 +56,13 @@ class SemanticAnalyzerPass3(TraverserVisitor, SemanticAnalyzerCoreInterface):
         self.recurse_into_functions = True
 
     def visit_file(self, file_node: MypyFile, fnam: str, options: Options,
-                   patches: List[Tuple[int, Callable[[], None]]]) -> None:
+                   patches: List[Tuple[int, Callable[[], None]]],
+                   worklist: Optional[List[Tuple[Node, SavedScope]]] = None) -> None:
+        """Run semantic analysis phase 3 over a file.
+
+        If worklist is given, only process the nodes recorded in it by semantic
+        analysis pass 2 instead of traversing the entire file.
+        """
         self.recurse_into_functions = True
         self.errors.set_file(fnam, file_node.fullname(), scope=self.scope)
         self.options = options
@@ -66,9 +73,12 @@ class SemanticAnalyzerPass3(TraverserVisitor, SemanticAnalyzerCoreInterface):
         self.cur_mod_node = file_node
         self.sem.globals = file_node.names
         with state.strict_optional_set(options.strict_optional):
-            self.scope.enter_file(file_node.fullname())
             self.update_imported_vars()
-            self.accept(file_node)
+            if worklist is not None:
+                self.process_worklist(worklist)
+            self.scope.enter_file(file_node.fullname())
+            if worklist is None:
+                self.accept(file_node)
             self.analyze_symbol_table(file_node.names)
             self.scope.leave()
         del self.cur_mod_node
@@ -141,6 +151,49 @@ class SemanticAnalyzerPass3(TraverserVisitor, SemanticAnalyzerCoreInterface):
         except Exception as err:
             report_internal_error(err, self.errors.file, node.line, self.errors, self.options)
 
+    def process_worklist(self, worklist: List[Tuple[Node, SavedScope]]) -> None:
+        """Process nodes recorded by pass 2 without traversing the file."""
+        # Consecutive nodes are usually in the same scope, so only enter it once.
+        for saved, items in groupby(worklist, key=lambda item: item[1]):
+            with self.scope.saved_scope(saved):
+                for node, _ in items:
+                    try:
+                        self.process_node(node)
+                    except Exception as err:
+                        report_internal_error(err, self.errors.file, node.line, self.errors,
+                                              self.options)
+
+    def process_node(self, node: Node) -> None:
+        """Do the work of the visit method of a node, but don't visit nested nodes.
+
+        Nested nodes have their own worklist entries.
+        """
+        if isinstance(node, (OverloadedFuncDef, Block)):
+            # Pass 2 doesn't record the nodes within overloaded definitions
+            # or within definitions added by plugins.
+            node.accept(self)
+        elif isinstance(node, FuncDef):
+            self.analyze(node.type, node)
+        elif isinstance(node, ClassDef):
+            self.analyze_class_def(node)
+        elif isinstance(node, TypeInfo):
+            self.analyze_symbol_table(node.names)
+        elif isinstance(node, Decorator):
+            self.analyze_decorator(node)
+        elif isinstance(node, AssignmentStmt):
+            self.analyze_assignment_stmt(node)
+        elif isinstance(node, ForStmt):
+            self.analyze(node.index_type, node)
+        elif isinstance(node, WithStmt):
+            self.analyze(node.target_type, node)
+        elif isinstance(node, CastExpr):
+            self.analyze(node.type, node)
+        elif isinstance(node, TypeApplication):
+            for typ in node.types:
+                self.analyze(typ, node)
+        else:
+            assert False, 'Unexpected node in pass 3 worklist: {}'.format(type(node))
+
     def visit_block(self, b: Block) -> None:
         if b.is_unreachable:
             return
@@ -161,9 +214,15 @@ class SemanticAnalyzerPass3(TraverserVisitor, SemanticAnalyzerCoreInterface):
             super().visit_overloaded_func_def(fdef)
 
     def visit_class_def(self, tdef: ClassDef) -> None:
+        self.scope.enter_class(tdef.info)
+        self.analyze_class_def(tdef)
+        super().visit_class_def(tdef)
+        self.analyze_symbol_table(tdef.info.names)
+        self.scope.leave()
+
+    def analyze_class_def(self, tdef: ClassDef) -> None:
         # NamedTuple base classes are validated in check_namedtuple_classdef; we don't have to
         # check them again here.
-        self.scope.enter_class(tdef.info)
         if not tdef.info.is_named_tuple:
             types = list(tdef.info.bases)  # type: List[Type]
             for tvar in tdef.type_vars:
@@ -193,9 +252,6 @@ class SemanticAnalyzerPass3(TraverserVisitor, SemanticAnalyzerCoreInterface):
             elif isinstance(tdef.analyzed, NamedTupleExpr):
                 self.analyze(tdef.analyzed.info.tuple_type, tdef.analyzed, warn=True)
                 self.analyze_synthetic_info(tdef.analyzed.info)
-        super().visit_class_def(tdef)
-        self.analyze_symbol_table(tdef.info.names)
-        self.scope.leave()
 
     def visit_decorator(self, dec: Decorator) -> None:
         """Try to infer the type of the decorated function.
@@ -214,6 +270,9 @@ class SemanticAnalyzerPass3(TraverserVisitor, SemanticAnalyzerCoreInterface):
             decorator.accept(self)
         if self.recurse_into_functions:
             dec.func.accept(self)
+        self.analyze_decorator(dec)
+
+    def analyze_decorator(self, dec: Decorator) -> None:
         if dec.var.is_property:
             # Decorators are expected to have a callable type (it's a little odd).
             if dec.func.type is None:
@@ -263,6 +322,10 @@ class SemanticAnalyzerPass3(TraverserVisitor, SemanticAnalyzerCoreInterface):
         resulted from this assignment (if any). Currently this includes
         NewType, TypedDict, NamedTuple, and TypeVar.
         """
+        self.analyze_assignment_stmt(s)
+        super().visit_assignment_stmt(s)
+
+    def analyze_assignment_stmt(self, s: AssignmentStmt) -> None:
         self.analyze(s.type, s)
         if isinstance(s.rvalue, IndexExpr) and isinstance(s.rvalue.analyzed, TypeAliasExpr):
             self.analyze(s.rvalue.analyzed.type, s.rvalue.analyzed, warn=True)
@@ -303,7 +366,6 @@ class SemanticAnalyzerPass3(TraverserVisitor, SemanticAnalyzerCoreInterface):
                     if (tnode is not None and isinstance(tnode.node, Var)
                             and tnode.node.is_classvar):
                         var.is_classvar = True
-        super().visit_assignment_stmt(s)
 
     def visit_for_stmt(self, s: ForStmt) -> None:
         self.analyze(s.index_type, s)
@@ -45,14 +45,14 @@ Discussion of some notable special cases:
 See the main entry point merge_asts for more details.
 """
 
-from typing import Dict, List, cast, TypeVar, Optional
+from typing import Dict, List, cast, TypeVar, Optional, Sequence, Union
 
 from mypy.nodes import (
     MypyFile, SymbolTable, Block, AssignmentStmt, NameExpr, MemberExpr, RefExpr, TypeInfo,
     FuncDef, ClassDef, NamedTupleExpr, SymbolNode, Var, Statement, SuperExpr, NewTypeExpr,
     OverloadedFuncDef, LambdaExpr, TypedDictExpr, EnumCallExpr, FuncBase, TypeAliasExpr, CallExpr,
     CastExpr,
-    MDEF
+    Decorator, MDEF
 )
 from mypy.traverser import TraverserVisitor
 from mypy.types import (
@@ -65,6 +65,11 @@ from mypy.util import get_prefix, replace_object_state
 from mypy.typestate import TypeState
 
 
+# If True, check that merge_reprocessed_targets updates all references by
+# walking the entire module afterwards (used in tests)
+CHECK_RESTRICTED_MERGE = False
+
+
 def merge_asts(old: MypyFile, old_symbols: SymbolTable,
                new: MypyFile, new_symbols: SymbolTable) -> None:
     """Merge a new version of a module AST to a previous version.
@@ -94,6 +99,52 @@ def merge_asts(old: MypyFile, old_symbols: SymbolTable,
     replace_nodes_in_symbol_table(new_symbols, replacement_map)
 
 
+def merge_reprocessed_targets(
+        file_node: MypyFile,
+        old_symbols: Dict[str, SymbolTable],
+        new_symbols: Dict[str, SymbolTable],
+        targets: Sequence[Union[MypyFile, FuncDef, OverloadedFuncDef]]) -> None:
+    """Merge definitions recreated when reprocessing some targets of a module.
+
+    This is like merge_asts, but the old and new symbol tables are snapshots
+    of the same module AST taken before and after the targets were reprocessed
+    (semantic analysis may recreate some nodes, such as named tuples defined
+    using assignment statements). The symbol tables are keyed by the full
+    names of the module and the classes within it.
+
+    Only nodes that were recreated need new identities, and the only references
+    to them are in the reprocessed targets and in the symbol tables, since the
+    rest of the program was analyzed before they were created. The targets are
+    the ones triggered through fine-grained dependencies, so we only traverse
+    those instead of the entire module. Tests check for missed references with
+    a full walk (see CHECK_RESTRICTED_MERGE).
+    """
+    replacements = {}  # type: Dict[SymbolNode, SymbolNode]
+    for name, symbols in old_symbols.items():
+        if name in new_symbols:
+            replacement_map = replacement_map_from_symbol_table(
+                symbols, new_symbols[name], prefix=file_node.fullname())
+            # Most definitions are unaffected by reprocessing and map to themselves.
+            replacements.update((new, old) for new, old in replacement_map.items()
+                                if new is not old)
+    if not replacements:
+        return
+    visitor = NodeReplaceVisitor(replacements)
+    for target in targets:
+        if isinstance(target, MypyFile):
+            # Function bodies aren't part of the module top level.
+            visitor.recurse_into_functions = False
+            visitor.visit_mypy_file(target)
+            visitor.recurse_into_functions = True
+        else:
+            target.accept(visitor)
+    for symbols in new_symbols.values():
+        replace_nodes_in_symbol_table(symbols, replacements)
+    if CHECK_RESTRICTED_MERGE:
+        from mypy.server.mergecheck import check_restricted_merge
+        check_restricted_merge(file_node, replacements)
+
+
 def replacement_map_from_symbol_table(
         old: SymbolTable, new: SymbolTable, prefix: str) -> Dict[SymbolNode, SymbolNode]:
     """Create a new-to-old object identity map by comparing two symbol table revisions.
@@ -148,6 +199,8 @@ class NodeReplaceVisitor(TraverserVisitor):
 
     def __init__(self, replacements: Dict[SymbolNode, SymbolNode]) -> None:
         self.replacements = replacements
+        # If False, don't process functions (only used for module top levels)
+        self.recurse_into_functions = True
 
     def visit_mypy_file(self, node: MypyFile) -> None:
         node = self.fixup(node)
@@ -159,14 +212,25 @@ class NodeReplaceVisitor(TraverserVisitor):
         node.body = self.replace_statements(node.body)
 
     def visit_func_def(self, node: FuncDef) -> None:
+        if not self.recurse_into_functions:
+            return
         node = self.fixup(node)
         self.process_base_func(node)
         super().visit_func_def(node)
 
     def visit_overloaded_func_def(self, node: OverloadedFuncDef) -> None:
+        if not self.recurse_into_functions:
+            return
         self.process_base_func(node)
         super().visit_overloaded_func_def(node)
 
+    def visit_decorator(self, node: Decorator) -> None:
+        if self.recurse_into_functions:
+            node.func.accept(self)
+        node.var.accept(self)
+        for decorator in node.decorators:
+            decorator.accept(self)
+
     def visit_class_def(self, node: ClassDef) -> None:
         # TODO additional things?
         node.info = self.fixup_and_reset_typeinfo(node.info)
@@ -312,11 +376,15 @@ class NodeReplaceVisitor(TraverserVisitor):
     def process_synthetic_type_info(self, info: TypeInfo) -> None:
         # Synthetic types (types not created using a class statement) don't
         # have bodies in the AST so we need to iterate over their symbol
-        # tables separately, unlike normal classes.
+        # tables separately, unlike normal classes. Their methods are created
+        # together with the type, so they are processed even at module top level.
         self.process_type_info(info)
+        recurse_into_functions = self.recurse_into_functions
+        self.recurse_into_functions = True
         for name, node in info.names.items():
             if node.node:
                 node.node.accept(self)
+        self.recurse_into_functions = recurse_into_functions
 
     def replace_statements(self, nodes: List[Statement]) -> List[Statement]:
         result = []
@@ -357,7 +425,7 @@ class TypeReplaceVisitor(SyntheticTypeVisitor[None]):
         typ.ret_type.accept(self)
         if typ.definition:
             # No need to fixup since this is just a cross-reference.
-            typ.definition = self.replacements.get(typ.definition, typ.definition)
+            typ.definition = self.fixup(typ.definition)
         # Fallback can be None for callable types that haven't been semantically analyzed.
         if typ.fallback is not None:
             typ.fallback.accept(self)
@@ -456,4 +524,5 @@ def replace_nodes_in_symbol_table(symbols: SymbolTable,
 def fixup_var(node: Var, replacements: Dict[SymbolNode, SymbolNode]) -> None:
     if node.type:
         node.type.accept(TypeReplaceVisitor(replacements))
-    node.info = cast(TypeInfo, replacements.get(node.info, node.info))
+    if node.info in replacements:
+        node.info = cast(TypeInfo, replacements[node.info])
@@ -1,8 +1,9 @@
 """Check for duplicate AST nodes after merge."""
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Set, Tuple
 
-from mypy.nodes import SymbolNode, Var, Decorator, FuncDef
+from mypy.nodes import SymbolNode, Var, Decorator, FuncDef, MypyFile
+from mypy.server.astmerge import replace_nodes_in_ast
 from mypy.server.objgraph import get_reachable_graph, get_path
 
 MYPY = False
@@ -65,6 +66,35 @@ def check_consistency(o: object) -> None:
         assert sym.fullname() not in m
 
 
+class ReplacementLog(Dict[SymbolNode, SymbolNode]):
+    """Replacement map that records the nodes found to have replacements."""
+
+    def __init__(self, replacements: Dict[SymbolNode, SymbolNode]) -> None:
+        super().__init__(replacements)
+        self.found = set()  # type: Set[SymbolNode]
+
+    def __contains__(self, node: object) -> bool:
+        if super().__contains__(node):
+            assert isinstance(node, SymbolNode)
+            self.found.add(node)
+            return True
+        return False
+
+
+def check_restricted_merge(file_node: MypyFile,
+                           replacements: Dict[SymbolNode, SymbolNode]) -> None:
+    """Fail if a module refers to nodes replaced by a restricted merge.
+
+    Walk the entire module like a full merge would, and check that no
+    references to replaced nodes remain.
+    """
+    log = ReplacementLog(replacements)
+    replace_nodes_in_ast(file_node, log)
+    missed = sorted(str(node.fullname()) for node in log.found)
+    assert not missed, 'References to replaced nodes in {}: {}'.format(
+        file_node.fullname(), ', '.join(missed))
+
+
 def path_to_str(path: List[Tuple[object, object]]) -> str:
     result = '<root>'
     for attr, obj in path:
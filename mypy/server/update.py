@@ -135,12 +135,13 @@ from mypy.semanal import apply_semantic_analyzer_patches
 from mypy.server.astdiff import (
     snapshot_symbol_table, compare_symbol_table_snapshots, SnapshotItem
 )
-from mypy.server.astmerge import merge_asts
+from mypy.server.astmerge import merge_asts, merge_reprocessed_targets
 from mypy.server.aststrip import strip_target
 from mypy.server.deps import get_dependencies_of_target
 from mypy.server.target import module_prefix, split_target
 from mypy.server.trigger import make_trigger, WILDCARD_TAG
 from mypy.typestate import TypeState
+from mypy.types import reset_interned_types
 
 MYPY = False
 if MYPY:
@@ -213,6 +214,9 @@ class FineGrainedBuildManager:
 
         # Reset find_module's caches for the new build.
         self.manager.find_module_cache.clear()
+        # Interned types refer to TypeInfos that this update may replace, so don't keep
+        # sharing them across updates.
+        reset_interned_types()
 
         self.triggered = []
         self.updated_modules = []
@@ -613,6 +617,7 @@ def delete_module(module_id: str,
         del graph[module_id]
     if module_id in manager.modules:
         del manager.modules[module_id]
+    manager.fullname_index.remove_module(module_id)
     components = module_id.split('.')
     if len(components) > 1:
         # Delete reference to module in parent module.
@@ -732,6 +737,7 @@ def replace_modules_with_new_variants(
                        new_module, new_module.names)
             manager.modules[id] = preserved_module
             graph[id].tree = preserved_module
+            manager.fullname_index.add_module(preserved_module)
 
 
 def propagate_changes_using_dependencies(
@@ -924,9 +930,9 @@ def reprocess_nodes(manager: BuildManager,
     # the same, but other nodes may have been recreated with different identities, such as
     # NamedTuples defined using assignment statements.
     new_symbols = find_symbol_tables_recursive(file_node.fullname(), file_node.names)
-    for name in old_symbols:
-        if name in new_symbols:
-            merge_asts(file_node, old_symbols[name], file_node, new_symbols[name])
+    merge_reprocessed_targets(file_node, old_symbols, new_symbols,
+                              [deferred.node for deferred in nodes])
+    manager.fullname_index.add_module(file_node)
 
     # Type check.
     checker = graph[module_id].type_checker()
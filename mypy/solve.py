@@ -8,6 +8,7 @@ from mypy.constraints import Constraint, SUPERTYPE_OF
 from mypy.join import join_types
 from mypy.meet import meet_types
 from mypy.subtypes import is_subtype
+from mypy import timing
 
 
 def solve_constraints(vars: List[TypeVarId], constraints: List[Constraint],
@@ -21,6 +22,8 @@ def solve_constraints(vars: List[TypeVarId], constraints: List[Constraint],
     pick NoneTyp as the value of the type variable.  If strict=False,
     pick AnyType.
     """
+    if timing.count_operations:
+        timing.Counters.constraint_solves += 1
     # Collect a list of constraints for each type variable.
     cmap = defaultdict(list)  # type: Dict[TypeVarId, List[Constraint]]
     for con in constraints:
@@ -70,6 +70,15 @@ class StatisticsVisitor(TraverserVisitor):
         self.type_of_any_counter = Counter()  # type: typing.Counter[int]
         self.any_line_map = {}  # type: Dict[int, List[AnyType]]
 
+        # Number of enclosing untyped functions (only if visit_untyped_defs is set)
+        self.untyped_def_depth = 0
+        # Statistics excluding the bodies of untyped functions, so that one
+        # pass produces the results of visit_untyped_defs=False as well
+        self.typed_num_exprs = 0
+        self.typed_num_any_exprs = 0
+        self.typed_line_map = {}  # type: Dict[int, int]
+        self.typed_type_of_any_counter = Counter()  # type: typing.Counter[int]
+
         self.output = []  # type: List[str]
 
         TraverserVisitor.__init__(self)
@@ -95,8 +104,12 @@ class StatisticsVisitor(TraverserVisitor):
                 self.type(sig.ret_type)
             elif self.all_nodes:
                 self.record_line(self.line, TYPE_ANY)
-            if not o.is_dynamic() or self.visit_untyped_defs:
+            if not o.is_dynamic():
+                super().visit_func_def(o)
+            elif self.visit_untyped_defs:
+                self.untyped_def_depth += 1
                 super().visit_func_def(o)
+                self.untyped_def_depth -= 1
 
     def visit_class_def(self, o: ClassDef) -> None:
         # Override this method because we don't want to analyze base_type_exprs (base_type_exprs
@@ -201,6 +214,10 @@ class StatisticsVisitor(TraverserVisitor):
         else:
             self.num_precise_exprs += 1
             self.record_line(self.line, TYPE_PRECISE)
+        if not self.untyped_def_depth:
+            self.typed_num_exprs += 1
+            if isinstance(t, AnyType):
+                self.typed_num_any_exprs += 1
 
         for typ in collect_all_inner_types(t) + [t]:
             if isinstance(typ, AnyType):
@@ -209,6 +226,8 @@ class StatisticsVisitor(TraverserVisitor):
                     assert typ.source_any.type_of_any != TypeOfAny.from_another_any
                     typ = typ.source_any
                 self.type_of_any_counter[typ.type_of_any] += 1
+                if not self.untyped_def_depth:
+                    self.typed_type_of_any_counter[typ.type_of_any] += 1
                 self.num_any_types += 1
                 if self.line in self.any_line_map:
                     self.any_line_map[self.line].append(typ)
@@ -238,6 +257,9 @@ class StatisticsVisitor(TraverserVisitor):
     def record_line(self, line: int, precision: int) -> None:
         self.line_map[line] = max(precision,
                                   self.line_map.get(line, TYPE_EMPTY))
+        if not self.untyped_def_depth:
+            self.typed_line_map[line] = max(precision,
+                                            self.typed_line_map.get(line, TYPE_EMPTY))
 
 
 def dump_type_stats(tree: MypyFile, path: str, inferred: bool = False,
@@ -0,0 +1,108 @@
+"""Remove function bodies that don't contribute to the interface of a module.
+
+Modules followed with --follow-imports=silent have their errors ignored, so
+when --follow-imports-interface-only is used, the bodies of their functions
+are removed right after parsing. This avoids analyzing and type checking the
+bodies, and also following the imports within them.
+
+A body is kept if it defines attributes of 'self', declares global names or
+contains 'yield', since these affect the class, the types of module-level
+variables or the signature of the function. The type checker also uses
+body_affects_interface() to skip checking bodies in modules whose errors are
+ignored.
+"""
+
+from typing import Optional
+
+from mypy.nodes import (
+    MypyFile, FuncDef, LambdaExpr, AssignmentStmt, GlobalDecl, ForStmt, WithStmt, YieldExpr,
+    YieldFromExpr, Expression, MemberExpr, NameExpr, TupleExpr, ListExpr, StarExpr
+)
+from mypy.traverser import TraverserVisitor
+
+
+def strip_function_bodies(tree: MypyFile) -> int:
+    """Remove the bodies of functions in a module, unless they are needed.
+
+    Only top-level functions and methods are considered, since nested
+    functions go away with the enclosing body. Return the number of
+    bodies removed.
+    """
+    stripper = BodyStripper()
+    tree.accept(stripper)
+    return stripper.num_stripped
+
+
+def body_affects_interface(defn: FuncDef) -> bool:
+    """Can the body of a function affect anything outside the function?"""
+    self_name = defn.arguments[0].variable.name() if defn.arguments else None
+    finder = InterfaceFinder(self_name)
+    defn.body.accept(finder)
+    return finder.found
+
+
+class BodyStripper(TraverserVisitor):
+    def __init__(self) -> None:
+        self.num_stripped = 0
+
+    def visit_func_def(self, defn: FuncDef) -> None:
+        if not defn.body.body or defn.body.is_unreachable:
+            return
+        if not body_affects_interface(defn):
+            defn.body.body = []
+            defn.body.is_unreachable = True
+            self.num_stripped += 1
+
+    def visit_lambda_expr(self, expr: LambdaExpr) -> None:
+        pass
+
+
+class InterfaceFinder(TraverserVisitor):
+    """Find statements in a function body that affect the module interface."""
+
+    def __init__(self, self_name: Optional[str]) -> None:
+        self.self_name = self_name
+        self.found = False
+
+    def visit_func_def(self, defn: FuncDef) -> None:
+        # Nested functions can't define attributes, and 'yield' in them
+        # doesn't make the enclosing function a generator.
+        pass
+
+    def visit_lambda_expr(self, expr: LambdaExpr) -> None:
+        pass
+
+    def visit_global_decl(self, s: GlobalDecl) -> None:
+        # An assignment to a global can complete a partial type at module level.
+        self.found = True
+
+    def visit_yield_expr(self, expr: YieldExpr) -> None:
+        self.found = True
+
+    def visit_yield_from_expr(self, expr: YieldFromExpr) -> None:
+        self.found = True
+
+    def visit_assignment_stmt(self, s: AssignmentStmt) -> None:
+        for lvalue in s.lvalues:
+            self.check_lvalue(lvalue)
+        super().visit_assignment_stmt(s)
+
+    def visit_for_stmt(self, s: ForStmt) -> None:
+        self.check_lvalue(s.index)
+        super().visit_for_stmt(s)
+
+    def visit_with_stmt(self, s: WithStmt) -> None:
+        for target in s.target:
+            if target is not None:
+                self.check_lvalue(target)
+        super().visit_with_stmt(s)
+
+    def check_lvalue(self, lvalue: Expression) -> None:
+        if isinstance(lvalue, (TupleExpr, ListExpr)):
+            for item in lvalue.items:
+                self.check_lvalue(item)
+        elif isinstance(lvalue, StarExpr):
+            self.check_lvalue(lvalue.expr)
+        elif (isinstance(lvalue, MemberExpr) and isinstance(lvalue.expr, NameExpr)
+                and lvalue.expr.name == self.self_name):
+            self.found = True
@@ -21,6 +21,7 @@ from mypy.maptype import map_instance_to_supertype
 from mypy.expandtype import expand_type_by_instance
 from mypy.sametypes import is_same_type
 from mypy.typestate import TypeState, SubtypeKind
+from mypy import timing
 from mypy import state
 
 MYPY = False
@@ -67,6 +68,8 @@ def is_subtype(left: Type, right: Type,
     between the type arguments (e.g., A and B), taking the variance of the
     type var into account.
     """
+    if timing.count_operations:
+        timing.Counters.subtype_checks += 1
     if (isinstance(right, AnyType) or isinstance(right, UnboundType)
             or isinstance(right, ErasedType)):
         return True
@@ -1030,6 +1033,8 @@ def is_proper_subtype(left: Type, right: Type, *, ignore_promotions: bool = Fals
     For proper subtypes, there's no need to rely on compatibility due to
     Any types. Every usable type is a proper subtype of itself.
     """
+    if timing.count_operations:
+        timing.Counters.subtype_checks += 1
     if isinstance(right, UnionType) and not isinstance(left, UnionType):
         return any([is_proper_subtype(left, item, ignore_promotions=ignore_promotions)
                     for item in right.items])
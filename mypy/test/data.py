@@ -222,6 +222,8 @@ class DataDrivenTestCase(pytest.Item):  # type: ignore  # inheriting from Any
                     target_dir = os.path.join(self.old_cwd, target_dir)
                 shutil.copytree(self.tmpdir.name, target_dir)
             raise
+        finally:
+            suite.teardown()
 
     def setup(self) -> None:
         parse_test_case(case=self)
@@ -665,6 +667,10 @@ class DataSuite:
         """Setup fixtures (ad-hoc)"""
         pass
 
+    def teardown(self) -> None:
+        """Teardown fixtures (ad-hoc)"""
+        pass
+
     @abstractmethod
     def run_case(self, testcase: DataDrivenTestCase) -> None:
         raise NotImplementedError
@@ -0,0 +1,102 @@
+"""Unit tests for mypy.errors and error reporting in mypy.messages."""
+
+from typing import List
+
+from mypy.errors import Errors
+from mypy.messages import MessageBuilder
+from mypy.nodes import Context
+from mypy.test.helpers import Suite, assert_equal
+
+
+class LazyMessageSuite(Suite):
+    def setUp(self) -> None:
+        self.errors = Errors()
+        self.errors.set_file('main', 'main')
+        self.errors.set_file_ignored_lines('main', {2})
+        self.rendered = []  # type: List[str]
+
+    def message(self, text: str) -> str:
+        self.rendered.append(text)
+        return text
+
+    def test_message_rendered_only_when_needed(self) -> None:
+        self.errors.report(1, -1, lambda: self.message('first'))
+        self.errors.report(1, -1, lambda: self.message('note'), severity='note', offset=2)
+        assert_equal(self.rendered, [])
+        assert_equal(self.errors.new_messages(),
+                     ['main:1: error: first', 'main:1: note:   note'])
+        assert_equal(self.rendered, ['first', 'note'])
+
+    def test_message_on_ignored_line_never_rendered(self) -> None:
+        self.errors.report(2, -1, lambda: self.message('ignored'))
+        assert not self.errors.is_errors()
+        assert_equal(self.errors.new_messages(), [])
+        assert_equal(self.rendered, [])
+
+    def test_message_rendered_once(self) -> None:
+        self.errors.report(1, -1, lambda: self.message('error'))
+        info = self.errors.error_info_map['main'][0]
+        assert_equal(info.message, 'error')
+        assert_equal(info.message, 'error')
+        assert_equal(self.rendered, ['error'])
+
+
+class SpeculationSuite(Suite):
+    def setUp(self) -> None:
+        self.errors = Errors()
+        self.errors.set_file('main', 'main')
+        self.msg = MessageBuilder(self.errors, {})
+        self.rendered = []  # type: List[str]
+
+    def context(self, line: int) -> Context:
+        context = Context()
+        context.set_line(line)
+        return context
+
+    def message(self, text: str) -> str:
+        self.rendered.append(text)
+        return text
+
+    def test_discarded_errors_never_rendered(self) -> None:
+        with self.msg.speculate() as speculation:
+            assert not self.msg.is_errors()
+            self.msg.fail(lambda: self.message('first'), self.context(1))
+            self.msg.fail(lambda: self.message('second'), self.context(2))
+            assert self.msg.is_errors()
+        assert speculation.has_errors
+        assert isinstance(speculation.first, tuple) and speculation.first[2] == 'error'
+        assert not self.msg.is_errors()
+        assert_equal(self.errors.new_messages(), [])
+        assert_equal(self.rendered, [])
+
+    def test_commit(self) -> None:
+        with self.msg.speculate(record=True) as speculation:
+            self.msg.fail('error', self.context(1))
+            self.msg.note('note', self.context(1))
+        speculation.commit()
+        assert_equal(self.errors.new_messages(),
+                     ['main:1: error: error', 'main:1: note: note'])
+
+    def test_errors_not_disabled_in_speculation(self) -> None:
+        self.msg.disable_errors()
+        with self.msg.speculate() as speculation:
+            self.msg.fail('error', self.context(1))
+        assert speculation.has_errors
+        assert_equal(self.msg.disable_count, 1)
+
+    def test_nested_speculation(self) -> None:
+        with self.msg.speculate() as outer:
+            with self.msg.speculate(record=True) as inner:
+                self.msg.fail('error', self.context(1))
+            assert not outer.has_errors
+            inner.commit()
+        assert outer.has_errors
+        assert not self.msg.is_errors()
+
+    def test_add_errors(self) -> None:
+        local_errors = self.msg.clean_copy()
+        local_errors.fail('error', self.context(1))
+        with self.msg.speculate() as speculation:
+            self.msg.add_errors(local_errors)
+        assert speculation.has_errors
+        assert_equal(self.errors.new_messages(), [])
@@ -28,6 +28,7 @@ from mypy.test.data import (
 from mypy.test.helpers import (
     assert_string_arrays_equal, parse_options, copy_and_fudge_mtime, assert_module_equivalence,
 )
+from mypy.server import astmerge
 from mypy.server.mergecheck import check_consistency
 from mypy.dmypy_util import DEFAULT_STATUS_FILE
 from mypy.dmypy_server import Server
@@ -51,6 +52,16 @@ class FineGrainedSuite(DataSuite):
     # by a trivial subclass to produce a suite that uses the cache.
     use_cache = False
 
+    def setup(self) -> None:
+        super().setup()
+        # Check that merges after reprocessing targets don't miss any references
+        self.old_check_restricted_merge = astmerge.CHECK_RESTRICTED_MERGE
+        astmerge.CHECK_RESTRICTED_MERGE = True
+
+    def teardown(self) -> None:
+        astmerge.CHECK_RESTRICTED_MERGE = self.old_check_restricted_merge
+        super().teardown()
+
     # Decide whether to skip the test. This could have been structured
     # as a filter() classmethod also, but we want the tests reported
     # as skipped, not just elided.
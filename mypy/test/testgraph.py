@@ -1,16 +1,19 @@
 """Test cases for graph processing code in build.py."""
 
-from typing import AbstractSet, Dict, Set, List
+import os
+import tempfile
+from typing import AbstractSet, Any, Dict, Set, List, Tuple
 
-from mypy.test.helpers import assert_equal, Suite
-from mypy.build import BuildManager, State, BuildSourceSet
+from mypy import build
+from mypy.test.helpers import assert_equal, assert_string_arrays_equal, Suite
+from mypy.build import BuildManager, BuildSource, State, BuildSourceSet
 from mypy.modulefinder import SearchPaths
 from mypy.build import topsort, strongly_connected_components, sorted_components, order_ascc
 from mypy.version import __version__
 from mypy.options import Options
 from mypy.report import Reports
 from mypy.plugin import Plugin
-from mypy.errors import Errors
+from mypy.errors import CompileError, Errors
 from mypy.fscache import FileSystemCache
 
 
@@ -80,3 +83,54 @@ class GraphSuite(Suite):
         ascc = res[0]
         scc = order_ascc(graph, ascc)
         assert_equal(scc, ['d', 'c', 'b', 'a'])
+
+
+# A program for building with and without parse workers
+PARALLEL_PARSE_PROGRAM = {
+    'main.py': 'import a, b\nfrom pkg import sub\nx = 1  # type: str\n',
+    'a.py': 'import c\ny = 0  # type: str\n',
+    'b.py': 'def f(x):  # type: ignore\n    return x + 1  # type: ignore\n',
+    'c.py': 'z = 1 + ""\n',
+    'pkg/__init__.py': '',
+    'pkg/sub.py': 'def g() -> int:\n    return ""\n',
+}
+
+
+def build_program(files: Dict[str, str], parse_workers: int) -> Tuple[List[str], int]:
+    """Build a program and return the messages and the number of files parsed in workers."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, text in files.items():
+            path = os.path.join(tmpdir, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write(text)
+        options = Options()
+        options.incremental = False
+        options.parse_workers = parse_workers
+        options.mypy_path = [tmpdir]
+        sources = [BuildSource(os.path.join(tmpdir, 'main.py'), '__main__', None)]
+        try:
+            result = build.build(sources=sources, options=options)
+        except CompileError as e:
+            messages, stats = e.messages, {}  # type: List[str], Dict[str, Any]
+        else:
+            messages, stats = result.errors, result.manager.stats
+        messages = [message.replace(tmpdir + os.sep, '') for message in messages]
+        return messages, int(stats.get('files_parsed_in_workers', 0))
+
+
+class ParallelBuildSuite(Suite):
+    def test_same_errors_as_sequential_build(self) -> None:
+        expected, _ = build_program(PARALLEL_PARSE_PROGRAM, 0)
+        messages, parsed_in_workers = build_program(PARALLEL_PARSE_PROGRAM, 2)
+        assert_string_arrays_equal(expected, messages, 'Errors differ with parse workers')
+        assert len(expected) == 4, expected
+        # All files in the program and the stubs they use are parsed in workers.
+        assert parsed_in_workers > len(PARALLEL_PARSE_PROGRAM), parsed_in_workers
+
+    def test_syntax_error_is_replayed(self) -> None:
+        files = dict(PARALLEL_PARSE_PROGRAM, **{'c.py': 'def f(:\n    pass\n'})
+        expected, _ = build_program(files, 0)
+        messages, _ = build_program(files, 2)
+        assert_string_arrays_equal(expected, messages, 'Errors differ with parse workers')
+        assert messages == ['c.py:1: error: invalid syntax'], messages
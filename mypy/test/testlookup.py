@@ -0,0 +1,79 @@
+"""Test cases for finding symbols by fully qualified name."""
+
+from typing import Dict
+
+from mypy.lookup import FullnameIndex, lookup_fully_qualified
+from mypy.nodes import (
+    Block, ClassDef, GDEF, MDEF, MypyFile, SymbolTable, SymbolTableNode, TypeInfo, Var
+)
+from mypy.test.helpers import Suite, assert_equal
+
+
+def make_module(id: str) -> MypyFile:
+    tree = MypyFile([], [])
+    tree._fullname = id
+    tree.names = SymbolTable()
+    return tree
+
+
+def make_class(fullname: str, module: str) -> TypeInfo:
+    defn = ClassDef(fullname.rsplit('.', 1)[1], Block([]))
+    defn.fullname = fullname
+    info = TypeInfo(SymbolTable(), defn, module)
+    info._fullname = fullname
+    return info
+
+
+class FullnameIndexSuite(Suite):
+    def setUp(self) -> None:
+        self.modules = {}  # type: Dict[str, MypyFile]
+        self.index = FullnameIndex(self.modules)
+        self.tree = make_module('m')
+        self.outer = make_class('m.C', 'm')
+        self.inner = make_class('m.C.D', 'm')
+        self.outer.names['D'] = SymbolTableNode(MDEF, self.inner)
+        self.outer.names['x'] = SymbolTableNode(MDEF, Var('x'))
+        self.tree.names['C'] = SymbolTableNode(GDEF, self.outer)
+        self.tree.names['y'] = SymbolTableNode(GDEF, Var('y'))
+        self.modules['m'] = self.tree
+        self.index.add_module(self.tree)
+
+    def test_lookup(self) -> None:
+        for name in ['m.C', 'm.C.D', 'm.y']:
+            assert_equal(self.index.lookup(name),
+                         lookup_fully_qualified(name, self.modules))
+        assert self.index.lookup('m.C.D') is self.outer.names['D']
+        # Only classes are indexed within classes.
+        assert_equal(self.index.lookup('m.C.x'), None)
+        assert_equal(lookup_fully_qualified('m.C.x', self.modules, index=self.index),
+                     self.outer.names['x'])
+
+    def test_lookup_module_level(self) -> None:
+        assert self.index.lookup('m.C', module_level=True) is self.tree.names['C']
+        assert self.index.lookup('m.y', module_level=True) is self.tree.names['y']
+        assert_equal(self.index.lookup('m.C.D', module_level=True), None)
+
+    def test_names_added_after_indexing(self) -> None:
+        new = SymbolTableNode(GDEF, Var('y'))
+        self.tree.names['y'] = new
+        self.tree.names['z'] = SymbolTableNode(GDEF, Var('z'))
+        assert self.index.lookup('m.y') is new
+        assert_equal(self.index.lookup('m.z'), None)
+        self.index.add_module(self.tree)
+        assert self.index.lookup('m.z') is self.tree.names['z']
+
+    def test_replaced_module(self) -> None:
+        self.modules['m'] = make_module('m')
+        assert_equal(self.index.lookup('m.y'), None)
+        assert_equal(self.index.lookup('m.C.D'), None)
+        del self.modules['m']
+        assert_equal(self.index.lookup('m.y'), None)
+
+    def test_replaced_class(self) -> None:
+        self.tree.names['C'] = SymbolTableNode(GDEF, make_class('m.C', 'm'))
+        assert_equal(self.index.lookup('m.C.D'), None)
+
+    def test_remove_module(self) -> None:
+        self.index.remove_module('m')
+        assert_equal(self.index.entries, {})
+        assert_equal(self.index.lookup('m.y'), None)
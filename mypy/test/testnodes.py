@@ -0,0 +1,89 @@
+"""Test cases for AST nodes."""
+
+import gc
+from typing import Set
+
+from mypy.memprofile import collect_memory_stats
+from mypy.nodes import Expression, ImportedName, Statement
+from mypy.options import Options
+from mypy.parse import parse
+from mypy.test.helpers import Suite
+from mypy.types import TypeVarDef
+
+
+# A program that exercises most statement and expression node types.
+NODE_SAMPLE = """\
+import m
+from m import x as y
+from m import *
+@dec
+def f(a: int, *b: str, c=1, **d) -> None:
+    global g
+    lambda z: z
+    x, *xs = [1, 2.0, 3j, 'a', b'b', ..., {1: 2}, {3}, (4,)]
+    x += -a if a < 2 <= 3 else a + 1
+    assert a[1:2], cast(int, a)
+    del a.b
+    while a:
+        break
+    for i in range(3):
+        continue
+    with a as b:
+        pass
+    try:
+        raise E from None
+    except E as e:
+        yield [i for i in b if i]
+    finally:
+        yield from {i: j for i, j in b}
+    return super().f({i for i in b}, (i for i in b))
+async def h() -> None:
+    await x
+class C(B, metaclass=M):
+    def g(self) -> None:
+        nonlocal q
+        print(reveal_type(self))
+"""
+
+# Upper bound of the average size in bytes of a parsed node, not including lists
+# referred to by nodes. Nodes with an instance __dict__ take about 130 bytes.
+MAX_BYTES_PER_NODE = 100
+
+
+def all_subclasses(cls: type) -> Set[type]:
+    result = set()  # type: Set[type]
+    worklist = [cls]
+    while worklist:
+        for sub in worklist.pop().__subclasses__():
+            if sub not in result:
+                result.add(sub)
+                worklist.append(sub)
+    return result
+
+
+class NodeMemorySuite(Suite):
+    def test_nodes_have_no_instance_dict(self) -> None:
+        node_classes = all_subclasses(Statement) | all_subclasses(Expression)
+        node_classes |= {ImportedName, TypeVarDef}
+        # A non-zero dict offset means that every instance pays for a __dict__.
+        with_dict = sorted(cls.__name__ for cls in node_classes if cls.__dictoffset__)
+        assert not with_dict, with_dict
+
+    def test_bytes_per_node(self) -> None:
+        node_names = {cls.__name__
+                      for cls in all_subclasses(Statement) | all_subclasses(Expression)}
+        text = ''.join(NODE_SAMPLE.replace('def f(', 'def f{}('.format(i))
+                       for i in range(100))
+        gc.collect()
+        old_freqs, old_memuse = collect_memory_stats()
+        tree = parse(text, fnam='main', module='__main__', errors=None, options=Options())
+        gc.collect()
+        freqs, memuse = collect_memory_stats()
+        # Instance dicts are counted as '<class> (__dict__)'.
+        kinds = [kind for kind in memuse if kind.split(' (__dict__)')[0] in node_names]
+        count = sum(freqs[kind] - old_freqs.get(kind, 0) for kind in kinds
+                    if kind in node_names)
+        size = sum(memuse[kind] - old_memuse.get(kind, 0) for kind in kinds)
+        assert count > 10000, count
+        assert size / count <= MAX_BYTES_PER_NODE, size / count
+        assert tree.defs
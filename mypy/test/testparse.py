@@ -1,11 +1,17 @@
 """Tests for the mypy parser."""
 
 from mypy import defaults
-from mypy.test.helpers import assert_string_arrays_equal
+from mypy.test.helpers import Suite, assert_string_arrays_equal
 from mypy.test.data import DataDrivenTestCase, DataSuite
 from mypy.parse import parse
-from mypy.errors import CompileError
+from mypy.errors import CompileError, Errors
+from mypy.fastparse import parse_type_comment, type_comment_cache, TypeCommentCache
+from mypy import nodes
+from mypy.nodes import FuncDef
 from mypy.options import Options
+from mypy.test.testnodes import NODE_SAMPLE
+from mypy.parallelparse import ParsePool, parse_source, loads_parse_result
+from mypy.types import UnboundType, CallableArgument, TypeList
 
 
 class ParserSuite(DataSuite):
@@ -72,3 +78,79 @@ def test_parse_error(testcase: DataDrivenTestCase) -> None:
             testcase.output, e.messages,
             'Invalid compiler output ({}, line {})'.format(testcase.file,
                                                            testcase.line))
+
+
+class ParallelParseSuite(Suite):
+    def test_parse_result_round_trip(self) -> None:
+        options = Options()
+        data = parse_source(NODE_SAMPLE, 'main', '__main__', options)
+        assert data is not None
+        tree, error_infos = loads_parse_result(data)
+        expected = parse(NODE_SAMPLE, fnam='main', module='__main__', errors=None,
+                         options=options)
+        assert_string_arrays_equal(str(expected).split('\n'), str(tree).split('\n'),
+                                   'Tree changed by round trip')
+        assert not error_infos
+        func = tree.defs[4]
+        assert isinstance(func, FuncDef)
+        # Placeholder infos must stay the same objects, as they are compared by identity.
+        assert func.info is nodes.FUNC_NO_INFO
+
+    def test_parse_errors_are_returned(self) -> None:
+        data = parse_source('def f(:\n    pass\n', 'main', '__main__', Options())
+        assert data is not None
+        _, error_infos = loads_parse_result(data)
+        assert [(info.line, info.message) for info in error_infos] == [(1, 'invalid syntax')]
+
+    def test_changed_source_is_parsed_again(self) -> None:
+        pool = ParsePool(1)
+        try:
+            pool.prefetch('main', '__main__', 'x = 1\n', Options())
+            assert pool.result('main', 'x = 2\n') is None
+            # Each result is claimed at most once, and files are not submitted again.
+            pool.prefetch('main', '__main__', 'x = 2\n', Options())
+            assert pool.result('main', 'x = 2\n') is None
+            pool.prefetch('other', 'other', 'y = 1\n', Options())
+            result = pool.result('other', 'y = 1\n')
+            assert result is not None
+            assert str(result[0].defs[0]) == str(parse('y = 1\n', 'other', 'other', None,
+                                                       Options()).defs[0])
+        finally:
+            pool.shutdown()
+
+
+class TypeCommentCacheSuite(Suite):
+    def test_repeated_comment_gives_fresh_copy_at_new_line(self) -> None:
+        comment = 'Callable[[Arg(int, "x")], Dict[str, "List[C]"]]'
+        first = parse_type_comment(comment, 3, None)
+        hits = type_comment_cache.hits
+        second = parse_type_comment(comment, 7, None)
+        assert type_comment_cache.hits == hits + 1
+        assert str(first) == str(second)
+        assert isinstance(first, UnboundType) and isinstance(second, UnboundType)
+        assert first is not second and first.args[1] is not second.args[1]
+        assert (first.line, second.line) == (3, 7)
+        args = second.args[0]
+        assert isinstance(args, TypeList)
+        arg = args.items[0]
+        assert isinstance(arg, CallableArgument)
+        # Lines of callable arguments are relative to the type comment.
+        assert (arg.line, arg.typ.line) == (1, 7)
+        fwd = second.args[1]
+        assert isinstance(fwd, UnboundType)
+        assert fwd.args[1].line == 7
+
+    def test_comments_with_errors_are_reported_each_time(self) -> None:
+        errors = Errors()
+        errors.set_file('main', None)
+        for line in (1, 2):
+            parse_type_comment('Callable[[Arg(int, 1)], None]', line, errors)
+        assert [info.line for info in errors.error_info_map['main']] == [1, 2]
+
+    def test_least_recently_used_comments_are_evicted(self) -> None:
+        cache = TypeCommentCache(size=2)
+        for comment in ['A', 'B', 'A', 'C']:
+            if cache.lookup(comment, True, 1) is None:
+                cache.store(comment, True, 1, UnboundType(comment, line=1))
+        assert list(cache.types) == [('A', True), ('C', True)]
+        assert (cache.hits, cache.misses) == (1, 3)
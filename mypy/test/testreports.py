@@ -1,8 +1,19 @@
 """Test cases for reports generated by mypy."""
+import json
+import os
+import tempfile
 import textwrap
 
+from mypy import build
+from mypy.build import BuildSource
+from mypy.nodes import MypyFile
+from mypy.options import Options
 from mypy.test.helpers import Suite, assert_equal
-from mypy.report import CoberturaPackage, get_line_rate
+from mypy.report import (
+    CoberturaPackage, FileStats, Reports, get_line_rate, FUNCTIONS, COVERAGE, PRECISION
+)
+from mypy import timing
+from mypy.timing import Counters
 
 import lxml.etree as etree  # type: ignore
 
@@ -38,3 +49,113 @@ class CoberturaReportSuite(Suite):
         ''').encode('ascii')
         assert_equal(expected_output,
                      etree.tostring(cobertura_package.as_xml(), pretty_print=True))
+
+
+class FileStatsSuite(Suite):
+    def test_source(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'm.py')
+            with open(path, 'wb') as f:
+                f.write(b'# coding: latin-1\r\nx = "\xe9"\r\n\ny = 1')
+            file_stats = FileStats('m', path, MypyFile([], []), {})
+            assert_equal(file_stats.physical_lines, 4)
+            assert_equal(file_stats.source,
+                         ['# coding: latin-1\n', 'x = "\xe9"\n', '\n', 'y = 1'])
+        # The file is only read once.
+        assert_equal(file_stats.physical_lines, 4)
+
+    def test_precision_computed_once(self) -> None:
+        file_stats = FileStats('m', 'm.py', MypyFile([], []), {})
+        assert file_stats.precision is file_stats.precision
+
+    def test_serialize(self) -> None:
+        file_stats = FileStats('m', 'm.py', MypyFile([], []), {})
+        data = json.loads(json.dumps(file_stats.serialize([FUNCTIONS, PRECISION])))
+        assert_equal(sorted(data), [FUNCTIONS, PRECISION])
+        cached = FileStats.deserialize('m', 'm.py', data)
+        assert cached.tree is None
+        assert_equal(cached.func_counts, file_stats.func_counts)
+        assert_equal(vars(cached.precision), vars(file_stats.precision))
+
+
+class IncrementalReportSuite(Suite):
+    def test_fresh_modules_reported(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name, source in [('a', 'import b\ndef f(x):\n    return b.g(x)\n'),
+                                 ('b', 'from typing import Any\n'
+                                       'def g(x: Any) -> int:\n    return x\n')]:
+                with open(os.path.join(tmpdir, name + '.py'), 'w') as f:
+                    f.write(source)
+            reports = []
+            for run in range(2):
+                options = Options()
+                options.incremental = True
+                options.cache_dir = os.path.join(tmpdir, 'cache')
+                report_dir = os.path.join(tmpdir, 'report{}'.format(run))
+                for report_type in ['linecount', 'any-exprs', 'linecoverage']:
+                    options.report_dirs[report_type] = report_dir
+                sources = [BuildSource(os.path.join(tmpdir, name + '.py'), name, None)
+                           for name in ['a', 'b']]
+                result = build.build(sources=sources, options=options)
+                output = {}
+                for dirpath, _, filenames in os.walk(report_dir):
+                    for filename in filenames:
+                        with open(os.path.join(dirpath, filename)) as f:
+                            output[os.path.relpath(os.path.join(dirpath, filename),
+                                                   report_dir)] = f.read()
+                reports.append(output)
+            # The second run doesn't check anything, but reports the same.
+            assert_equal(result.manager.rechecked_modules, set())
+            assert_equal(reports[1], reports[0])
+            assert_equal(sorted(reports[0]), ['any-exprs.txt', 'coverage.json',
+                                              'linecount.txt', 'types-of-anys.txt'])
+            assert_equal([line.split()[-1] for line in reports[0]['linecount.txt'].splitlines()],
+                         ['total', 'b', 'a'])
+
+    def test_reports_cache_deleted_on_errors(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'a.py')
+            options = Options()
+            options.incremental = True
+            options.cache_dir = os.path.join(tmpdir, 'cache')
+            options.report_dirs['linecount'] = os.path.join(tmpdir, 'report')
+            for source, cached in [('x = 1\n', True), ('x = 1 + ""\n', False)]:
+                with open(path, 'w') as f:
+                    f.write(source)
+                build.build(sources=[BuildSource(path, 'a', None)], options=options)
+                cache_files = [filename for _, _, filenames in os.walk(options.cache_dir)
+                               for filename in filenames]
+                # A module with errors has none of its cache files, reports included.
+                assert_equal('a.meta.json' in cache_files, cached)
+                assert_equal('a.reports.json' in cache_files, cached)
+
+
+class TimingReportSuite(Suite):
+    def test_report(self) -> None:
+        with tempfile.TemporaryDirectory() as report_dir:
+            reports = Reports('', {'timing': report_dir})
+            timer = reports.target_timer
+            assert timer is not None
+            assert timing.count_operations
+            with timer.target('m', 'm.f'):
+                Counters.subtype_checks += 2
+            with timer.target('m', 'm.f'):
+                Counters.overload_calls += 1
+            with timer.target('m', 'm'):
+                Counters.constraint_solves += 1
+            # Only targets in modules that are reported on are included.
+            timer.targets[('n', 'n')] = [1.0, 0, 0, 0]
+            tree = MypyFile([], [])
+            tree._fullname = 'm'
+            reports.file(tree, {}, Options())
+            reports.finish()
+            with open(os.path.join(report_dir, 'timing.json')) as f:
+                rows = json.load(f)
+            with open(os.path.join(report_dir, 'timing.txt')) as f:
+                lines = f.read().splitlines()
+        counts = {row['target']: [row['subtype_checks'], row['overload_calls'],
+                                  row['constraint_solves']]
+                  for row in rows}
+        assert_equal(counts, {'m.f': [2, 1, 0], 'm': [0, 0, 1]})
+        assert_equal(len(lines), 6)
+        assert lines[-1].split()[0] == 'Total'
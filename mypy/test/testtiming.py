@@ -0,0 +1,112 @@
+"""Test cases for measuring and profiling builds."""
+
+import os
+import tempfile
+import threading
+import time
+from typing import List
+from unittest import skipUnless
+
+from mypy import build
+from mypy.build import BuildSource
+
+from mypy.options import Options
+from mypy.profiler import SamplingProfiler, is_profiling_supported
+from mypy.test.helpers import Suite, assert_equal
+from mypy.timing import PhaseTimer, format_phase_stats
+
+
+class PhaseTimerSuite(Suite):
+    def test_nested_phases_are_exclusive(self) -> None:
+        timer = PhaseTimer()
+        with timer.phase('discovery'):
+            sum(range(100000))
+            with timer.phase('parse'):
+                sum(range(100000))
+        assert_equal(timer.stack, [])
+        assert timer.gc_logger is None
+        discovery = timer.phases['discovery']
+        parse = timer.phases['parse']
+        assert discovery[0] > 0 and parse[0] > 0
+        stats = timer.stats()
+        assert_equal(stats['phase_parse_time'], parse[0])
+        assert_equal(sorted(stats), ['phase_discovery_cpu_time',
+                                     'phase_discovery_gc_time',
+                                     'phase_discovery_rss_delta_mib',
+                                     'phase_discovery_time',
+                                     'phase_parse_cpu_time',
+                                     'phase_parse_gc_time',
+                                     'phase_parse_rss_delta_mib',
+                                     'phase_parse_time'])
+        assert_equal(timer.stats(), {})
+
+    def test_format(self) -> None:
+        stats = {'phase_parse_time': 1.0, 'phase_parse_cpu_time': 0.5,
+                 'phase_discovery_time': 0.25, 'phase_discovery_rss_delta_mib': 2.0,
+                 'files_parsed': 3}
+        assert_equal(format_phase_stats(stats), [
+            'Phase               Wall (s)   CPU (s)    GC (s)  RSS (MiB)',
+            'discovery              0.250     0.000     0.000       +2.0',
+            'parse                  1.000     0.500     0.000       +0.0',
+            'total                  1.250     0.500     0.000       +2.0',
+        ])
+        assert_equal(format_phase_stats({'files_parsed': 3}), [])
+
+
+def busy_loop(seconds: float) -> None:
+    end = time.process_time() + seconds
+    while time.process_time() < end:
+        pass
+
+
+class SamplingProfilerSuite(Suite):
+    @skipUnless(is_profiling_supported(), 'profiling is not supported on this platform')
+    def test_collapsed_stacks(self) -> None:
+        profiler = SamplingProfiler()
+        profiler.start()
+        try:
+            busy_loop(0.05)
+        finally:
+            profiler.stop()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'profile.txt')
+            profiler.write(path)
+            with open(path) as f:
+                lines = f.read().splitlines()
+        assert lines
+        for line in lines:
+            stack, count = line.rsplit(' ', 1)
+            assert int(count) > 0
+            assert stack.startswith('phase ?;module ?;')
+        assert any('busy_loop (mypy/test/testtiming.py:' in line for line in lines)
+
+    @skipUnless(is_profiling_supported(), 'profiling is not supported on this platform')
+    def test_start_outside_main_thread(self) -> None:
+        errors = []  # type: List[Exception]
+
+        def start() -> None:
+            try:
+                SamplingProfiler().start()
+            except RuntimeError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=start)
+        thread.start()
+        thread.join()
+        assert_equal([str(e) for e in errors],
+                     ['Profiling can only be started in the main thread'])
+
+    @skipUnless(is_profiling_supported(), 'profiling is not supported on this platform')
+    def test_unwritable_profile_output(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            options = Options()
+            options.incremental = False
+            options.profile_output = os.path.join(tmpdir, 'missing', 'profile.txt')
+            result = build.build(sources=[BuildSource('main', '__main__', 'x = 1 + ""\n')],
+                                 options=options)
+        # The build errors are still reported, followed by the error writing the profile.
+        assert_equal(len(result.errors), 2)
+        assert 'Unsupported operand types' in result.errors[0]
+        assert_equal(result.errors[1],
+                     '{}: error: Error writing profile output: No such file or directory'.format(
+                         options.profile_output))
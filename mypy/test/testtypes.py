@@ -10,7 +10,9 @@ from mypy.meet import meet_types
 from mypy.sametypes import is_same_type
 from mypy.types import (
     UnboundType, AnyType, CallableType, TupleType, TypeVarDef, Type, Instance, NoneTyp, Overloaded,
-    TypeType, UnionType, UninhabitedType, true_only, false_only, TypeVarId, TypeOfAny, LiteralType
+    TypeType, UnionType, UninhabitedType, true_only, false_only, TypeVarId, TypeOfAny, LiteralType,
+    interned_any_type, interned_none_type, interned_instance, is_interned, reset_interned_types,
+    deserialize_type, sharing_deserialized_instances
 )
 from mypy.nodes import ARG_POS, ARG_OPT, ARG_STAR, ARG_STAR2, CONTRAVARIANT, INVARIANT, COVARIANT
 from mypy.subtypes import is_subtype, is_more_precise, is_proper_subtype
@@ -90,6 +92,46 @@ class TypesSuite(Suite):
         c2 = CallableType([], [], [], NoneTyp(), self.function, name=None, variables=v)
         assert_equal(str(c2), 'def [Y, X] ()')
 
+    def test_interned_types(self) -> None:
+        reset_interned_types()
+        assert_true(interned_none_type() is interned_none_type())
+        any_type = interned_any_type(TypeOfAny.special_form)
+        assert_true(any_type is interned_any_type(TypeOfAny.special_form))
+        assert_false(any_type is interned_any_type(TypeOfAny.from_error))
+        a = interned_instance(self.fx.ai)
+        assert_true(a is interned_instance(self.fx.ai))
+        assert_true(is_interned(a))
+        ga = interned_instance(self.fx.gi, [a])
+        assert_true(ga is interned_instance(self.fx.gi, [a]))
+        assert_equal(str(ga), 'G[A]')
+        # Types with arguments that are not interned are never shared.
+        gb = interned_instance(self.fx.gi, [self.fx.b])
+        assert_false(gb is interned_instance(self.fx.gi, [self.fx.b]))
+        assert_false(is_interned(gb))
+        reset_interned_types()
+        assert_false(a is interned_instance(self.fx.ai))
+
+    def test_shared_deserialized_instances(self) -> None:
+        generic = {'.class': 'Instance', 'type_ref': 'builtins.list', 'args': ['builtins.int']}
+        with_var = {'.class': 'Instance', 'type_ref': 'builtins.list',
+                    'args': [self.fx.t.serialize()]}
+        with sharing_deserialized_instances():
+            a = deserialize_type('builtins.int')
+            assert_true(a is deserialize_type('builtins.int'))
+            assert_false(a is deserialize_type('builtins.str'))
+            ga = deserialize_type(generic)
+            assert_true(ga is deserialize_type(generic))
+            assert_true(isinstance(ga, Instance) and ga.args[0] is a)
+            # Instances with arguments that are not shared are never shared.
+            assert_false(deserialize_type(with_var) is deserialize_type(with_var))
+        assert_false(a is deserialize_type('builtins.int'))
+
+    def test_types_have_no_instance_dict(self) -> None:
+        for t in (self.fx.a, self.fx.anyt, self.fx.nonet, self.fx.uninhabited, self.fx.t,
+                  self.fx.callable(self.fx.a, self.fx.b), TupleType([], self.fx.std_tuple),
+                  UnionType([self.fx.a, self.fx.b]), TypeType(self.fx.a)):
+            assert_false(hasattr(t, '__dict__'))
+
 
 class TypeOpsSuite(Suite):
     def setUp(self) -> None:
@@ -114,6 +156,31 @@ class TypeOpsSuite(Suite):
     def test_expand_basic_generic_types(self) -> None:
         self.assert_expand(self.fx.gt, [(self.fx.t.id, self.fx.a)], self.fx.ga)
 
+    def test_expand_without_type_vars_returns_original(self) -> None:
+        env = {self.fx.t.id: self.fx.a}
+        for t in (self.fx.ga, self.fx.hab, self.tuple(self.fx.a, self.fx.b),
+                  self.callable([], self.fx.a, self.fx.ga), TypeType(self.fx.a)):
+            assert_true(expand_type(t, env) is t)
+        # Unions are always simplified and erased instances are always copied.
+        union = UnionType([self.fx.a, self.fx.b])
+        assert_false(expand_type(union, env) is union)
+        erased = Instance(self.fx.gi, [self.fx.a], erased=True)
+        exp = expand_type(erased, env)
+        assert isinstance(exp, Instance)
+        assert_false(exp.erased)
+        # Only unrelated type variables are present.
+        t = self.callable([], self.fx.s, self.fx.gt)
+        assert_true(expand_type(t, {TypeVarId(99): self.fx.a}) is t)
+
+    def test_expand_shares_subtrees_without_type_vars(self) -> None:
+        t = self.callable([], self.fx.ga, self.fx.hab, self.fx.gt)
+        exp = expand_type(t, {self.fx.t.id: self.fx.b})
+        assert isinstance(exp, CallableType)
+        assert_equal(str(exp).replace('*', ''), 'def (G[A], H[A, B]) -> G[B]')
+        assert_true(exp.arg_types[0] is self.fx.ga)
+        assert_true(exp.arg_types[1] is self.fx.hab)
+        assert_false(exp.ret_type is self.fx.gt)
+
     # IDEA: Add test cases for
     #   tuple types
     #   callable types
@@ -0,0 +1,199 @@
+"""Measure where build time is spent.
+
+A PhaseTimer breaks a build down into phases such as parsing, semantic
+analysis and type checking. It is always enabled, and the phases are
+included in the build stats.
+
+The counters are incremented by the type checker for some operations that
+often dominate checking time, but only if count_operations is set. A
+TargetTimer records the wall time spent type checking each top-level
+target, together with the counter increments during that time. It is used
+by the timing report (see mypy.report), which enables counting.
+"""
+
+import os
+import sys
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from mypy.gclogger import GcLogger
+
+MYPY = False
+if MYPY:
+    from typing_extensions import Final
+
+
+# Whether to update the counters; set when the timing report is enabled
+count_operations = False
+
+
+class Counters:
+    """Counts of expensive operations since counting was enabled."""
+
+    # Calls to is_subtype and is_proper_subtype, including nested calls
+    subtype_checks = 0
+    # Calls to overloaded functions
+    overload_calls = 0
+    # Calls to solve_constraints
+    constraint_solves = 0
+
+
+# Names of the values recorded for each target, in order
+TIMING_FIELDS = ['time', 'subtype_checks', 'overload_calls', 'constraint_solves']  # type: Final
+
+
+class TargetTimer:
+    """Record time spent type checking top-level targets.
+
+    Targets are module top levels (all statements at module level are
+    combined), top-level functions and top-level classes (including their
+    methods). Time spent in deferred nodes is added to the enclosing
+    top-level target.
+    """
+
+    def __init__(self) -> None:
+        # Map (module, target) to time in seconds, and the counts of
+        # operations, in the order of TIMING_FIELDS
+        self.targets = {}  # type: Dict[Tuple[str, str], List[float]]
+
+    @contextmanager
+    def target(self, module: str, target: str) -> Iterator[None]:
+        t0 = time.time()
+        subtype_checks = Counters.subtype_checks
+        overload_calls = Counters.overload_calls
+        constraint_solves = Counters.constraint_solves
+        try:
+            yield
+        finally:
+            key = (module, target)
+            if key not in self.targets:
+                self.targets[key] = [0.0, 0, 0, 0]
+            values = self.targets[key]
+            values[0] += time.time() - t0
+            values[1] += Counters.subtype_checks - subtype_checks
+            values[2] += Counters.overload_calls - overload_calls
+            values[3] += Counters.constraint_solves - constraint_solves
+
+
+# Build phases, in the order they are reported
+PHASES = [
+    'discovery',
+    'cache_validation',
+    'cache_loading',
+    'parse',
+    'semanal_pass1',
+    'semanal_pass2',
+    'semanal_pass3',
+    'type_check',
+    'cache_write',
+    'reports',
+]  # type: Final
+
+# Names of the values recorded for each phase, in order
+PHASE_FIELDS = ['time', 'cpu_time', 'gc_time', 'rss_delta_mib']  # type: Final
+
+MiB = 2**20  # type: Final
+
+# File descriptor of /proc/self/statm, if it can be read
+_statm_fd = None  # type: Optional[int]
+
+
+def get_rss() -> float:
+    """Return the resident set size of this process in MiB.
+
+    If the current size is not available, return the peak size instead,
+    or 0.0 on platforms where neither is available.
+    """
+    global _statm_fd
+    if sys.platform == 'win32':
+        return 0.0
+    if sys.platform.startswith('linux'):
+        try:
+            if _statm_fd is None:
+                _statm_fd = os.open('/proc/self/statm', os.O_RDONLY)
+            pages = int(os.pread(_statm_fd, 100, 0).split()[1])
+            return pages * os.sysconf('SC_PAGE_SIZE') / MiB
+        except (OSError, ValueError, IndexError):
+            pass
+    import resource  # Since it doesn't exist on Windows.
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return maxrss / MiB if sys.platform == 'darwin' else maxrss / 1024
+
+
+class PhaseTimer:
+    """Record wall time, CPU time, GC time and RSS growth of build phases.
+
+    Phases may be nested. Time spent in a nested phase is only counted for
+    the nested phase, so the phases add up to the total time spent in all
+    phases. The values are sampled only when a phase is entered or left.
+    """
+
+    def __init__(self) -> None:
+        # Map phase name to values, in the order of PHASE_FIELDS
+        self.phases = OrderedDict()  # type: Dict[str, List[float]]
+        # Phases that have been entered but not left, innermost last
+        self.stack = []  # type: List[str]
+        # Attributes garbage collection time to phases while in a phase
+        self.gc_logger = None  # type: Optional[GcLogger]
+        # Values at the previous phase boundary
+        self.last = (0.0, 0.0, 0.0, 0.0)
+
+    def sample(self) -> Tuple[float, float, float, float]:
+        gc_time = self.gc_logger.gc_time if self.gc_logger is not None else 0.0
+        return time.time(), time.process_time(), gc_time, get_rss()
+
+    def charge(self) -> None:
+        """Add the values since the previous phase boundary to the innermost phase."""
+        now = self.sample()
+        if self.stack:
+            values = self.phases[self.stack[-1]]
+            for i in range(len(values)):
+                values[i] += now[i] - self.last[i]
+        self.last = now
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if not self.stack:
+            self.gc_logger = GcLogger().__enter__()
+        self.charge()
+        self.stack.append(name)
+        if name not in self.phases:
+            self.phases[name] = [0.0, 0.0, 0.0, 0.0]
+        try:
+            yield
+        finally:
+            self.charge()
+            self.stack.pop()
+            if not self.stack and self.gc_logger is not None:
+                self.gc_logger.__exit__()
+                self.gc_logger = None
+
+    def stats(self) -> Dict[str, float]:
+        """Return the recorded values as build stats and forget them."""
+        result = {}
+        for name, values in self.phases.items():
+            for field, value in zip(PHASE_FIELDS, values):
+                result['phase_{}_{}'.format(name, field)] = value
+        self.phases = OrderedDict()
+        return result
+
+
+def format_phase_stats(stats: Mapping[str, Any]) -> List[str]:
+    """Format the phase values in build stats as a table."""
+    rows = []  # type: List[Tuple[str, List[float]]]
+    for name in PHASES:
+        keys = ['phase_{}_{}'.format(name, field) for field in PHASE_FIELDS]
+        if keys[0] in stats:
+            rows.append((name, [stats.get(key, 0.0) for key in keys]))
+    if not rows:
+        return []
+    total = [sum(values[i] for _, values in rows) for i in range(len(PHASE_FIELDS))]
+    lines = ['{:18} {:>9} {:>9} {:>9} {:>10}'.format(
+        'Phase', 'Wall (s)', 'CPU (s)', 'GC (s)', 'RSS (MiB)')]
+    for name, values in rows + [('total', total)]:
+        lines.append('{:18} {:9.3f} {:9.3f} {:9.3f} {:+10.1f}'.format(name, *values))
+    return lines
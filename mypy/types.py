@@ -3,6 +3,7 @@
 import sys
 from abc import abstractmethod
 from collections import OrderedDict
+from contextlib import contextmanager
 from typing import (
     Any, TypeVar, Dict, List, Tuple, cast, Set, Optional, Union, Iterable, NamedTuple,
     Sequence, Iterator,
@@ -102,12 +103,14 @@ def deserialize_type(data: Union[JsonDict, str]) -> 'Type':
 class Type(mypy.nodes.Context):
     """Abstract base class for all types."""
 
-    __slots__ = ('can_be_true', 'can_be_false')
+    __slots__ = ('can_be_true', 'can_be_false', '_expand_noop')
 
     def __init__(self, line: int = -1, column: int = -1) -> None:
         super().__init__(line, column)
         self.can_be_true = self.can_be_true_default()
         self.can_be_false = self.can_be_false_default()
+        # Cached result of mypy.expandtype.is_expand_noop() (None if not computed yet)
+        self._expand_noop = None  # type: Optional[bool]
 
     def can_be_true_default(self) -> bool:
         return True
@@ -183,24 +186,19 @@ class TypeVarId:
 class TypeVarDef(mypy.nodes.Context):
     """Definition of a single type variable."""
 
-    name = ''  # Name (may be qualified)
-    fullname = ''  # Fully qualified name
-    id = None  # type: TypeVarId
-    values = None  # type: List[Type]  # Value restriction, empty list if no restriction
-    upper_bound = None  # type: Type
-    variance = INVARIANT  # type: int
+    __slots__ = ('name', 'fullname', 'id', 'values', 'upper_bound', 'variance')
 
     def __init__(self, name: str, fullname: str, id: Union[TypeVarId, int], values: List[Type],
                  upper_bound: Type, variance: int = INVARIANT, line: int = -1,
                  column: int = -1) -> None:
         super().__init__(line, column)
         assert values is not None, "No restrictions must be represented by empty list"
-        self.name = name
-        self.fullname = fullname
+        self.name = name  # Name (may be qualified)
+        self.fullname = fullname  # Fully qualified name
         if isinstance(id, int):
             id = TypeVarId(id)
         self.id = id
-        self.values = values
+        self.values = values  # Value restriction, empty list if no restriction
         self.upper_bound = upper_bound
         self.variance = variance
 
@@ -325,9 +323,8 @@ class CallableArgument(Type):
 
     Note that this is a synthetic type for helping parse ASTs, not a real type.
     """
-    typ = None          # type: Type
-    name = None         # type: Optional[str]
-    constructor = None  # type: Optional[str]
+
+    __slots__ = ('typ', 'name', 'constructor')
 
     def __init__(self, typ: Type, name: Optional[str], constructor: Optional[str],
                  line: int = -1, column: int = -1) -> None:
@@ -353,11 +350,11 @@ class TypeList(Type):
     types before they are processed into Callable types.
     """
 
-    items = None  # type: List[Type]
+    __slots__ = ('items',)
 
     def __init__(self, items: List[Type], line: int = -1, column: int = -1) -> None:
         super().__init__(line, column)
-        self.items = items
+        self.items = items  # type: List[Type]
 
     def accept(self, visitor: 'TypeVisitor[T]') -> T:
         assert isinstance(visitor, SyntheticTypeVisitor)
@@ -437,6 +434,8 @@ class AnyType(Type):
     def deserialize(cls, data: JsonDict) -> 'AnyType':
         assert data['.class'] == 'AnyType'
         source = data['source_any']
+        if source is None and data['missing_import_name'] is None:
+            return interned_any_type(data['type_of_any'])
         return AnyType(data['type_of_any'],
                        AnyType.deserialize(source) if source is not None else None,
                        data['missing_import_name'])
@@ -456,15 +455,17 @@ class UninhabitedType(Type):
         is_subtype(UninhabitedType, T) = True
     """
 
-    is_noreturn = False  # Does this come from a NoReturn?  Purely for error messages.
-    # It is important to track whether this is an actual NoReturn type, or just a result
-    # of ambiguous type inference, in the latter case we don't want to mark a branch as
-    # unreachable in binder.
-    ambiguous = False  # Is this a result of inference for a variable without constraints?
+    __slots__ = ('is_noreturn', 'ambiguous')
 
     def __init__(self, is_noreturn: bool = False, line: int = -1, column: int = -1) -> None:
         super().__init__(line, column)
+        # Does this come from a NoReturn?  Purely for error messages.
         self.is_noreturn = is_noreturn
+        # Is this a result of inference for a variable without constraints?
+        # It is important to track whether this is an actual NoReturn type, or just a result
+        # of ambiguous type inference, in the latter case we don't want to mark a branch as
+        # unreachable in binder.
+        self.ambiguous = False
 
     def can_be_true_default(self) -> bool:
         return False
@@ -520,7 +521,7 @@ class NoneTyp(Type):
     @classmethod
     def deserialize(cls, data: JsonDict) -> 'NoneTyp':
         assert data['.class'] == 'NoneTyp'
-        return NoneTyp()
+        return interned_none_type()
 
 
 class ErasedType(Type):
@@ -530,6 +531,8 @@ class ErasedType(Type):
     it is ignored during type inference.
     """
 
+    __slots__ = ()
+
     def accept(self, visitor: 'TypeVisitor[T]') -> T:
         return visitor.visit_erased_type(self)
 
@@ -540,11 +543,12 @@ class DeletedType(Type):
     These can be used as lvalues but not rvalues.
     """
 
-    source = ''  # type: Optional[str]  # May be None; name that generated this value
+    __slots__ = ('source',)
 
     def __init__(self, source: Optional[str] = None, line: int = -1, column: int = -1) -> None:
         super().__init__(line, column)
-        self.source = source
+        # May be None; name that generated this value
+        self.source = source  # type: Optional[str]
 
     def accept(self, visitor: 'TypeVisitor[T]') -> T:
         return visitor.visit_deleted_type(self)
@@ -645,19 +649,18 @@ class Instance(Type):
     @classmethod
     def deserialize(cls, data: Union[JsonDict, str]) -> 'Instance':
         if isinstance(data, str):
-            inst = Instance(NOT_READY, [])
-            inst.type_ref = data
-            return inst
+            return deserialized_instance(data, [])
         assert data['.class'] == 'Instance'
         args = []  # type: List[Type]
         if 'args' in data:
             args_list = data['args']
             assert isinstance(args_list, list)
             args = [deserialize_type(arg) for arg in args_list]
+        if 'final_value' not in data:
+            return deserialized_instance(data['type_ref'], args)
         inst = Instance(NOT_READY, args)
         inst.type_ref = data['type_ref']  # Will be fixed up by fixup.py later.
-        if 'final_value' in data:
-            inst.final_value = LiteralType.deserialize(data['final_value'])
+        inst.final_value = LiteralType.deserialize(data['final_value'])
         return inst
 
     def copy_modified(self, *,
@@ -1115,11 +1118,11 @@ class Overloaded(FunctionLike):
     implementation.
     """
 
-    _items = None  # type: List[CallableType]  # Must not be empty
+    __slots__ = ('_items',)
 
     def __init__(self, items: List[CallableType]) -> None:
         super().__init__(items[0].line, items[0].column)
-        self._items = items
+        self._items = items  # type: List[CallableType]  # Must not be empty
         self.fallback = items[0].fallback
 
     def items(self) -> List[CallableType]:
@@ -1180,15 +1183,13 @@ class TupleType(Type):
         implicit: if True, derived from a tuple expression (t,....) instead of Tuple[t, ...]
     """
 
-    items = None  # type: List[Type]
-    fallback = None  # type: Instance
-    implicit = False
+    __slots__ = ('items', 'fallback', 'implicit')
 
     def __init__(self, items: List[Type], fallback: Instance, line: int = -1,
                  column: int = -1, implicit: bool = False) -> None:
         super().__init__(line, column)
-        self.items = items
-        self.fallback = fallback
+        self.items = items  # type: List[Type]
+        self.fallback = fallback  # type: Instance
         self.implicit = implicit
         self.can_be_true = len(self.items) > 0
         self.can_be_false = len(self.items) == 0
@@ -1255,16 +1256,14 @@ class TypedDictType(Type):
     TODO: The fallback structure is perhaps overly complicated.
     """
 
-    items = None  # type: OrderedDict[str, Type]  # item_name -> item_type
-    required_keys = None  # type: Set[str]
-    fallback = None  # type: Instance
+    __slots__ = ('items', 'required_keys', 'fallback')
 
     def __init__(self, items: 'OrderedDict[str, Type]', required_keys: Set[str],
                  fallback: Instance, line: int = -1, column: int = -1) -> None:
         super().__init__(line, column)
-        self.items = items
-        self.required_keys = required_keys
-        self.fallback = fallback
+        self.items = items  # type: OrderedDict[str, Type]  # item_name -> item_type
+        self.required_keys = required_keys  # type: Set[str]
+        self.fallback = fallback  # type: Instance
         self.can_be_true = len(self.items) > 0
         self.can_be_false = len(self.items) == 0
 
@@ -1392,6 +1391,9 @@ class RawExpressionType(Type):
             ],
         )
     """
+
+    __slots__ = ('literal_value', 'base_type_name', 'note')
+
     def __init__(self,
                  literal_value: Optional[LiteralValue],
                  base_type_name: str,
@@ -1502,7 +1504,7 @@ class StarType(Type):
     This is not a real type but a syntactic AST construct.
     """
 
-    type = None  # type: Type
+    __slots__ = ('type',)
 
     def __init__(self, type: Type, line: int = -1, column: int = -1) -> None:
         super().__init__(line, column)
@@ -1643,16 +1645,14 @@ class PartialType(Type):
           x = 1  # Infer actual type int for x
     """
 
-    # None for the 'None' partial type; otherwise a generic class
-    type = None  # type: Optional[mypy.nodes.TypeInfo]
-    var = None  # type: mypy.nodes.Var
-    inner_types = None  # type: List[Type]
+    __slots__ = ('type', 'var', 'inner_types')
 
     def __init__(self,
                  type: 'Optional[mypy.nodes.TypeInfo]',
                  var: 'mypy.nodes.Var',
                  inner_types: List[Type]) -> None:
         super().__init__()
+        # None for the 'None' partial type; otherwise a generic class
         self.type = type
         self.var = var
         self.inner_types = inner_types
@@ -1669,6 +1669,8 @@ class EllipsisType(Type):
     A semantically analyzed type will never have ellipsis types.
     """
 
+    __slots__ = ()
+
     def accept(self, visitor: 'TypeVisitor[T]') -> T:
         assert isinstance(visitor, SyntheticTypeVisitor)
         return visitor.visit_ellipsis_type(self)
@@ -1705,9 +1707,7 @@ class TypeType(Type):
     assumption).
     """
 
-    # This can't be everything, but it can be a class reference,
-    # a generic class instance, a union, Any, a type variable...
-    item = None  # type: Type
+    __slots__ = ('item',)
 
     def __init__(self, item: Bogus[Union[Instance, AnyType, TypeVarType, TupleType, NoneTyp,
                                          CallableType]], *,
@@ -1716,7 +1716,9 @@ class TypeType(Type):
         type UnionType must be handled through make_normalized static method.
         """
         super().__init__(line, column)
-        self.item = item
+        # This can't be everything, but it can be a class reference,
+        # a generic class instance, a union, Any, a type variable...
+        self.item = item  # type: Type
 
     @staticmethod
     def make_normalized(item: Type, *, line: int = -1, column: int = -1) -> Type:
@@ -1762,13 +1764,14 @@ class ForwardRef(Type):
     So that ForwardRefs are temporary and will be completely replaced with the linked types
     or Any (to avoid cyclic references) before the type checking stage.
     """
-    _unbound = None  # type: UnboundType  # The original wrapped type
-    _resolved = None  # type: Optional[Type]  # The resolved forward reference (initially None)
+
+    __slots__ = ('_unbound', '_resolved')
 
     def __init__(self, unbound: UnboundType) -> None:
         super().__init__()
-        self._unbound = unbound
-        self._resolved = None
+        self._unbound = unbound  # The original wrapped type
+        # The resolved forward reference (initially None)
+        self._resolved = None  # type: Optional[Type]
 
     @property
     def unbound(self) -> UnboundType:
@@ -2188,6 +2191,116 @@ def remove_optional(typ: Type) -> Type:
         return typ
 
 
+# Shared type objects returned by the interning constructors below. Interning is opt-in:
+# it is only safe where the caller never mutates the resulting type (including line and
+# column information, which is always -1 for interned types). Since interned types are
+# shared, identical types produced through these functions are also identical objects.
+# The tables are cleared at the start of each build and each fine-grained update, since
+# they keep TypeInfos alive.
+_interned_anys = {}  # type: Final[Dict[int, AnyType]]
+_interned_none = []  # type: Final[List[NoneTyp]]
+# Interned instances keyed by TypeInfo and the ids of the (interned) type arguments.
+InternedInstanceKey = Tuple[mypy.nodes.TypeInfo, Tuple[int, ...]]
+_interned_instances = {}  # type: Final[Dict[InternedInstanceKey, Instance]]
+# Ids of all interned types (these objects are kept alive by the tables above).
+_interned_ids = set()  # type: Final[Set[int]]
+
+
+def interned_any_type(type_of_any: int) -> AnyType:
+    """Return a shared Any type of the given kind with no source Any or import name."""
+    typ = _interned_anys.get(type_of_any)
+    if typ is None:
+        typ = AnyType(type_of_any)
+        _interned_anys[type_of_any] = typ
+        _interned_ids.add(id(typ))
+    return typ
+
+
+def interned_none_type() -> NoneTyp:
+    """Return a shared None type."""
+    if not _interned_none:
+        typ = NoneTyp()
+        _interned_none.append(typ)
+        _interned_ids.add(id(typ))
+    return _interned_none[0]
+
+
+def interned_instance(info: mypy.nodes.TypeInfo, args: Optional[List[Type]] = None) -> Instance:
+    """Return a shared instance type C[T1, ..., Tn] for a fully ground type.
+
+    The type arguments must themselves be interned types, otherwise a fresh
+    (not shared) instance is returned.
+    """
+    if args is None:
+        args = []
+    if not all(id(arg) in _interned_ids for arg in args):
+        return Instance(info, args)
+    key = (info, tuple(id(arg) for arg in args))
+    inst = _interned_instances.get(key)
+    if inst is None:
+        inst = Instance(info, args)
+        _interned_instances[key] = inst
+        _interned_ids.add(id(inst))
+    return inst
+
+
+def is_interned(t: Type) -> bool:
+    """Is this a shared type object returned by one of the interning constructors?"""
+    return id(t) in _interned_ids
+
+
+# Instances shared while deserializing (see sharing_deserialized_instances), keyed by
+# type_ref and the ids of the (shared) type arguments. None when instances aren't shared.
+DeserializedInstanceKey = Tuple[str, Tuple[int, ...]]
+_deserialized_instances = None  # type: Optional[Dict[DeserializedInstanceKey, Instance]]
+# Ids of the shared deserialized instances
+_deserialized_ids = set()  # type: Set[int]
+
+
+@contextmanager
+def sharing_deserialized_instances() -> Iterator[None]:
+    """Share identical Instance objects deserialized within the block.
+
+    Only instances without a final value whose type arguments are shared
+    instances are shared. This is safe since deserialized instances are only
+    modified by fixup, which gives instances with the same type_ref the same
+    TypeInfo.
+    """
+    global _deserialized_instances, _deserialized_ids
+    saved = _deserialized_instances, _deserialized_ids
+    _deserialized_instances = {}
+    _deserialized_ids = set()
+    try:
+        yield
+    finally:
+        _deserialized_instances, _deserialized_ids = saved
+
+
+def deserialized_instance(type_ref: str, args: List[Type]) -> Instance:
+    """Return an instance that will be fixed up later, shared if possible."""
+    memo = _deserialized_instances
+    if memo is None or not all(id(arg) in _deserialized_ids for arg in args):
+        unshared = Instance(NOT_READY, args)
+        unshared.type_ref = type_ref  # Will be fixed up by fixup.py later.
+        return unshared
+    key = (type_ref, tuple(id(arg) for arg in args))
+    inst = memo.get(key)
+    if inst is None:
+        inst = Instance(NOT_READY, args)
+        inst.type_ref = type_ref
+        memo[key] = inst
+        _deserialized_ids.add(id(inst))
+    return inst
+
+
+def reset_interned_types() -> None:
+    """Forget all interned types (they are still valid, but are no longer shared)."""
+    _interned_anys.clear()
+    _interned_none.clear()
+    _interned_instances.clear()
+    _interned_ids.clear()
+
+
 names = globals().copy()  # type: Final
 names.pop('NOT_READY', None)
 deserialize_map = {
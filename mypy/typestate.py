@@ -10,7 +10,7 @@ if MYPY:
     from typing import ClassVar
     from typing_extensions import Final
 from mypy.nodes import TypeInfo
-from mypy.types import Instance
+from mypy.types import Instance, reset_interned_types
 from mypy.server.trigger import make_trigger
 
 # Represents that the 'left' instance is a subtype of the 'right' instance
@@ -230,3 +230,4 @@ def reset_global_state() -> None:
     """
     TypeState.reset_all_subtype_caches()
     TypeState.reset_protocol_deps()
+    reset_interned_types()